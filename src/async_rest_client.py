@@ -0,0 +1,348 @@
+'''
+An asyncio counterpart of the Rest Client, allowing many requests to MatchaDB to be in flight at once
+from a single thread.
+
+sammatime22, 2026
+'''
+import asyncio
+from request_builder import RequestBuilder
+from rest_client import RestClient
+
+
+class AsyncResponse():
+    '''
+    The response to a request made by the Async Rest Client, mirroring the parts of a requests
+    response used by Whisk.
+    '''
+
+    # The status code of the response (HTTP 200, 404, etc.)
+    status_code = 0
+
+    # The content of the response
+    content = b""
+
+
+    def __init__(self, status_code, headers, content):
+        '''
+        The constructor for the AsyncResponse object.
+
+        Parameters
+        ----------
+        status_code : int
+            The status code of the response
+        headers : dict
+            The headers of the response, keyed by their lowercased names
+        content : bytes
+            The body of the response
+        '''
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+
+class AsyncRestClient():
+    '''
+    An asyncio based REST Client for interfacing with Matcha DB. Its requests are awaitable and return
+    the same (retrieval_status, response) pair as the Rest Client. Connections are kept alive and
+    reused, with a limit on how many may be open at once.
+    '''
+    # Default networking values, shared with the Rest Client.
+    DEFAULT_PROTOCOL = RestClient.DEFAULT_PROTOCOL
+    DEFAULT_HOST = RestClient.DEFAULT_HOST
+    DEFAULT_PORT = RestClient.DEFAULT_PORT
+    DEFAULT_CONNECTION_LIMIT = 100   # Default is at most 100 open connections
+
+    # Responses with these status codes never carry a body.
+    BODILESS_STATUS_CODES = (204, 304)
+
+    # The methods which may safely be sent twice, should the first attempt have reached MatchaDB.
+    IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+
+    # Class networking variables.
+    protocol = DEFAULT_PROTOCOL
+    host = DEFAULT_HOST
+    port = DEFAULT_PORT
+    connection_limit = DEFAULT_CONNECTION_LIMIT
+
+    # The builder turning the portions of a query into a request body.
+    request_builder = RequestBuilder()
+
+
+    def __init__(self, protocol = None, host = None, port = None, connection_limit = None):
+        '''
+        The constructor for the AsyncRestClient.
+
+        Parameters
+        ----------
+        protocol : string
+            The protocol used to communicate to the Matcha DB instance
+        host : string
+            The hostname/IP used of the Matcha DB
+        port : string
+            The port used of the Matcha DB
+        connection_limit : int
+            The most connections that may be open to the Matcha DB at once
+        '''
+        if protocol is not None:
+            self.protocol = protocol
+        if host is not None:
+            self.host = host
+        if port is not None:
+            self.port = port
+        if connection_limit is not None:
+            self.connection_limit = connection_limit
+
+        # Idle connections ready for reuse, and the semaphore bounding the open ones (made on first use,
+        # so that it belongs to the running event loop).
+        self.idle_connections = []
+        self.connection_slots = None
+
+
+    def get_protocol_host_port(self):
+        '''
+        Returns the protocol, host, and port used by Whisk.
+
+        Return
+        ----------
+        protocol : string
+            The protocol in use by the Async Rest Client
+        host : string
+            The host in use by the Async Rest Client
+        port : string
+            The port in use by the Async Rest Client
+        '''
+        return self.protocol, self.host, self.port
+
+
+    async def get_request(self, from_portion, select_portion):
+        '''
+        Runs a get request against the DB.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : AsyncResponse OR string
+            The response object or a statement containing the error
+        '''
+        return await self.send_request("GET", from_portion, select_portion)
+
+
+    async def post_request(self, from_portion, select_portion, insert_portion):
+        '''
+        Runs a post request against the DB.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+        insert_portion : JSON Object
+            The Insert Portion for the query to be made on MatchaDB
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : AsyncResponse OR string
+            The response object or a statement containing the error
+        '''
+        return await self.send_request("POST", from_portion, select_portion, insert_portion = insert_portion)
+
+
+    async def update_request(self, from_portion, select_portion, update_portion):
+        '''
+        Runs an update (PUT) request against the DB.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+        update_portion : JSON Object
+            The Update Portion for the query to be made on MatchaDB
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : AsyncResponse OR string
+            The response object or a statement containing the error
+        '''
+        return await self.send_request("PUT", from_portion, select_portion, update_portion = update_portion)
+
+
+    async def delete_request(self, from_portion, select_portion):
+        '''
+        Runs a delete request against the DB.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : AsyncResponse OR string
+            The response object or a statement containing the error
+        '''
+        return await self.send_request("DELETE", from_portion, select_portion)
+
+
+    async def send_request(self, method, from_portion, select_portion, insert_portion = None, update_portion = None):
+        '''
+        Sends a request over a pooled connection, opening a new one if none are idle. An idempotent
+        request that fails on a reused connection (which the server may have since closed) is tried once
+        more on a fresh connection. A POST is not, as it may have been run before the connection failed.
+
+        Parameters
+        ----------
+        method : string
+            The HTTP method of the request
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+        insert_portion : JSON Object
+            The Insert Portion for the query to be made on MatchaDB, for POST requests
+        update_portion : JSON Object
+            The Update Portion for the query to be made on MatchaDB, for PUT requests
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : AsyncResponse OR string
+            The response object or a statement containing the error
+        '''
+        try:
+            body = self.request_builder.build_body(from_portion, select_portion, insert_portion, update_portion)
+            if self.connection_slots is None:
+                self.connection_slots = asyncio.Semaphore(self.connection_limit)
+
+            async with self.connection_slots:
+                reused = len(self.idle_connections) > 0
+                try:
+                    return True, await self.exchange(method, body)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    if not reused or method not in self.IDEMPOTENT_METHODS:
+                        raise
+                    return True, await self.exchange(method, body, reuse = False)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError):
+            return False, "A connection error has occurred."
+        except Exception as e:
+            return False, "An unidentified error has occurred: " + str(e) + "."
+
+
+    async def exchange(self, method, body, reuse = True):
+        '''
+        Writes a single request and reads its response, returning the connection to the idle pool
+        if the server allows it to be kept alive.
+
+        Parameters
+        ----------
+        method : string
+            The HTTP method of the request
+        body : bytes
+            The body of the request
+        reuse : boolean
+            Whether an idle connection may be used, rather than always opening a new one
+
+        Return
+        ----------
+        response : AsyncResponse
+            The response to the request
+        '''
+        if reuse and self.idle_connections:
+            reader, writer = self.idle_connections.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, int(self.port),\
+                                                           ssl = self.protocol == "https://")
+        try:
+            header = method + " / HTTP/1.1\r\nHost: " + self.host + ":" + str(self.port) + "\r\n" +\
+                     "Content-Type: application/json\r\nContent-Length: " + str(len(body)) + "\r\n" +\
+                     "Connection: keep-alive\r\n\r\n"
+            writer.write(header.encode("latin-1") + body)
+            await writer.drain()
+
+            response, keep_alive = await self.read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive:
+            self.idle_connections.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+
+    async def read_response(self, reader):
+        '''
+        Reads an HTTP/1.1 response from a connection.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The reading end of the connection
+
+        Return
+        ----------
+        response : AsyncResponse
+            The response read from the connection
+        keep_alive : boolean
+            Whether the connection may be reused for another request
+        '''
+        status_line = await reader.readuntil(b"\r\n")
+        version, status_code = status_line.split(b" ", 2)[:2]
+
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, value = line.decode("latin-1").split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close" and version == b"HTTP/1.1"
+        if int(status_code) in self.BODILESS_STATUS_CODES:
+            content = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            content = b"".join(chunks)
+        elif "content-length" in headers:
+            content = await reader.readexactly(int(headers["content-length"]))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        return AsyncResponse(int(status_code), headers, content), keep_alive
+
+
+    async def close(self):
+        '''
+        Closes every idle connection held by the client.
+        '''
+        while self.idle_connections:
+            reader, writer = self.idle_connections.pop()
+            writer.close()
@@ -0,0 +1,76 @@
+'''
+Dispatches batches of requests against MatchaDB in parallel, while keeping their results in order.
+
+sammatime22, 2026
+'''
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BatchExecutor:
+    '''
+    A worker pool used to run many tasks (typically Rest Client requests) at once, with a limit on how
+    many may be in flight. Results are handed back in the same order as the tasks were provided.
+    '''
+
+
+    # Default number of tasks that may run at once.
+    DEFAULT_CONCURRENCY = 1
+
+
+    # How many tasks, per worker, may be queued ahead of the result being waited on.
+    queue_depth_per_worker = 2
+
+
+    concurrency = DEFAULT_CONCURRENCY
+
+
+    def __init__(self, concurrency = None):
+        '''
+        An initializer for the batch executor.
+
+        Parameters
+        ----------
+        concurrency : int
+            The maximum number of tasks to run at once
+        '''
+        if concurrency is not None:
+            if concurrency < 1:
+                raise ValueError("The concurrency must be at least 1.")
+            self.concurrency = concurrency
+
+
+    def execute(self, task, items):
+        '''
+        Runs the task on each item, yielding the results in the order of the items. Items are pulled
+        lazily, so only a bounded window of them is held in memory at any point.
+
+        Parameters
+        ----------
+        task : callable
+            The task to run, taking a single item
+        items : iterable
+            The items to run the task on
+
+        Return
+        ----------
+        results : generator of (item, result)
+            Each item alongside the result of running the task on it, in the order of the items
+        '''
+        # Nothing to gain from a pool with a single worker, so run in the calling thread.
+        if self.concurrency == 1:
+            for item in items:
+                yield item, task(item)
+            return
+
+        window = self.concurrency * self.queue_depth_per_worker
+        with ThreadPoolExecutor(max_workers = self.concurrency) as pool:
+            pending = deque()
+            for item in items:
+                pending.append((item, pool.submit(task, item)))
+                if len(pending) >= window:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
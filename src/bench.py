@@ -0,0 +1,266 @@
+'''
+Generates load against MatchaDB through the Rest Client, measuring throughput and latency.
+
+sammatime22, 2026
+'''
+import threading
+import time
+from command_registry import REQUEST_COMMANDS
+from script_runner import ScriptRunner
+
+
+class BenchReport:
+    '''
+    The outcome of a benchmark run, holding the latencies seen for each command.
+    '''
+
+
+    # The percentiles reported for each command.
+    PERCENTILES = (50, 90, 99)
+
+
+    def __init__(self, duration):
+        '''
+        An initializer for the bench report.
+
+        Parameters
+        ----------
+        duration : float
+            The number of seconds the benchmark ran for
+        '''
+        self.duration = duration
+        self.latencies = {}
+        self.errors = {}
+
+
+    def record(self, command, latency, succeeded):
+        '''
+        Records the outcome of a single operation.
+
+        Parameters
+        ----------
+        command : string
+            The command that was run
+        latency : float
+            The number of seconds the operation took
+        succeeded : boolean
+            Whether the operation got its expected status code back
+        '''
+        self.latencies.setdefault(command, []).append(latency)
+        self.errors.setdefault(command, 0)
+        if not succeeded:
+            self.errors[command] += 1
+
+
+    def percentile(self, sorted_latencies, percent):
+        '''
+        Finds a percentile of some latencies, using the nearest-rank method.
+
+        Parameters
+        ----------
+        sorted_latencies : list of float
+            The latencies, sorted in ascending order
+        percent : int
+            The percentile to find
+
+        Return
+        ----------
+        latency : float
+            The latency at that percentile
+        '''
+        rank = max(1, -(-percent * len(sorted_latencies) // 100))
+        return sorted_latencies[rank - 1]
+
+
+    def summarize(self):
+        '''
+        Summarizes the benchmark as lines of text, one for the overall throughput and one per command.
+
+        Return
+        ----------
+        lines : list of string
+            The lines of the summary
+        '''
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        total_errors = sum(self.errors.values())
+        lines = ["{} operations in {:.2f}s ({:.1f} ops/s), {} errors".format(\
+            total, self.duration, total / self.duration if self.duration > 0 else 0.0, total_errors)]
+
+        for command in sorted(self.latencies):
+            sorted_latencies = sorted(self.latencies[command])
+            percentiles = ["p{} {:.2f}ms".format(percent, self.percentile(sorted_latencies, percent) * 1000)\
+                           for percent in self.PERCENTILES]
+            lines.append("{}: {} ops ({:.1f} ops/s), {} errors, {}, max {:.2f}ms".format(\
+                command, len(sorted_latencies), len(sorted_latencies) / self.duration if self.duration > 0 else 0.0,\
+                self.errors[command], ", ".join(percentiles), sorted_latencies[-1] * 1000))
+        return lines
+
+
+class Bench:
+    '''
+    A load generator, driving a weighted mix of commands through the Rest Client for a fixed duration,
+    either as fast as a number of workers allows or at a target rate.
+    '''
+
+
+    # Default benchmark settings.
+    DEFAULT_MIX = {"GET": 1}
+    DEFAULT_DURATION = 10.0
+    DEFAULT_CONCURRENCY = 1
+    DEFAULT_TABLE = "Bench"
+
+
+    mix = DEFAULT_MIX
+    duration = DEFAULT_DURATION
+    concurrency = DEFAULT_CONCURRENCY
+    rate = None
+    table = DEFAULT_TABLE
+
+
+    def __init__(self, mix = None, duration = None, concurrency = None, rate = None, table = None):
+        '''
+        An initializer for the benchmark.
+
+        Parameters
+        ----------
+        mix : dict
+            The relative weight of each command (GET, POST, UPDATE, DELETE), as whole numbers
+        duration : float
+            The number of seconds to run for
+        concurrency : int
+            The number of workers issuing requests at once
+        rate : float
+            The target number of operations per second across every worker (None for as fast as possible)
+        table : string
+            The table the operations run against
+        '''
+        if mix is not None:
+            self.mix = mix
+        if duration is not None:
+            self.duration = duration
+        if concurrency is not None:
+            if concurrency < 1:
+                raise ValueError("The concurrency must be at least 1.")
+            self.concurrency = concurrency
+        if rate is not None:
+            if rate <= 0:
+                raise ValueError("The rate must be above 0.")
+            self.rate = rate
+        if table is not None:
+            self.table = table
+
+        # The commands in the order they are issued, repeating once the end is reached, so that the mix
+        # is followed exactly.
+        self.schedule = []
+        for command in sorted(self.mix):
+            if REQUEST_COMMANDS.lookup(command) is None:
+                raise ValueError("The mix may only include " + REQUEST_COMMANDS.listing() + ", not " + str(command) + ".")
+            self.schedule.extend([command.upper()] * int(self.mix[command]))
+        if len(self.schedule) == 0:
+            raise ValueError("The mix must include at least one command.")
+
+
+    @staticmethod
+    def parse_mix(mix_text):
+        '''
+        Parses a mix given on the CLI, of the form GET:70,POST:10,UPDATE:10,DELETE:10.
+
+        Parameters
+        ----------
+        mix_text : string
+            The mix as text
+
+        Return
+        ----------
+        mix : dict
+            The relative weight of each command
+        '''
+        mix = {}
+        for entry in mix_text.split(","):
+            command, separator, weight = entry.partition(":")
+            if not separator or not weight.strip().isdigit():
+                raise ValueError("\"" + entry.strip() + "\" is not of the form COMMAND:weight")
+            mix[command.strip().upper()] = int(weight)
+        return mix
+
+
+    def make_operation(self, command, sequence):
+        '''
+        Makes the operation issued as the given step of the benchmark.
+
+        Parameters
+        ----------
+        command : string
+            The command to issue
+        sequence : int
+            The position of the operation in the benchmark, used to vary the records touched
+
+        Return
+        ----------
+        operation : dict
+            The operation, in the same form a script would hold it
+        '''
+        key = str(sequence % 1000)
+        operation = {"Command": command, "From": [self.table], "Select": [["id", "is", key]]}
+        if command == "POST":
+            operation["Select"] = []
+            operation["Insert"] = {"id": key, "value": str(sequence)}
+        elif command == "UPDATE":
+            operation["Update"] = [["value", "to", str(sequence)]]
+        return operation
+
+
+    def run(self, rest_client):
+        '''
+        Runs the benchmark.
+
+        Parameters
+        ----------
+        rest_client : RestClient
+            The rest client to drive the load through
+
+        Return
+        ----------
+        report : BenchReport
+            The throughput and latencies seen
+        '''
+        script_runner = ScriptRunner()
+        lock = threading.Lock()
+        sequence = [0]
+        start = time.perf_counter()
+        deadline = start + self.duration
+        report = BenchReport(self.duration)
+
+        def worker():
+            while True:
+                with lock:
+                    step = sequence[0]
+                    sequence[0] += 1
+
+                # Hold the operation back until its slot, when pacing to a target rate.
+                if self.rate is not None:
+                    scheduled = start + step / float(self.rate)
+                    if scheduled >= deadline:
+                        return
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                if time.perf_counter() >= deadline:
+                    return
+
+                command = self.schedule[step % len(self.schedule)]
+                began = time.perf_counter()
+                retrieved, response = script_runner.run_operation(rest_client, self.make_operation(command, step))
+                latency = time.perf_counter() - began
+                succeeded = retrieved and response.status_code == REQUEST_COMMANDS.lookup(command).expected_status_code
+                with lock:
+                    report.record(command, latency, succeeded)
+
+        workers = [threading.Thread(target = worker) for index in range(self.concurrency)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        report.duration = time.perf_counter() - start
+        return report
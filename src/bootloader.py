@@ -4,16 +4,93 @@ Kicks off the engine for Whisk.
 sammatime22, 2022
 '''
 
+import os
+import sys
+
+# The heavier modules (requests, readline, and those built on them) are imported only by the mode of
+# Whisk that needs them, keeping startup quick.
+from command_registry import REQUEST_COMMANDS
 from display import Display
-from input_machine import InputMachine
-from rest_client import RestClient
-from engine import Engine
-from threading import Thread
 
 # General String Constants 
+VERSION = "1.0.0"
 WELCOME = "Welcome to Whisk, the MatchaDB Tester!\nSammaTime22, 2021-2022"
 INSUFFICIENT_ARGUMENTS = "Not enough arguments were provided to continue."
 
+# The prefix marking a named option, such as --script ops.jsonl
+OPTION_PREFIX = "--"
+
+# The file the interactive history is kept in, unless another is named with --history
+DEFAULT_HISTORY_PATH = "~/.whisk_history"
+
+# The modes which run without prompting, so their output may be buffered
+BATCH_MODES = ("script", "bulk-insert", "bench")
+
+# The commands which may be run once, straight from the command line (whisk.py get --from users)
+ONE_SHOT_COMMANDS = tuple(REQUEST_COMMANDS.names)
+
+# The named options which take no value, such as --mock
+FLAG_OPTIONS = ("mock", "stream", "metrics", "version", "buffered", "no-history", "compact-select", "distinct")
+
+
+def split_arguments(input_arguments):
+    '''
+    Separates the named options (given as --name value, or --name for flags) from the positional arguments.
+
+    Parameters:
+    ----------
+    input_arguments : The input arguments provided from the CLI
+
+    Return
+    ----------
+    positional_arguments : list
+        The positional arguments, in order, including the name of the program
+    options : dict
+        The named options, keyed by their name without the leading -- (flags hold True)
+    '''
+    positional_arguments = []
+    options = {}
+    index = 0
+    while index < len(input_arguments):
+        argument = input_arguments[index]
+        if argument.startswith(OPTION_PREFIX) and argument[len(OPTION_PREFIX):] in FLAG_OPTIONS:
+            options[argument[len(OPTION_PREFIX):]] = True
+            index += 1
+        elif argument.startswith(OPTION_PREFIX) and index + 1 < len(input_arguments):
+            options[argument[len(OPTION_PREFIX):]] = input_arguments[index + 1]
+            index += 2
+        else:
+            positional_arguments.append(argument)
+            index += 1
+    return positional_arguments, options
+
+
+def convert_option(options, name, convert):
+    '''
+    Converts the value of a named option, naming the option if the value cannot be converted.
+
+    Parameters:
+    ----------
+    options : dict
+        The named options, keyed by their name without the leading --
+    name : string
+        The name of the option
+    convert : type
+        The type to convert the value to (int or float)
+
+    Return
+    ----------
+    value : int OR float OR None
+        The converted value, or None if the option was not given
+    '''
+    if name not in options:
+        return None
+    try:
+        return convert(options[name])
+    except (TypeError, ValueError):
+        raise ValueError(OPTION_PREFIX + name + " must be " + ("a whole number" if convert is int else "a number") +\
+                         ", not \"" + str(options[name]) + "\"")
+
 
 def kickstart(input_arguments):
     '''
@@ -22,12 +99,46 @@ def kickstart(input_arguments):
     Parameters:
     ----------
     input_arguments : The input arguments provided from the CLI
+
+    Return
+    ----------
+    exit_status : int OR None
+        The exit status of a script run, or None when the interactive engine was started
     '''
-    # Start up the display
-    whisk_display = Display()
+    input_arguments, options = split_arguments(input_arguments)
 
-    # Start of app
-    whisk_display.print_general(WELCOME)
+    # Report the version alone, without starting anything up.
+    if options.get("version"):
+        print("Whisk " + VERSION)
+        return 0
+
+    # A command given ahead of the host runs once, without the interactive loop or the display.
+    one_shot_command = None
+    if len(input_arguments) > 1 and input_arguments[1].upper() in ONE_SHOT_COMMANDS:
+        one_shot_command = input_arguments[1].upper()
+        input_arguments = input_arguments[:1] + input_arguments[2:]
+
+    # Results may be written as machine-readable records, to standard output or a file.
+    result_writer = None
+    if "format" in options and (one_shot_command is not None or "script" in options):
+        from result_writer import ResultWriter
+        try:
+            result_writer = ResultWriter(options["format"], output_path = options.get("output"))
+        except (ValueError, IOError, OSError) as e:
+            sys.stderr.write("The results could not be written: " + str(e) + "\n")
+            return 2
+
+    # Start up the display, showing the timings of each request if they are being measured. Output
+    # is only buffered in the modes which never prompt, as a prompt must follow everything before it.
+    # When records are written, everything else is displayed on standard error, out of their way.
+    instrument = bool(options.get("metrics"))
+    buffered = bool(options.get("buffered")) and any(mode in options for mode in BATCH_MODES)
+    if one_shot_command is not None:
+        whisk_display = None
+    elif result_writer is not None:
+        whisk_display = Display(show_metrics = instrument, buffered = True, stream = sys.stderr)
+    else:
+        whisk_display = Display(show_metrics = instrument, buffered = buffered)
 
     # Setup for Rest Client
     host = None
@@ -45,14 +156,153 @@ def kickstart(input_arguments):
     if len(input_arguments) > 4:
         protocol = input_arguments[3]
 
+    # Any of them may also be named.
+    host = options.get("host", host)
+    port = options.get("port", port)
+    protocol = options.get("protocol", protocol)
+
+    # Read the settings given as options, and build what they set up, so that a bad value is reported
+    # before anything is started.
+    try:
+        # Requests may be run in parallel, in which case the connection pool should fit all of them.
+        concurrency = convert_option(options, "concurrency", int)
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("--concurrency must be at least 1")
+
+        # GET results may be cached, for a number of seconds (the default time to live, if not given).
+        cache_size = convert_option(options, "cache-size", int)
+        cache_ttl = convert_option(options, "cache-ttl", float)
+
+        # Requests which fail to connect, or get a transient status code, may be retried with backoff.
+        retry_policy = None
+        if "max-attempts" in options:
+            from retry_policy import RetryPolicy
+            retry_policy = RetryPolicy(convert_option(options, "max-attempts", int),\
+                                       convert_option(options, "backoff-base", float),\
+                                       convert_option(options, "backoff-cap", float))
+
+        # Requests give up on a MatchaDB which stops responding, after the given number of seconds.
+        connect_timeout = convert_option(options, "connect-timeout", float)
+        read_timeout = convert_option(options, "read-timeout", float)
+        deadline = convert_option(options, "deadline", float)
+
+        # Request bodies of at least the given number of bytes may be gzipped.
+        compress_threshold = convert_option(options, "compress-threshold", int)
+
+        # Reads may be spread across several replicas, with writes sent to the first (the primary).
+        endpoint_pool = None
+        if "endpoints" in options:
+            from endpoint_pool import EndpointPool
+            endpoint_pool = EndpointPool([EndpointPool.parse_endpoint(endpoint)\
+                                          for endpoint in options["endpoints"].split(",") if endpoint.strip()],\
+                                         options.get("balance"))
+
+        # Records of a file may be inserted into a table, in batches.
+        bulk_loader = None
+        if "bulk-insert" in options:
+            from bulk_loader import BulkLoader
+            bulk_loader = BulkLoader(convert_option(options, "batch-size", int), concurrency)
+
+        # A benchmark may be run for the given number of seconds.
+        bench = None
+        if "bench" in options:
+            from bench import Bench
+            bench = Bench(Bench.parse_mix(options["mix"]) if "mix" in options else None,\
+                          convert_option(options, "bench", float), concurrency, convert_option(options, "rate", float),\
+                          options.get("table"))
+
+        # GET results may be shown as a table a page at a time.
+        pager = None
+        if "page-size" in options:
+            from table_pager import TablePager
+            pager = TablePager(convert_option(options, "page-size", int), convert_option(options, "column-width", int),\
+                               convert_option(options, "row-limit", int))
+
+        # GET results may be trimmed on the client side, as they are read, before they are shown.
+        pipeline = None
+        if any(option in options for option in ("fields", "where", "sort", "distinct", "limit")):
+            from result_pipeline import ResultPipeline
+            from select_parser import SelectParser
+            fields = [field.strip() for field in options["fields"].split(",")] if "fields" in options else None
+            pipeline = ResultPipeline(fields, SelectParser().parse(options["where"]) if "where" in options else None,\
+                                      options.get("sort"), bool(options.get("distinct")),\
+                                      convert_option(options, "limit", int))
+
+        latency = convert_option(options, "mock-latency", float)
+    except ValueError as e:
+        sys.stderr.write("The options could not be used: " + str(e) + "\n")
+        return 2
+
+    # Stand in for MatchaDB locally, if asked to, so that Whisk can run without a network.
+    if options.get("mock"):
+        from mock_server import MockMatchaDB
+        latency = latency / 1000 if latency is not None else None
+        protocol, host, port = MockMatchaDB(latency = latency).start()
+        if whisk_display is not None:
+            whisk_display.print_general("Started a stand-in MatchaDB at " + protocol + host + ":" + port + "/")
+
     # Start up the Rest Client
-    rest_client = RestClient(protocol, host, port)
+    from rest_client import RestClient
+    rest_client = RestClient(protocol, host, port, concurrency, cache_size, cache_ttl, instrument, retry_policy,\
+                             connect_timeout, read_timeout, deadline, compress_threshold, endpoint_pool)
     protocol, host, port = rest_client.get_protocol_host_port()
 
-    # Start up the Input Machine
-    input_machine = InputMachine()
+    # Run a single command, reporting its result through the exit status.
+    if one_shot_command is not None:
+        from one_shot import OneShot
+        exit_status = OneShot().run(rest_client, one_shot_command, options, result_writer = result_writer)
+        if result_writer is not None:
+            result_writer.close()
+        rest_client.close()
+        return exit_status
+
+    # Run a script straight through the Rest Client, if one was provided.
+    if "script" in options:
+        from script_runner import ScriptRunner
+        failures = ScriptRunner().run_script(whisk_display, rest_client, options["script"], concurrency, result_writer)
+        if result_writer is not None:
+            result_writer.close()
+        whisk_display.flush()
+        rest_client.close()
+        return 1 if failures > 0 else 0
+
+    # Insert every record of a file into a table, in batches, if asked to.
+    if bulk_loader is not None:
+        if "from" not in options:
+            whisk_display.print_error("--from is required to name the table for --bulk-insert.")
+            whisk_display.flush()
+            rest_client.close()
+            return 2
+        failures = bulk_loader.load(whisk_display, rest_client, [options["from"]], options["bulk-insert"])
+        whisk_display.flush()
+        rest_client.close()
+        return 1 if failures > 0 else 0
+
+    # Run a benchmark for the given number of seconds, if asked to.
+    if bench is not None:
+        whisk_display.print_general("Benchmarking " + str(protocol) + str(host) + ":" + str(port) + "/")
+        for line in bench.run(rest_client).summarize():
+            whisk_display.print_general(line)
+        if rest_client.instrumentation is not None:
+            for line in rest_client.instrumentation.summarize():
+                whisk_display.print_general(line)
+        whisk_display.flush()
+        rest_client.close()
+        return 0
+
+    # Start of app
+    whisk_display.print_general(WELCOME)
+
+    # Start up the Input Machine, with the history of past sessions (unless turned off)
+    from engine import Engine
+    from input_machine import InputMachine
+    from threading import Thread
+    history_path = None
+    if not options.get("no-history"):
+        history_path = os.path.expanduser(options.get("history", DEFAULT_HISTORY_PATH))
+    input_machine = InputMachine(history_path = history_path)
 
-    # Begin the Engine
-    engine = Engine()
+    # Begin the Engine, showing GET results as a table a page at a time, or trimmed, if asked to.
+    engine = Engine(bool(options.get("stream")), pager, bool(options.get("compact-select")), pipeline)
     engine_thread = Thread(target = engine.run_engine, args = (whisk_display, rest_client, input_machine))
     engine_thread.start()
@@ -0,0 +1,160 @@
+'''
+Loads a file of records into a MatchaDB table, grouping the records into a few large POST requests.
+
+sammatime22, 2026
+'''
+import csv
+import json
+from batch_executor import BatchExecutor
+from command_registry import REQUEST_COMMANDS
+
+
+class BulkLoader:
+    '''
+    A loader used to insert every record of a JSONL or CSV file into one table. The file is read lazily
+    and only a bounded number of batches are held at once (those in flight, plus those queued behind
+    them), so memory stays flat whatever the size of the file.
+    '''
+
+
+    # Default number of records sent in each POST request.
+    DEFAULT_BATCH_SIZE = 100
+
+
+    # The status code MatchaDB responds with when an insert succeeds.
+    INSERTED = REQUEST_COMMANDS.lookup("POST").expected_status_code
+
+
+    batch_size = DEFAULT_BATCH_SIZE
+    concurrency = None
+
+
+    def __init__(self, batch_size = None, concurrency = None):
+        '''
+        An initializer for the bulk loader.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of records sent in each POST request
+        concurrency : int
+            The maximum number of POST requests to have in flight at once (defaults to one at a time)
+        '''
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError("The batch size must be at least 1.")
+            self.batch_size = batch_size
+        if concurrency is not None:
+            self.concurrency = concurrency
+
+
+    def iter_records(self, data_path):
+        '''
+        Lazily reads the records from a file. A file ending in .csv is read as CSV with a header row,
+        giving one record per row; any other file is read as JSONL, giving one record per line.
+
+        Parameters
+        ----------
+        data_path : string
+            The path to the file of records
+
+        Return
+        ----------
+        records : generator of dict
+            The records of the file, in order
+        '''
+        with open(data_path, newline = "") as data_file:
+            if data_path.lower().endswith(".csv"):
+                for record in csv.DictReader(data_file):
+                    yield record
+                return
+
+            for line_number, line in enumerate(data_file, 1):
+                line = line.strip()
+                if line == "":
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError("Line " + str(line_number) + " could not be read: " + str(e))
+                if not isinstance(record, dict):
+                    raise ValueError("Line " + str(line_number) + " could not be read: a record must be a JSON object")
+                yield record
+
+
+    def iter_batches(self, records):
+        '''
+        Groups records into batches of the batch size (the last batch may be smaller).
+
+        Parameters
+        ----------
+        records : iterable of dict
+            The records to group
+
+        Return
+        ----------
+        batches : generator of (int, list)
+            The number of the first record in each batch (counting from 1), and the records of the batch
+        '''
+        batch = []
+        first_record = 1
+        for record in records:
+            batch.append(record)
+            if len(batch) == self.batch_size:
+                yield first_record, batch
+                first_record += len(batch)
+                batch = []
+        if batch:
+            yield first_record, batch
+
+
+    def load(self, whisk_display, rest_client, from_portion, data_path):
+        '''
+        Inserts every record of a file into a table, printing any batch that fails and then a summary.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client used to make the POST requests
+        from_portion : list
+            The From portion naming the table to insert into
+        data_path : string
+            The path to the file of records
+
+        Return
+        ----------
+        failures : int
+            The number of batches (or, if the file could not be read, the reads) that did not succeed
+        '''
+        def insert_batch(batch):
+            try:
+                return rest_client.post_request(from_portion, [], batch[1])
+            except Exception as e:
+                return False, "An unidentified error has occurred: " + str(e) + "."
+
+        inserted = 0
+        batches = 0
+        failures = 0
+        try:
+            executor = BatchExecutor(self.concurrency)
+            for batch, result in executor.execute(insert_batch, self.iter_batches(self.iter_records(data_path))):
+                first_record, records = batch
+                retrieved, response = result
+                batches += 1
+                prefix = "Records " + str(first_record) + "-" + str(first_record + len(records) - 1) + " "
+                if retrieved and response.status_code == self.INSERTED:
+                    inserted += len(records)
+                elif retrieved:
+                    whisk_display.print_error(prefix + str(response.status_code) + " : " + str(response.content))
+                    failures += 1
+                else:
+                    whisk_display.print_error(prefix + response)
+                    failures += 1
+        except (IOError, OSError, ValueError) as e:
+            whisk_display.print_error("The records could not be read: " + str(e) + ".")
+            failures += 1
+
+        whisk_display.print_general(str(inserted) + " records inserted in " + str(batches) + " requests")
+        return failures
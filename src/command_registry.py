@@ -0,0 +1,166 @@
+'''
+Holds the commands the engine understands, so that the engine looks each up rather than checking for it
+in turn, and so that new commands can be added without copying the code of the others. The commands which
+make a request of MatchaDB are registered once, for the engine, scripts, one-shot commands, and benchmarks.
+
+sammatime22, 2026
+'''
+
+
+class RegisteredCommand:
+    '''
+    A command known to the engine: its handler, the help shown for it, and, for commands which make a
+    request of MatchaDB, the Rest Client method making it, the portions gathered for it (beyond From and
+    Select), and the status code MatchaDB responds with on success.
+    '''
+
+
+    def __init__(self, name, handler, help_lines, uses_rest_client = True, ends_session = False,\
+                 request_method = None, portions = None, expected_status_code = None):
+        '''
+        An initializer for the registered command.
+
+        Parameters
+        ----------
+        name : string
+            The name the command is typed as (in any casing)
+        handler : string OR callable
+            The name of the engine method running the command, or a function to run it with
+        help_lines : list of string
+            The lines shown when help is asked for on the command
+        uses_rest_client : boolean
+            Whether the handler is given the Rest Client, as well as the display and input machine
+        ends_session : boolean
+            Whether the engine stops once the command has been run
+        request_method : string
+            The name of the Rest Client method making the request, for commands which make one
+        portions : list of tuple
+            The name of each portion sent beyond From and Select, with the value it takes when left out of
+            an operation (the engine gathers each with its gather_<portion> method)
+        expected_status_code : int
+            The status code MatchaDB responds with when the request succeeds
+        '''
+        self.name = name.upper()
+        self.handler = handler
+        self.help_lines = help_lines
+        self.uses_rest_client = uses_rest_client
+        self.ends_session = ends_session
+        self.request_method = request_method
+        self.portions = [] if portions is None else portions
+        self.expected_status_code = expected_status_code
+
+
+    def with_handler(self, handler, help_lines):
+        '''
+        Copies the command, to be run by another handler and shown with other help.
+
+        Parameters
+        ----------
+        handler : string OR callable
+            The name of the engine method running the command, or a function to run it with
+        help_lines : list of string
+            The lines shown when help is asked for on the command
+
+        Return
+        ----------
+        command : RegisteredCommand
+            The copy of the command
+        '''
+        return RegisteredCommand(self.name, handler, help_lines, self.uses_rest_client, self.ends_session,\
+                                 self.request_method, self.portions, self.expected_status_code)
+
+
+    def send(self, rest_client, from_portion, select_portion, operation):
+        '''
+        Makes the request of the command through the Rest Client.
+
+        Parameters
+        ----------
+        rest_client : RestClient
+            The rest client used to make the request
+        from_portion : list
+            The From portion of the request
+        select_portion : list
+            The Select portion of the request
+        operation : dict
+            The operation, holding any further portions of the request (such as Insert or Update)
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : response object OR string
+            The response object or a statement containing the error
+        '''
+        portions = [operation.get(portion, default) for portion, default in self.portions]
+        return getattr(rest_client, self.request_method)(from_portion, select_portion, *portions)
+
+
+class CommandRegistry:
+    '''
+    A registry of commands, keyed by their name in upper case, in the order they were registered (the
+    order in which they are listed to the user).
+    '''
+
+
+    def __init__(self):
+        '''
+        An initializer for the command registry.
+        '''
+        self.commands = {}
+        self.names = []
+
+
+    def register(self, command):
+        '''
+        Adds a command to the registry, replacing any command of the same name in place.
+
+        Parameters
+        ----------
+        command : RegisteredCommand
+            The command to add
+        '''
+        if command.name not in self.commands:
+            self.names.append(command.name)
+        self.commands[command.name] = command
+
+
+    def lookup(self, name):
+        '''
+        Finds a command by name, in any casing.
+
+        Parameters
+        ----------
+        name : string
+            The name of the command
+
+        Return
+        ----------
+        command : RegisteredCommand OR None
+            The command, or None if no command goes by that name
+        '''
+        return self.commands.get(name.upper())
+
+
+    def listing(self):
+        '''
+        Lists the names of the commands, as they are shown to the user.
+
+        Return
+        ----------
+        listing : string
+            The names of the commands, separated by commas
+        '''
+        return ", ".join(self.names)
+
+
+# The commands which make a request of MatchaDB, looked up wherever a command is sent or its response
+# checked, so that each agrees on the request made and the status code it succeeds with.
+REQUEST_COMMANDS = CommandRegistry()
+REQUEST_COMMANDS.register(RegisteredCommand("GET", None, [], request_method = "get_request", expected_status_code = 200))
+REQUEST_COMMANDS.register(RegisteredCommand("POST", None, [], request_method = "post_request",\
+                                            portions = [("Insert", {})], expected_status_code = 201))
+REQUEST_COMMANDS.register(RegisteredCommand("UPDATE", None, [], request_method = "update_request",\
+                                            portions = [("Update", [])], expected_status_code = 200))
+REQUEST_COMMANDS.register(RegisteredCommand("DELETE", None, [], request_method = "delete_request",\
+                                            expected_status_code = 204))
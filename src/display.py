@@ -3,7 +3,10 @@ Helps to facilitate better console output for the Whisk application.
 
 sammatime22, 2021-2022
 '''
+import json
+import sys
 from enum import Enum
+from output_sink import BufferedSink
 
 
 class ColorEnum(Enum):
@@ -39,7 +42,18 @@ class Display:
     general = BLUE
 
 
-    def __init__(self, success_color_choice = None, error_color_choice = None, general_color_choice = None):
+    # Whether request metrics are printed alongside responses
+    show_metrics = False
+
+
+    # The buffered sink written to in buffered mode (content is printed line by line otherwise), and
+    # the text written either side of the content for each color.
+    sink = None
+    affixes = None
+
+
+    def __init__(self, success_color_choice = None, error_color_choice = None, general_color_choice = None,\
+                 show_metrics = None, buffered = None, stream = None):
         '''
         An initializer for the display.
 
@@ -51,7 +65,19 @@ class Display:
             An integer defining the color choice for error messages
         general_color_choice : int
             An integer defining the color choice for general messages
+        show_metrics : boolean
+            Whether request metrics are printed alongside responses
+        buffered : boolean
+            Whether content is written through a buffered sink, for printing many results quickly. Colors
+            are left out in buffered mode when the output is not a terminal.
+        stream : file
+            The text stream written to in buffered mode (defaults to standard output)
         '''
+        if show_metrics is not None:
+            self.show_metrics = show_metrics
+        if buffered:
+            self.sink = BufferedSink(sys.stdout if stream is None else stream)
+            self.precompute_affixes()
         if success_color_choice is not None:
             self.success = self.color_choices[success_color_choice]
             self.print_success("Success Color Initialized...")
@@ -64,6 +90,43 @@ class Display:
         self.print_success("Display Initialized...")
 
 
+    def precompute_affixes(self):
+        '''
+        Works out the text written either side of the content for each color, once, so that buffered
+        writes need no formatting. Colors are left out when the sink is not writing to a terminal.
+        '''
+        if self.sink.isatty():
+            self.affixes = dict((color, (color.split("{}")[0], color.split("{}")[1] + "\n")) for color in self.color_choices)
+        else:
+            self.affixes = dict((color, ("", "\n")) for color in self.color_choices)
+
+
+    def write(self, color, content):
+        '''
+        Writes content in a color, through the sink in buffered mode or straight to the console otherwise.
+
+        Parameters
+        ----------
+        color : string
+            The color format to write the content in
+        content : string (et. al.)
+            The content to write
+        '''
+        if self.sink is None:
+            print(color.format(content))
+        else:
+            prefix, suffix = self.affixes[color]
+            self.sink.write(prefix + str(content) + suffix)
+
+
+    def flush(self):
+        '''
+        Writes out any content held by the sink, in buffered mode.
+        '''
+        if self.sink is not None:
+            self.sink.flush()
+
+
     def configure(self, success_color_choice, error_color_choice, general_color_choice):
         '''
         A configure method that allows the user to choose which colors they want for each description type.
@@ -97,7 +160,7 @@ class Display:
         content : string (et. al.)
             The content to print
         '''
-        print(self.success.format(content))
+        self.write(self.success, content)
 
 
     def print_error(self, content):
@@ -109,7 +172,7 @@ class Display:
         content : string (et. al.)
             The content to print
         '''
-        print(self.error.format(content))
+        self.write(self.error, content)
 
 
     def print_general(self, content):
@@ -121,4 +184,48 @@ class Display:
         content : string (et. al.)
             The content to print
         '''
-        print(self.general.format(content))
+        self.write(self.general, content)
+
+
+    def print_response(self, succeeded, content, metrics = None):
+        '''
+        Prints the outcome of a request with a SUCCESS or ERROR highlighting, followed by the metrics of
+        the request if there are any and they are to be shown.
+
+        Parameters
+        ----------
+        succeeded : boolean
+            Whether the request succeeded
+        content : string (et. al.)
+            The content to print
+        metrics : RequestMetrics
+            The metrics of the request, if it was instrumented
+        '''
+        if metrics is not None and self.show_metrics:
+            content = str(content) + " " + metrics.describe()
+        if succeeded:
+            self.print_success(content)
+        else:
+            self.print_error(content)
+
+
+    def print_records(self, records):
+        '''
+        Prints records one per line with a SUCCESS highlighting, as they arrive, so that a large result
+        never has to be held in memory at once.
+
+        Parameters
+        ----------
+        records : iterable
+            The records to print
+
+        Return
+        ----------
+        count : int
+            The number of records printed
+        '''
+        count = 0
+        for record in records:
+            self.print_success(json.dumps(record))
+            count += 1
+        return count
@@ -0,0 +1,190 @@
+'''
+Spreads requests across several MatchaDB replicas, failing over from those which cannot be reached.
+
+sammatime22, 2026
+'''
+import itertools
+import threading
+import time
+
+
+class EndpointPool:
+    '''
+    A pool of MatchaDB endpoints. Reads (GET) are spread across every endpoint, either in turn or to
+    the one with the fewest requests outstanding, while writes are always sent to the primary (the
+    first endpoint). An endpoint which fails to connect is passed over by reads for a cooldown, unless
+    every endpoint is down.
+    '''
+
+
+    # The ways reads may be spread across the endpoints.
+    ROUND_ROBIN = "round-robin"
+    LEAST_OUTSTANDING = "least-outstanding"
+    STRATEGIES = (ROUND_ROBIN, LEAST_OUTSTANDING)
+
+
+    # The session methods which only read, and so may be sent to any endpoint.
+    READ_VERBS = ("get",)
+
+
+    # The protocol and port of an endpoint which names neither.
+    DEFAULT_PROTOCOL = "http://"
+    DEFAULT_PORT = "11150"
+
+
+    # Default failover settings.
+    DEFAULT_COOLDOWN = 5.0          # Default is passing over an unreachable endpoint for 5 seconds
+
+
+    strategy = ROUND_ROBIN
+    cooldown = DEFAULT_COOLDOWN
+
+
+    def __init__(self, endpoints, strategy = None, cooldown = None):
+        '''
+        An initializer for the endpoint pool.
+
+        Parameters
+        ----------
+        endpoints : list of tuple
+            The protocol, host, and port of each endpoint, the primary first
+        strategy : string
+            How reads are spread across the endpoints (round-robin or least-outstanding)
+        cooldown : float
+            The seconds an endpoint which failed to connect is passed over for
+        '''
+        if not endpoints:
+            raise ValueError("At least one endpoint must be given.")
+        if strategy is not None:
+            if strategy not in self.STRATEGIES:
+                raise ValueError("The strategy must be one of " + ", ".join(self.STRATEGIES) + ".")
+            self.strategy = strategy
+        if cooldown is not None:
+            self.cooldown = cooldown
+
+        self.endpoints = list(endpoints)
+        self.urls = [protocol + host + ":" + port + "/" for protocol, host, port in self.endpoints]
+        self.outstanding = {url: 0 for url in self.urls}
+        self.down_until = {url: 0.0 for url in self.urls}
+        self.turns = itertools.count()
+        self.lock = threading.Lock()
+
+
+    @staticmethod
+    def parse_endpoint(endpoint_text):
+        '''
+        Reads an endpoint given as [protocol://]host[:port].
+
+        Parameters
+        ----------
+        endpoint_text : string
+            The endpoint
+
+        Return
+        ----------
+        endpoint : tuple
+            The protocol, host, and port of the endpoint
+        '''
+        endpoint_text = endpoint_text.strip()
+        protocol = EndpointPool.DEFAULT_PROTOCOL
+        if "://" in endpoint_text:
+            scheme, endpoint_text = endpoint_text.split("://", 1)
+            protocol = scheme + "://"
+        host, _, port = endpoint_text.rstrip("/").rpartition(":")
+        if not host:
+            host, port = port, ""
+        if not port:
+            port = EndpointPool.DEFAULT_PORT
+        if not host:
+            raise ValueError("An endpoint must name a host.")
+        return protocol, host, port
+
+
+    def primary(self):
+        '''
+        Returns the endpoint writes are sent to.
+
+        Return
+        ----------
+        endpoint : tuple
+            The protocol, host, and port of the primary
+        '''
+        return self.endpoints[0]
+
+
+    def choose(self, verb, tried = None):
+        '''
+        Chooses the endpoint for the next attempt of a request, counting it as outstanding until
+        release is called.
+
+        Parameters
+        ----------
+        verb : string
+            The session method of the request (get, post, put, or delete)
+        tried : list
+            The URLs this request has already failed to connect to
+
+        Return
+        ----------
+        url : string OR None
+            The URL of the endpoint, or None if there is none left to try
+        '''
+        tried = () if tried is None else tried
+        with self.lock:
+            if verb not in self.READ_VERBS:
+                candidates = [self.urls[0]]
+            else:
+                candidates = self.urls
+            candidates = [url for url in candidates if url not in tried]
+            if not candidates:
+                return None
+
+            # Pass over any endpoint cooling down, unless they all are.
+            now = time.monotonic()
+            candidates = [url for url in candidates if self.down_until[url] <= now] or candidates
+
+            # Start from the next in turn, so that ties are broken fairly.
+            turn = next(self.turns) % len(candidates)
+            candidates = candidates[turn:] + candidates[:turn]
+            if self.strategy == self.LEAST_OUTSTANDING:
+                url = min(candidates, key = lambda candidate: self.outstanding[candidate])
+            else:
+                url = candidates[0]
+            self.outstanding[url] += 1
+            return url
+
+
+    def can_fail_over(self, verb, tried):
+        '''
+        Checks whether a request which failed to connect has another endpoint to try. Writes only ever
+        go to the primary, so only reads fail over.
+
+        Parameters
+        ----------
+        verb : string
+            The session method of the request (get, post, put, or delete)
+        tried : list
+            The URLs this request has already failed to connect to
+
+        Return
+        ----------
+        can_fail_over : boolean
+            Whether another endpoint is left to try
+        '''
+        return verb in self.READ_VERBS and any(url not in tried for url in self.urls)
+
+
+    def release(self, url, reached):
+        '''
+        Records that an attempt sent to an endpoint is over.
+
+        Parameters
+        ----------
+        url : string
+            The URL of the endpoint
+        reached : boolean
+            Whether the endpoint could be connected to
+        '''
+        with self.lock:
+            self.outstanding[url] -= 1
+            self.down_until[url] = 0.0 if reached else time.monotonic() + self.cooldown
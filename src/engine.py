@@ -4,9 +4,10 @@ Runs the other components of Whisk, actively responding and interpreting command
 sammatime22, 2022
 '''
 import sys
+import json
+from command_registry import CommandRegistry, RegisteredCommand, REQUEST_COMMANDS
 from display import Display
-from input_machine import InputMachine
-from rest_client import RestClient
+from select_parser import SelectParser
 
 class Engine:
     '''
@@ -20,9 +21,14 @@ class Engine:
     UPDATE = "UPDATE"
     DELETE = "DELETE"
     HELP = "HELP"
+    RECALL = "RECALL"
     EXIT = "EXIT"
 
 
+    # The most commands listed for recall.
+    RECALL_LIST_LENGTH = 10
+
+
     # When a user provides a command that is not recognized
     SKIP = "SKIP"
 
@@ -31,10 +37,102 @@ class Engine:
     port = None
     protocol = None
 
-    def __init__(self):
+
+    # Whether GET results are printed record by record as they arrive, rather than all at once.
+    stream_results = False
+
+
+    # The pager showing GET results as a table, a page at a time, if paging is turned on.
+    pager = None
+
+
+    # Whether the Select portion is gathered on one line, as "key,operation,value; ..." (allowing many
+    # queries), rather than as a single query over three prompts.
+    compact_select = False
+    select_parser = SelectParser()
+
+
+    # The pipeline trimming GET results on the client side (which are then streamed), if any is set up.
+    pipeline = None
+
+
+    def __init__(self, stream_results = None, pager = None, compact_select = None, pipeline = None):
         '''
         An initializer for the engine.
+
+        Parameters:
+        ----------
+        stream_results : boolean
+            Whether GET results are streamed, printing each record as it arrives
+        pager : TablePager
+            The pager used to show GET results as a table, a page at a time
+        compact_select : boolean
+            Whether the Select portion is gathered on one line, allowing many queries
+        pipeline : ResultPipeline
+            The pipeline used to filter, project, sort, and limit the records of GET results
         '''
+        if stream_results is not None:
+            self.stream_results = stream_results
+        if pager is not None:
+            self.pager = pager
+        if compact_select is not None:
+            self.compact_select = compact_select
+        if pipeline is not None:
+            self.pipeline = pipeline
+
+        # The commands understood at the prompt, which further commands may be registered alongside.
+        self.commands = self.default_commands()
+
+
+    def default_commands(self):
+        '''
+        Registers the commands Whisk understands out of the box, in the order they are listed.
+
+        Return
+        ----------
+        commands : CommandRegistry
+            The registry of commands
+        '''
+        # The Select portion is described as it is gathered.
+        if self.compact_select:
+            select_help = "Select: Queries of format key,operation,value, separated by semicolons on one line"
+        else:
+            select_help = "Select: A query of format \"key\" \"operation\" \"value\", given over three inputs"
+
+        commands = CommandRegistry()
+        commands.register(REQUEST_COMMANDS.lookup(self.GET).with_handler("get_command", [
+            "This command allows users to retrieve data from the DB.",
+            "Below are the promts provided with the GET command:",
+            "From: Provide the name of the table in the database you would like data from.",
+            select_help + "."]))
+        commands.register(REQUEST_COMMANDS.lookup(self.POST).with_handler("post_command", [
+            "This command allows users to insert data into the DB.",
+            "Below are the promts provided with the POST command:",
+            "From: Provide the name of the table in the database you would like to insert data.",
+            select_help + ".",
+            "Insert: An item to insert, in key-value pairs provided in 2D arrays in one 2D array"]))
+        commands.register(REQUEST_COMMANDS.lookup(self.UPDATE).with_handler("update_command", [
+            "This command allows users to update data in the DB.",
+            "Below are the promts provided with the UPDATE command:",
+            "From: Provide the name of the table in the database you would like to update.",
+            select_help,
+            "Update: An update action of format \"key\" \"operation\" \"value\" in three inputs"]))
+        commands.register(REQUEST_COMMANDS.lookup(self.DELETE).with_handler("delete_command", [
+            "This command allows users to remove data from the DB.",
+            "Below are the promts provided with the DELETE command:",
+            "From: Provide the name of the table in the database you would remove data from.",
+            select_help]))
+        commands.register(RegisteredCommand(self.RECALL, "recall_command", [
+            "This command allows users to run a recent command again, as a whole.",
+            "The most recent commands are listed, including those of past sessions.",
+            "Command to run again: Provide the number of the command to run."]))
+        commands.register(RegisteredCommand(self.HELP, "help_command", [
+            "After typing help in any casing, when prompted, provide the command of interest."],
+            uses_rest_client = False))
+        commands.register(RegisteredCommand(self.EXIT, "exit_command", [
+            "Just simply type exit when promted in any casing and you will exit the app."],
+            ends_session = True))
+        return commands
 
 
     def retrieve_command(self, whisk_display, input_machine):
@@ -49,7 +147,7 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''
-        whisk_display.print_general("\nPlease provide one of the following:\nGET, POST, UPDATE, DELETE, HELP, EXIT")
+        whisk_display.print_general("\nPlease provide one of the following:\n" + self.commands.listing())
         whisk_display.print_general("Do note that this is not case sensitive.")
 
         # Gather and return the command.
@@ -62,6 +160,57 @@ class Engine:
             return self.SKIP
 
 
+    def gather_value(self, input_machine, input_text):
+        '''
+        Gathers one value of a command, failing if no value could be gathered (rather than building a
+        request around a missing value).
+
+        Parameters:
+        ----------
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+        input_text : string
+            The text presented to the user to provide info on what text they are about to provide
+
+        Return
+        ----------
+        contents : string
+            The value gathered at the console
+        '''
+        contents = input_machine.gather_input(input_text)
+        if contents is None:
+            raise ValueError("An unrecognized value was provided for " + input_text + ".")
+        return contents
+
+
+    def gather_select(self, input_machine):
+        '''
+        Gathers the Select portion of a command, either as a single query over three prompts or, with
+        compact select on, as one or more queries on one line (all of which must hold).
+
+        Parameters:
+        ----------
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+
+        Return
+        ----------
+        select_portion : list
+            The queries, each as [key, operation, value]
+        '''
+        if self.compact_select:
+            # A blank Select would match every record, so at least one query must be given.
+            select_portion = self.select_parser.parse(self.gather_value(input_machine, "Select"))
+            if not select_portion:
+                raise ValueError("At least one query must be provided for Select.")
+            return select_portion
+
+        spart_one = self.gather_value(input_machine, "Select (key)")
+        spart_two = self.gather_value(input_machine, "Select (operation)")
+        spart_three = self.gather_value(input_machine, "Select (value)")
+        return [[spart_one, spart_two, spart_three]]
+
+
     def help_command(self, whisk_display, input_machine):
         '''
         Allows the user to get more information on different commands to better understand their 
@@ -74,7 +223,7 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''
-        whisk_display.print_general("What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT")
+        whisk_display.print_general("What command would you like more info on?\n" + self.commands.listing())
         whisk_display.print_general("This is not case sensitive.")
 
         # Get the selected command.
@@ -82,33 +231,10 @@ class Engine:
 
         # Print help information accordingly.
         if selected_command is not None:
-            selected_command = selected_command.upper()
-            if (selected_command == self.GET):
-                whisk_display.print_general("This command allows users to retrieve data from the DB.")
-                whisk_display.print_general("Below are the promts provided with the GET command:")
-                whisk_display.print_general("From: Provide the name of the table in the database you would like data from.")
-                whisk_display.print_general("Select: A query of format \"key\" \"operation\" \"value\", given over three inputs.")
-            elif (selected_command == self.POST):
-                whisk_display.print_general("This command allows users to insert data into the DB.")
-                whisk_display.print_general("Below are the promts provided with the POST command:")
-                whisk_display.print_general("From: Provide the name of the table in the database you would like to insert data.")
-                whisk_display.print_general("Select: A query of format \"key\" \"operation\" \"value\", given over three inputs.")
-                whisk_display.print_general("Insert: An item to insert, in key-value pairs provided in 2D arrays in one 2D array") 
-            elif (selected_command == self.UPDATE):
-                whisk_display.print_general("This command allows users to update data in the DB.")
-                whisk_display.print_general("Below are the promts provided with the UPDATE command:")
-                whisk_display.print_general("From: Provide the name of the table in the database you would like to update.")
-                whisk_display.print_general("Select: A query of format \"key\" \"operation\" \"value\", given over three inputs")
-                whisk_display.print_general("Update: An update action of format \"key\" \"operation\" \"value\" in three inputs")        
-            elif (selected_command == self.DELETE):
-                whisk_display.print_general("This command allows users to remove data from the DB.")
-                whisk_display.print_general("Below are the promts provided with the DELETE command:")
-                whisk_display.print_general("From: Provide the name of the table in the database you would remove data from.")
-                whisk_display.print_general("Select: A query of format \"key\" \"operation\" \"value\", given over three inputs")
-            elif (selected_command == self.HELP):
-                whisk_display.print_general("After typing help in any casing, when prompted, provide the command of interest.")
-            elif (selected_command == self.EXIT):
-                whisk_display.print_general("Just simply type exit when promted in any casing and you will exit the app.")
+            command = self.commands.lookup(selected_command)
+            if command is not None:
+                for line in command.help_lines:
+                    whisk_display.print_general(line)
             else:
                 whisk_display.print_error("The command provided was not recognized")
         else:
@@ -129,30 +255,171 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''
-        try:
-            # Gather the From portion of the command.
-            from_portion = "[\"" + input_machine.gather_input("From") + "\"]"
+        self.request_command(self.GET, whisk_display, rest_client, input_machine)
 
-            # Gather the Select portion of the command.
-            spart_one = input_machine.gather_input("Select (key)")
-            spart_two = input_machine.gather_input("Select (operation)")
-            spart_three = input_machine.gather_input("Select (value)")
-            select_portion = "[[\"" + spart_one + "\", \"" + spart_two + "\", \"" + spart_three + "\"]]"
-
-            # Use the Rest Client
-            retrieved, response = rest_client.get_request(from_portion, select_portion)
-
-            if retrieved:
-                if response.status_code == 200:
-                    whisk_display.print_success(str(response.status_code) + " : " + str(response.content))
-                else:
-                    whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
-            else:
-                whisk_display.print_error(response)
+
+    def execute(self, whisk_display, rest_client, input_machine, operation):
+        '''
+        Runs a command whose portions have all been gathered against MatchaDB, and prints the response.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application to run the request on the MatchaDB
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+        operation : dict
+            The command, holding its Command, From, Select, and Insert/Update portions as needed
+        '''
+        command = self.commands.lookup(operation["Command"])
+        if command is None or command.request_method is None:
+            raise ValueError(str(operation["Command"]) + " is not a command which makes a request.")
+        from_portion = operation["From"]
+        select_portion = operation["Select"]
+
+        if command.name == self.GET:
+            # Page through the result as a table, if asked to, reading it only as each page is shown.
+            if self.pager is not None:
+                self.page_get(whisk_display, rest_client, input_machine, from_portion, select_portion)
+                return
+
+            # Stream the result, if asked to (or if it is to be trimmed), so that it is printed as it arrives.
+            if self.stream_results or self.pipeline is not None:
+                self.stream_get(whisk_display, rest_client, from_portion, select_portion)
+                return
+
+        retrieved, response = command.send(rest_client, from_portion, select_portion, operation)
+
+        if retrieved:
+            whisk_display.print_response(response.status_code == command.expected_status_code,\
+                                         str(response.status_code) + " : " + str(response.content),\
+                                         getattr(response, "metrics", None))
+        else:
+            whisk_display.print_error(response)
+
+
+    def recall_command(self, whisk_display, rest_client, input_machine):
+        '''
+        Lists the commands run most recently (this session or before), and runs the one chosen again as
+        a whole, without prompting for each of its portions.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application to run the request on the MatchaDB
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+        '''
+        commands = input_machine.recent_commands()[:self.RECALL_LIST_LENGTH]
+        if not commands:
+            whisk_display.print_error("No commands have been run yet.")
+            return
+
+        try:
+            for number, operation in enumerate(commands, 1):
+                portions = [json.dumps(operation[portion]) for portion in ("From", "Select", "Insert", "Update")\
+                            if portion in operation]
+                whisk_display.print_general(str(number) + ": " + str(operation["Command"]) + " " + " ".join(portions))
+
+            choice = int(self.gather_value(input_machine, "Command to run again (number)"))
+            if not 1 <= choice <= len(commands):
+                raise ValueError("There is no command " + str(choice) + ".")
+            input_machine.remember_command(commands[choice - 1])
+            self.execute(whisk_display, rest_client, input_machine, commands[choice - 1])
         except Exception as e:
             whisk_display.print_error(e)
 
 
+    def trim_records(self, records):
+        '''
+        Runs the records of a GET result through the pipeline, if one is set up.
+
+        Parameters:
+        ----------
+        records : iterable
+            The records of the result, as they are read
+
+        Return
+        ----------
+        records : iterable
+            The records to show
+        '''
+        if self.pipeline is None:
+            return records
+        return self.pipeline.process(records)
+
+
+    def stream_get(self, whisk_display, rest_client, from_portion, select_portion):
+        '''
+        Runs a GET request, printing each record of the result as it arrives (trimmed by the pipeline, if
+        one is set up), then the record count. The rest of the result is left unread once a limit is met.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application to run the GET request on the MatchaDB
+        from_portion : list
+            The From portion of the request
+        select_portion : list
+            The Select portion of the request
+        '''
+        retrieved, response = rest_client.stream_get_request(from_portion, select_portion)
+
+        if retrieved:
+            if response.status_code == 200:
+                whisk_display.print_success(str(response.status_code) + " :")
+                try:
+                    count = whisk_display.print_records(self.trim_records(rest_client.iter_records(response)))
+                finally:
+                    response.close()
+                whisk_display.print_general(str(count) + " records")
+            else:
+                whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
+        else:
+            whisk_display.print_error(response)
+
+
+    def page_get(self, whisk_display, rest_client, input_machine, from_portion, select_portion):
+        '''
+        Runs a GET request, showing the result as a table a page at a time, then the number of records
+        shown. The rest of the result is left unread if paging is stopped early.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application to run the GET request on the MatchaDB
+        input_machine : InputMachine
+            The machine used to ask whether to show the next page
+        from_portion : list
+            The From portion of the request
+        select_portion : list
+            The Select portion of the request
+        '''
+        retrieved, response = rest_client.stream_get_request(from_portion, select_portion)
+
+        if retrieved:
+            if response.status_code == 200:
+                whisk_display.print_success(str(response.status_code) + " :")
+                try:
+                    count = self.pager.page(whisk_display, input_machine,\
+                                            self.trim_records(rest_client.iter_records(response)))
+                finally:
+                    response.close()
+                whisk_display.print_general(str(count) + " records shown")
+            else:
+                whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
+        else:
+            whisk_display.print_error(response)
+
+
     def post_command(self, whisk_display, rest_client, input_machine):
         '''
         This method collects the From, Select, and Insert portions for a POST request, runs it against
@@ -167,31 +434,7 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''
-        try:
-            # Gather the From portion of the command.
-            from_portion = "[\"" + input_machine.gather_input("From") + "\"]"
-
-            # Gather the Select portion of the command.
-            spart_one = input_machine.gather_input("Select (key)")
-            spart_two = input_machine.gather_input("Select (operation)")
-            spart_three = input_machine.gather_input("Select (value)")
-            select_portion = "[[\"" + spart_one + "\", \"" + spart_two + "\", \"" + spart_three + "\"]]"
-
-            # Gather the Insert portion of the command.
-            insert_portion = input_machine.gather_input("Insert")
-
-            # Use the Rest Client
-            retrieved, response = rest_client.post_request(from_portion, select_portion, insert_portion)
-
-            if retrieved:
-                if response.status_code == 201:
-                    whisk_display.print_success(str(response.status_code) + " : " + str(response.content))
-                else:
-                    whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
-            else:
-                whisk_display.print_error(response)
-        except Exception as e:
-            whisk_display.print_error(e)
+        self.request_command(self.POST, whisk_display, rest_client, input_machine)
 
 
     def update_command(self, whisk_display, rest_client, input_machine):
@@ -209,34 +452,7 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''
-        try:
-            # Gather the From portion of the command.
-            from_portion = "[\"" + input_machine.gather_input("From") + "\"]"
-
-            # Gather the Select portion of the command.
-            spart_one = input_machine.gather_input("Select (key)")
-            spart_two = input_machine.gather_input("Select (operation)")
-            spart_three = input_machine.gather_input("Select (value)")
-            select_portion = "[[\"" + spart_one + "\", \"" + spart_two + "\", \"" + spart_three + "\"]]"
-
-            # Gather the Update portion of the command.
-            upart_one = input_machine.gather_input("Update (key)")
-            upart_two = input_machine.gather_input("Update (operation)")
-            upart_three = input_machine.gather_input("Update (value)")
-            update_portion = "[[\"" + upart_one + "\", \"" + upart_two + "\", \"" + upart_three + "\"]]"
-
-            # Use the Rest Client
-            retrieved, response = rest_client.update_request(from_portion, select_portion, update_portion)
-
-            if retrieved:
-                if response.status_code == 200:
-                    whisk_display.print_success(str(response.status_code) + " : " + str(response.content))
-                else:
-                    whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
-            else:
-                whisk_display.print_error(response)
-        except Exception as e:
-            whisk_display.print_error(e)
+        self.request_command(self.UPDATE, whisk_display, rest_client, input_machine)
 
 
     def delete_command(self, whisk_display, rest_client, input_machine):
@@ -252,34 +468,107 @@ class Engine:
             The rest client in use by the whisk application to run the DELETE request on the MatchaDB
         input_machine : InputMachine
             The machine used to gather the input at the console
-        '''  
-        try: 
+        '''
+        self.request_command(self.DELETE, whisk_display, rest_client, input_machine)
+
+
+    def request_command(self, name, whisk_display, rest_client, input_machine):
+        '''
+        Collects the From and Select portions for a request command, along with any further portions it
+        is registered with, runs it against MatchaDB, and prints the response code. It will also print
+        exceptions, given that they occur.
+
+        Parameters:
+        ----------
+        name : string
+            The name of the command
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application to run the request on the MatchaDB
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+        '''
+        try:
+            command = self.commands.lookup(name)
+
             # Gather the From portion of the command.
-            from_portion = "[\"" + input_machine.gather_input("From") + "\"]"
+            from_portion = [self.gather_value(input_machine, "From")]
 
             # Gather the Select portion of the command.
-            spart_one = input_machine.gather_input("Select (key)")
-            spart_two = input_machine.gather_input("Select (operation)")
-            spart_three = input_machine.gather_input("Select (value)")
-            select_portion = "[[\"" + spart_one + "\", \"" + spart_two + "\", \"" + spart_three + "\"]]"
-
-            # Develop the Parameter Values.
-            parameter_vals = "{\"From\": " + from_portion + ", \"Select\": " + select_portion + "}"
-
-            # Use the Rest Client
-            retrieved, response = rest_client.delete_request(from_portion, select_portion)
-
-            if retrieved:
-                if response.status_code == 204:
-                    whisk_display.print_success(str(response.status_code) + " : " + str(response.content))
-                else:
-                    whisk_display.print_error(str(response.status_code) + " : " + str(response.content))
-            else:
-                whisk_display.print_error(response)
+            select_portion = self.gather_select(input_machine)
+
+            # Gather any further portions of the command (such as Insert or Update).
+            operation = {"Command": command.name, "From": from_portion, "Select": select_portion}
+            for portion, default in command.portions:
+                operation[portion] = getattr(self, "gather_" + portion.lower())(input_machine)
+
+            # Run the command, remembering it so that it can be recalled as a whole.
+            input_machine.remember_command(operation)
+            self.execute(whisk_display, rest_client, input_machine, operation)
         except Exception as e:
             whisk_display.print_error(e)
 
 
+    def gather_insert(self, input_machine):
+        '''
+        Gathers the Insert portion of a POST command, as JSON.
+
+        Parameters:
+        ----------
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+
+        Return
+        ----------
+        insert_portion : dict OR list
+            The item (or items) to insert
+        '''
+        return json.loads(self.gather_value(input_machine, "Insert"))
+
+
+    def gather_update(self, input_machine):
+        '''
+        Gathers the Update portion of an UPDATE command, as a single action over three prompts.
+
+        Parameters:
+        ----------
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+
+        Return
+        ----------
+        update_portion : list
+            The update actions, each as [key, operation, value]
+        '''
+        upart_one = self.gather_value(input_machine, "Update (key)")
+        upart_two = self.gather_value(input_machine, "Update (operation)")
+        upart_three = self.gather_value(input_machine, "Update (value)")
+        return [[upart_one, upart_two, upart_three]]
+
+
+    def exit_command(self, whisk_display, rest_client, input_machine):
+        '''
+        Ends the session, summarizing its requests if they were measured, keeping the history for the
+        next session, and releasing the pooled connections.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client in use by the whisk application
+        input_machine : InputMachine
+            The machine used to gather the input at the console
+        '''
+        if rest_client.instrumentation is not None:
+            for line in rest_client.instrumentation.summarize():
+                whisk_display.print_general(line)
+
+        input_machine.save_history()
+        rest_client.close()
+
+
     def run_engine(self, whisk_display, rest_client, input_machine):
         '''
         Essentially the main method of the application.
@@ -293,23 +582,25 @@ class Engine:
         input_machine : InputMachine
             The machine used to gather the input at the console
         '''  
+        # Work out where commands are pointed at once, as it does not change while the engine runs.
+        self.protocol, self.host, self.port = rest_client.get_protocol_host_port()
+        banner = "Using " + str(self.protocol) + str(self.host) + ":" + str(self.port) + "/"
+
         while True:
             # Remind the user where the command is currently pointed at.
-            whisk_display.print_general("Using " + str(self.protocol) + str(self.host) + ":" + str(self.port) + "/")
+            whisk_display.print_general(banner)
 
             # Get the command.
-            command_to_use = self.retrieve_command(whisk_display, input_machine).upper()
-
-            # Check which command this is for and run said command accordingly.
-            if (command_to_use == self.GET):
-                self.get_command(whisk_display, rest_client, input_machine)
-            elif (command_to_use == self.POST):
-                self.post_command(whisk_display, rest_client, input_machine)
-            elif (command_to_use == self.UPDATE):
-                self.update_command(whisk_display, rest_client, input_machine)
-            elif (command_to_use == self.DELETE):
-                self.delete_command(whisk_display, rest_client, input_machine)
-            elif (command_to_use == self.HELP):
-                self.help_command(whisk_display, input_machine)
-            elif (command_to_use == self.EXIT):
+            command_to_use = self.retrieve_command(whisk_display, input_machine)
+
+            # Look up the command, and run it with its handler.
+            command = self.commands.lookup(command_to_use)
+            if command is None:
+                continue
+            handler = getattr(self, command.handler) if isinstance(command.handler, str) else command.handler
+            if command.uses_rest_client:
+                handler(whisk_display, rest_client, input_machine)
+            else:
+                handler(whisk_display, input_machine)
+            if command.ends_session:
                 break
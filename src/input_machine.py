@@ -3,7 +3,8 @@ Helps to facilitate better console input for the Whisk application.
 
 sammatime22, 2021-2022
 '''
-import readline # Used for Arrow Keys (up-down->history, left-right->cursor)
+import json
+import os
 
 class InputMachine:
     '''
@@ -19,7 +20,20 @@ class InputMachine:
     input_format = "{} {}"
 
 
-    def __init__(self, pointer_char = None):
+    # Default history sizes.
+    DEFAULT_HISTORY_LENGTH = 1000           # Default is keeping the last 1000 lines entered
+    DEFAULT_COMMAND_HISTORY_LENGTH = 100    # Default is keeping the last 100 whole commands run
+
+
+    # The file the history is kept in between sessions (none unless provided), alongside which whole
+    # commands are kept in a file of the same name ending in COMMANDS_SUFFIX.
+    history_path = None
+    history_length = DEFAULT_HISTORY_LENGTH
+    command_history_length = DEFAULT_COMMAND_HISTORY_LENGTH
+    COMMANDS_SUFFIX = ".commands"
+
+
+    def __init__(self, pointer_char = None, history_path = None, history_length = None):
         '''
         This constructor takes an optional parameter of a pointer char, so the application can
         be configured with a different char to show where the input should be placed.
@@ -29,12 +43,120 @@ class InputMachine:
         pointer_char (optional) : string
             The optional parameter that can override the pointer character used by the Input
             Machine to designate where the input will go on the CLI.
+        history_path (optional) : string
+            The file to load the history from, and save it to on exit
+        history_length (optional) : int
+            The most lines of history to keep
         '''
         if pointer_char is not None:
             self.pointer_char = pointer_char
+        if history_path is not None:
+            self.history_path = history_path
+        if history_length is not None:
+            self.history_length = history_length
+
+        # Importing readline is enough for it to take over input(). It is only needed for interactive use,
+        # so it is imported here rather than whenever the module is.
+        import readline # Used for Arrow Keys (up-down->history, left-right->cursor)
+        self.readline = readline
+
+        # The whole commands run, from the oldest to the most recent.
+        self.commands = []
+        if self.history_path is not None:
+            self.load_history()
+
+
+    def load_history(self):
+        '''
+        Loads the line history and the command history from their files, if they exist. Lines of the
+        command history which do not hold a command are skipped.
+        '''
+        self.readline.set_history_length(self.history_length)
+        if os.path.exists(self.history_path):
+            self.readline.read_history_file(self.history_path)
+
+        commands_path = self.history_path + self.COMMANDS_SUFFIX
+        if os.path.exists(commands_path):
+            with open(commands_path) as commands_file:
+                for line in commands_file:
+                    try:
+                        command = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(command, dict) and "Command" in command:
+                        self.remember_command(command)
+
+
+    def save_history(self):
+        '''
+        Saves the line history and the command history to their files, keeping only the latest of any
+        repeated entries, up to the history lengths.
+        '''
+        if self.history_path is None:
+            return
+
+        entries = [self.readline.get_history_item(index) for index in range(1, self.readline.get_current_history_length() + 1)]
+        self.readline.clear_history()
+        for entry in self.deduplicate(entries)[-self.history_length:]:
+            self.readline.add_history(entry)
+        self.readline.write_history_file(self.history_path)
+
+        with open(self.history_path + self.COMMANDS_SUFFIX, "w") as commands_file:
+            for command in self.commands:
+                commands_file.write(json.dumps(command) + "\n")
+
+
+    def deduplicate(self, entries):
+        '''
+        Drops all but the latest of any repeated entries, keeping their order otherwise.
+
+        Parameters:
+        ----------
+        entries : list
+            The entries, from the oldest to the most recent
+
+        Return
+        ----------
+        entries : list
+            The entries without repeats
+        '''
+        seen = set()
+        latest = []
+        for entry in reversed(entries):
+            if entry is not None and entry not in seen:
+                seen.add(entry)
+                latest.append(entry)
+        latest.reverse()
+        return latest
+
+
+    def remember_command(self, command):
+        '''
+        Remembers a whole command, so that it can be recalled and run again as one. Running a command
+        already remembered moves it to the most recent.
+
+        Parameters:
+        ----------
+        command : dict
+            The command, holding its Command, From, Select, and Insert/Update portions as needed
+        '''
+        self.commands = [remembered for remembered in self.commands if remembered != command]
+        self.commands.append(command)
+        del self.commands[:-self.command_history_length]
+
+
+    def recent_commands(self):
+        '''
+        Lists the whole commands remembered.
+
+        Return
+        ----------
+        commands : list of dict
+            The commands, from the most recent to the oldest
+        '''
+        return list(reversed(self.commands))
 
 
-    
     def gather_input(self, input_text):
         '''
         This constructor takes an optional parameter of a pointer char, so the application can
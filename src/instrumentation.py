@@ -0,0 +1,178 @@
+'''
+Times the requests made to MatchaDB, so that a slow command can be traced to Whisk, the network, or
+the DB itself.
+
+sammatime22, 2026
+'''
+import threading
+import time
+
+
+class RequestMetrics:
+    '''
+    The timings and sizes of a single request.
+    '''
+
+
+    def __init__(self, command, bytes_sent):
+        '''
+        An initializer for the request metrics.
+
+        Parameters
+        ----------
+        command : string
+            The HTTP method of the request
+        bytes_sent : int
+            The size of the body of the request
+        '''
+        self.command = command
+        self.bytes_sent = bytes_sent
+        self.bytes_received = 0
+        self.started = None
+        self.connect = 0.0
+        self.time_to_first_byte = None
+        self.total = None
+        self.status_code = None
+
+
+    def describe(self):
+        '''
+        Describes the metrics in a single line.
+
+        Return
+        ----------
+        description : string
+            The metrics, with timings in milliseconds
+        '''
+        time_to_first_byte = "-" if self.time_to_first_byte is None else "{:.1f}ms".format(self.time_to_first_byte * 1000)
+        total = "-" if self.total is None else "{:.1f}ms".format(self.total * 1000)
+        return "[connect {:.1f}ms, first byte {}, total {}, sent {}B, received {}B]".format(\
+            self.connect * 1000, time_to_first_byte, total, self.bytes_sent, self.bytes_received)
+
+
+class Instrumentation:
+    '''
+    A collector for the metrics of every request made by a Rest Client, which also times each new
+    connection the client opens.
+    '''
+
+
+    def __init__(self):
+        '''
+        An initializer for the instrumentation.
+        '''
+        self.metrics = []
+        self.lock = threading.Lock()
+
+        # The connection time spent by the request in progress on each thread.
+        self.current = threading.local()
+
+
+    def begin(self):
+        '''
+        Marks the start of a request on the calling thread.
+        '''
+        self.current.connect = 0.0
+
+
+    def add_connect_time(self, seconds):
+        '''
+        Adds time spent opening a connection to the request in progress on the calling thread.
+
+        Parameters
+        ----------
+        seconds : float
+            The time spent opening the connection
+        '''
+        self.current.connect = getattr(self.current, "connect", 0.0) + seconds
+
+
+    def connect_time(self):
+        '''
+        Returns the time spent opening connections by the request in progress on the calling thread.
+
+        Return
+        ----------
+        seconds : float
+            The connection time (0 when a kept-alive connection was reused)
+        '''
+        return getattr(self.current, "connect", 0.0)
+
+
+    def record(self, metrics):
+        '''
+        Records the metrics of a finished request.
+
+        Parameters
+        ----------
+        metrics : RequestMetrics
+            The metrics of the request
+        '''
+        with self.lock:
+            self.metrics.append(metrics)
+
+
+    def summarize(self):
+        '''
+        Summarizes every request recorded so far, per command.
+
+        Return
+        ----------
+        lines : list of string
+            The lines of the summary
+        '''
+        with self.lock:
+            metrics = list(self.metrics)
+
+        lines = ["{} requests, {}B sent, {}B received".format(len(metrics),\
+            sum(entry.bytes_sent for entry in metrics), sum(entry.bytes_received for entry in metrics))]
+        for command in sorted(set(entry.command for entry in metrics)):
+            entries = [entry for entry in metrics if entry.command == command]
+            totals = [entry.total for entry in entries if entry.total is not None]
+            failures = len([entry for entry in entries if entry.status_code is None])
+            if totals:
+                lines.append("{}: {} requests, {} failed, mean {:.1f}ms, max {:.1f}ms, connecting {:.1f}ms".format(\
+                    command, len(entries), failures, sum(totals) / len(totals) * 1000, max(totals) * 1000,\
+                    sum(entry.connect for entry in entries) * 1000))
+            else:
+                lines.append("{}: {} requests, {} failed".format(command, len(entries), failures))
+        return lines
+
+
+    def timed_pool_classes(self):
+        '''
+        Makes connection pool classes whose connections report the time spent connecting, for use by
+        the pool manager of a requests adapter.
+
+        Return
+        ----------
+        pool_classes_by_scheme : dict
+            The pool classes, keyed by scheme
+        '''
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+        instrumentation = self
+
+        class TimedHTTPConnection(HTTPConnection):
+            def connect(self):
+                began = time.perf_counter()
+                try:
+                    HTTPConnection.connect(self)
+                finally:
+                    instrumentation.add_connect_time(time.perf_counter() - began)
+
+        class TimedHTTPSConnection(HTTPSConnection):
+            def connect(self):
+                began = time.perf_counter()
+                try:
+                    HTTPSConnection.connect(self)
+                finally:
+                    instrumentation.add_connect_time(time.perf_counter() - began)
+
+        class TimedHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = TimedHTTPConnection
+
+        class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = TimedHTTPSConnection
+
+        return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
@@ -0,0 +1,288 @@
+'''
+A stand-in for MatchaDB, served in-process over HTTP, so that Whisk can be exercised end to end and
+benchmarked on a machine with no network.
+
+sammatime22, 2026
+'''
+import ast
+import gzip
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from query_matcher import QueryMatcher
+
+
+class MockMatchaDBHandler(BaseHTTPRequestHandler):
+    '''
+    Handles a single connection to the stand-in, which may carry many kept-alive requests.
+    '''
+
+
+    protocol_version = "HTTP/1.1"
+
+    # The headers and body are written separately, so they should not wait on each other to be sent.
+    disable_nagle_algorithm = True
+
+
+    def setup(self):
+        '''
+        Counts each new connection made to the stand-in.
+        '''
+        BaseHTTPRequestHandler.setup(self)
+        self.server.mock.count_connection()
+
+
+    def respond(self):
+        '''
+        Answers a request, using the HTTP method to decide which command to run.
+        '''
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding", "") == "gzip":
+            body = gzip.decompress(body)
+        status_code, content = self.server.mock.handle(self.command, body)
+        self.send_response(status_code)
+        if status_code != 204:
+            self.send_header("Content-Type", "application/json")
+            if self.server.mock.compress_responses and "gzip" in self.headers.get("Accept-Encoding", ""):
+                content = gzip.compress(content)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if status_code != 204:
+            self.wfile.write(content)
+
+
+    do_GET = do_POST = do_PUT = do_DELETE = respond
+
+
+    def log_message(self, format, *args):
+        '''
+        Keeps the stand-in quiet, rather than logging every request to the console.
+        '''
+
+
+class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    '''
+    An HTTP server handling each connection on its own thread.
+    '''
+    daemon_threads = True
+    mock = None
+
+
+    def handle_error(self, request, client_address):
+        '''
+        Ignores clients which hang up before their response is written (such as one that timed out),
+        reporting any other error as usual.
+        '''
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            HTTPServer.handle_error(self, request, client_address)
+
+
+class MockMatchaDB:
+    '''
+    An in-memory stand-in for MatchaDB, understanding the From, Select, Insert, and Update portions of
+    the requests Whisk makes. Tables are lists of records, created on first insert.
+    '''
+
+
+    # Default networking values.
+    DEFAULT_HOST = "127.0.0.1"   # Default is localhost
+    DEFAULT_PORT = 0             # Default is any free port
+
+
+    # The status code returned on success for each method.
+    status_codes = {"GET": 200, "POST": 201, "PUT": 200, "DELETE": 204}
+
+
+    # The matcher giving each query operation its meaning, shared with the client-side filters.
+    query_matcher = QueryMatcher()
+
+
+    host = DEFAULT_HOST
+    port = DEFAULT_PORT
+    latency = 0.0
+    compress_responses = False
+
+
+    def __init__(self, host = None, port = None, latency = None, compress_responses = None):
+        '''
+        An initializer for the stand-in.
+
+        Parameters
+        ----------
+        host : string
+            The hostname/IP to listen on
+        port : int
+            The port to listen on (0 picks any free port)
+        latency : float
+            The number of seconds to wait before answering each request
+        compress_responses : boolean
+            Whether response bodies are gzipped for clients which accept it
+        '''
+        if host is not None:
+            self.host = host
+        if port is not None:
+            self.port = port
+        if latency is not None:
+            self.latency = latency
+        if compress_responses is not None:
+            self.compress_responses = compress_responses
+
+        self.tables = {}
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.connection_count = 0
+        self.server = None
+
+
+    def start(self):
+        '''
+        Starts serving on a background thread.
+
+        Return
+        ----------
+        protocol : string
+            The protocol to reach the stand-in on
+        host : string
+            The host to reach the stand-in on
+        port : string
+            The port to reach the stand-in on
+        '''
+        self.server = ThreadedHTTPServer((self.host, self.port), MockMatchaDBHandler)
+        self.server.mock = self
+        self.port = self.server.server_address[1]
+        threading.Thread(target = self.server.serve_forever, args = (0.05,), daemon = True).start()
+        return "http://", self.host, str(self.port)
+
+
+    def stop(self):
+        '''
+        Stops serving, closing the listening socket.
+        '''
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+    def seed(self, table, count, record_size = 0):
+        '''
+        Fills a table with records, so that GETs have something of a known size to return.
+
+        Parameters
+        ----------
+        table : string
+            The table to fill
+        count : int
+            The number of records to add, with ids counting up from 0
+        record_size : int
+            The number of padding characters held by each record
+        '''
+        with self.lock:
+            records = self.tables.setdefault(table, [])
+            for index in range(count):
+                records.append({"id": str(index), "value": "x" * record_size})
+
+
+    def count_connection(self):
+        '''
+        Counts a new connection made to the stand-in.
+        '''
+        with self.lock:
+            self.connection_count += 1
+
+
+    def parse_body(self, body):
+        '''
+        Reads the parameter values out of a request body. The body may be plain JSON, or JSON that was
+        sent as the repr of a Python string.
+
+        Parameters
+        ----------
+        body : bytes
+            The body of the request
+
+        Return
+        ----------
+        parameter_vals : dict
+            The portions of the request, keyed by name
+        '''
+        text = body.decode("utf-8")
+        if text[:1] in ("'", "\""):
+            text = ast.literal_eval(text)
+        return json.loads(text)
+
+
+    def matches(self, record, select_portion):
+        '''
+        Checks a record against every query in a Select portion.
+
+        Parameters
+        ----------
+        record : dict
+            The record to check
+        select_portion : list
+            The queries, each of the form [key, operation, value]
+
+        Return
+        ----------
+        matched : boolean
+            Whether the record satisfies every query
+        '''
+        return self.query_matcher.matches(record, select_portion)
+
+
+    def handle(self, method, body):
+        '''
+        Runs a request against the in-memory tables.
+
+        Parameters
+        ----------
+        method : string
+            The HTTP method of the request
+        body : bytes
+            The body of the request
+
+        Return
+        ----------
+        status_code : int
+            The status code of the response
+        content : bytes
+            The body of the response
+        '''
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        with self.lock:
+            self.request_count += 1
+            try:
+                parameter_vals = self.parse_body(body)
+                table = parameter_vals["From"][0]
+                select_portion = parameter_vals.get("Select", [])
+                records = self.tables.get(table, [])
+
+                if method == "GET":
+                    matched = [record for record in records if self.matches(record, select_portion)]
+                    return self.status_codes[method], json.dumps(matched).encode("utf-8")
+                elif method == "POST":
+                    inserted = parameter_vals["Insert"]
+                    if isinstance(inserted, str):
+                        inserted = json.loads(inserted)
+                    if isinstance(inserted, dict):
+                        inserted = [inserted]
+                    self.tables.setdefault(table, []).extend(inserted)
+                    return self.status_codes[method], b""
+                elif method == "PUT":
+                    for record in records:
+                        if self.matches(record, select_portion):
+                            for key, operation, value in parameter_vals["Update"]:
+                                record[key] = value
+                    return self.status_codes[method], b""
+                else:
+                    self.tables[table] = [record for record in records if not self.matches(record, select_portion)]
+                    return self.status_codes[method], b""
+            except (ValueError, KeyError, IndexError, TypeError, SyntaxError) as e:
+                return 400, json.dumps({"Error": str(e)}).encode("utf-8")
@@ -0,0 +1,155 @@
+'''
+Runs a single command given on the command line, such as "whisk.py get --from users --select id,==,5",
+so that shell scripts can call Whisk without the interactive loop.
+
+sammatime22, 2026
+'''
+import json
+import sys
+from command_registry import REQUEST_COMMANDS
+from script_runner import ScriptRunner
+from select_parser import SelectParser
+
+
+class OneShot:
+    '''
+    A runner used to make one request from command line options, print its result, and report how it
+    went through an exit status. The response body is written to standard output as it was received,
+    and any error to standard error, so that the output can be piped on.
+    '''
+
+
+    # The exit statuses of a one-shot run.
+    EXIT_SUCCESS = 0        # The expected status code was returned
+    EXIT_FAILURE = 1        # The request could not be made, or got an unexpected status code
+    EXIT_USAGE = 2          # The options given do not make a request
+    EXIT_CLIENT_ERROR = 4   # MatchaDB rejected the request (a 4xx status code)
+    EXIT_SERVER_ERROR = 5   # MatchaDB failed to handle the request (a 5xx status code)
+
+
+    # The runner whose operations a one-shot command is built from.
+    script_runner = ScriptRunner()
+
+
+    # The parser for the Select and Update portions, given as "key,operation,value; ...".
+    select_parser = SelectParser()
+
+
+    def build_operation(self, command, options):
+        '''
+        Builds the operation for a command from the options given alongside it.
+
+        Parameters:
+        ----------
+        command : string
+            The command to run (GET, POST, UPDATE, or DELETE)
+        options : dict
+            The named options given on the command line
+
+        Return
+        ----------
+        operation : dict
+            The operation, holding the Command, From, Select, and Insert/Update portions as needed
+        '''
+        if "from" not in options:
+            raise ValueError("--from is required")
+
+        operation = {"Command": command.upper(), "From": [options["from"]], "Select": []}
+        if "select" in options:
+            operation["Select"] = self.select_parser.parse(options["select"])
+        if operation["Command"] == ScriptRunner.POST:
+            if "insert" not in options:
+                raise ValueError("--insert is required for POST")
+            operation["Insert"] = json.loads(options["insert"])
+        elif operation["Command"] == ScriptRunner.UPDATE:
+            if "update" not in options:
+                raise ValueError("--update is required for UPDATE")
+            operation["Update"] = self.select_parser.parse(options["update"])
+            if not operation["Update"]:
+                raise ValueError("--update must hold at least one action")
+
+        # An empty Select matches every record, so it is never taken as a write's target.
+        if operation["Command"] in (ScriptRunner.UPDATE, ScriptRunner.DELETE) and not operation["Select"]:
+            raise ValueError("--select with at least one query is required for " + operation["Command"])
+        return operation
+
+
+    def exit_status(self, command, status_code):
+        '''
+        Works out the exit status for the status code a command got back.
+
+        Parameters:
+        ----------
+        command : string
+            The command which was run
+        status_code : int
+            The status code of the response
+
+        Return
+        ----------
+        exit_status : int
+            The exit status to report
+        '''
+        if status_code == REQUEST_COMMANDS.lookup(command).expected_status_code:
+            return self.EXIT_SUCCESS
+        elif 400 <= status_code < 500:
+            return self.EXIT_CLIENT_ERROR
+        elif 500 <= status_code < 600:
+            return self.EXIT_SERVER_ERROR
+        return self.EXIT_FAILURE
+
+
+    def run(self, rest_client, command, options, output = None, errors = None, result_writer = None):
+        '''
+        Runs a single command, printing the body of the response.
+
+        Parameters:
+        ----------
+        rest_client : RestClient
+            The rest client used to run the command
+        command : string
+            The command to run (GET, POST, UPDATE, or DELETE)
+        options : dict
+            The named options given on the command line
+        output : file
+            Where the body of the response is written (defaults to standard output)
+        errors : file
+            Where errors (and metrics, if measured) are written (defaults to standard error)
+        result_writer : ResultWriter
+            The writer to record the result with, rather than writing the body of the response
+
+        Return
+        ----------
+        exit_status : int
+            The exit status reflecting the result of the request
+        '''
+        output = sys.stdout if output is None else output
+        errors = sys.stderr if errors is None else errors
+
+        try:
+            operation = self.build_operation(command, options)
+        except ValueError as e:
+            errors.write("The command could not be built: " + str(e) + ".\n")
+            return self.EXIT_USAGE
+
+        try:
+            retrieved, response = self.script_runner.run_operation(rest_client, operation)
+        except Exception as e:
+            retrieved, response = False, "An unidentified error has occurred: " + str(e) + "."
+
+        if result_writer is not None:
+            result_writer.write(operation["Command"], operation["From"], (retrieved, response))
+            return self.exit_status(operation["Command"], response.status_code) if retrieved else self.EXIT_FAILURE
+
+        if not retrieved:
+            errors.write(str(response) + "\n")
+            return self.EXIT_FAILURE
+
+        if response.content:
+            output.write(response.content.decode("utf-8", "replace") + "\n")
+        status = self.exit_status(operation["Command"], response.status_code)
+        if status != self.EXIT_SUCCESS:
+            errors.write(str(response.status_code) + "\n")
+        if getattr(response, "metrics", None) is not None:
+            errors.write(response.metrics.describe() + "\n")
+        return status
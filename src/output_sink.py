@@ -0,0 +1,98 @@
+'''
+Gathers console output into large writes, so that printing many results does not cost a write and a
+flush per line.
+
+sammatime22, 2026
+'''
+import threading
+import time
+
+
+class BufferedSink:
+    '''
+    A buffered writer for a text stream. Text is held until the buffer reaches a size threshold or has
+    been held for a flush interval, then written out in one go.
+    '''
+
+
+    # Default flushing thresholds.
+    DEFAULT_MAX_BUFFER = 65536      # Default is flushing once 64 KiB of text is held
+    DEFAULT_FLUSH_INTERVAL = 0.5    # Default is flushing text held for half a second
+
+
+    max_buffer = DEFAULT_MAX_BUFFER
+    flush_interval = DEFAULT_FLUSH_INTERVAL
+
+
+    def __init__(self, stream, max_buffer = None, flush_interval = None):
+        '''
+        An initializer for the buffered sink.
+
+        Parameters
+        ----------
+        stream : file
+            The text stream to write to
+        max_buffer : int
+            The most characters to hold before flushing
+        flush_interval : float
+            The most seconds to hold text before flushing, checked as each write is made
+        '''
+        self.stream = stream
+        if max_buffer is not None:
+            self.max_buffer = max_buffer
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+
+        self.buffer = []
+        self.buffered = 0
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+
+    def isatty(self):
+        '''
+        Checks whether the stream written to is a terminal.
+
+        Return
+        ----------
+        isatty : boolean
+            Whether the stream is a terminal
+        '''
+        isatty = getattr(self.stream, "isatty", None)
+        return isatty is not None and isatty()
+
+
+    def write(self, text):
+        '''
+        Buffers text, flushing if either threshold has been reached.
+
+        Parameters
+        ----------
+        text : string
+            The text to write
+        '''
+        with self.lock:
+            self.buffer.append(text)
+            self.buffered += len(text)
+            if self.buffered >= self.max_buffer or time.monotonic() - self.last_flush >= self.flush_interval:
+                self.flush_buffer()
+
+
+    def flush(self):
+        '''
+        Writes out any text being held.
+        '''
+        with self.lock:
+            self.flush_buffer()
+
+
+    def flush_buffer(self):
+        '''
+        Writes out any text being held, with the lock already taken.
+        '''
+        if self.buffer:
+            self.stream.write("".join(self.buffer))
+            self.buffer = []
+            self.buffered = 0
+        self.stream.flush()
+        self.last_flush = time.monotonic()
@@ -0,0 +1,77 @@
+'''
+Checks records against the queries of a Select portion, in the way MatchaDB does.
+
+sammatime22, 2026
+'''
+
+
+class QueryMatcher:
+    '''
+    A matcher holding the meaning of each query operation, shared by the client-side filters of GET
+    results and the stand-in for MatchaDB, so that the two cannot disagree.
+    '''
+
+
+    # The operations a query may use.
+    EQUAL = ("is", "==", "=")
+    NOT_EQUAL = ("is not", "!=")
+    ORDERED = ("<", ">", "<=", ">=")
+    CONTAINS = "contains"
+
+
+    def matches_query(self, found, operation, value):
+        '''
+        Checks a value of a record against a single query. Ordering compares numbers where both sides
+        are numbers, and text otherwise.
+
+        Parameters
+        ----------
+        found : any
+            The value of the record under the key of the query
+        operation : string
+            The operation of the query
+        value : any
+            The value of the query
+
+        Return
+        ----------
+        matched : boolean
+            Whether the value satisfies the query
+        '''
+        if operation in self.EQUAL:
+            return str(found) == str(value)
+        elif operation in self.NOT_EQUAL:
+            return str(found) != str(value)
+        elif operation in self.ORDERED:
+            try:
+                found, value = float(found), float(value)
+            except (TypeError, ValueError):
+                found, value = str(found), str(value)
+            return {"<": found < value, ">": found > value, "<=": found <= value, ">=": found >= value}[operation]
+        elif operation == self.CONTAINS:
+            return str(value) in str(found)
+        raise ValueError("unknown operation " + str(operation))
+
+
+    def matches(self, record, select_portion):
+        '''
+        Checks a record against every query in a Select portion.
+
+        Parameters
+        ----------
+        record : any
+            The record to check (only objects can match a query)
+        select_portion : list
+            The queries, each of the form [key, operation, value]
+
+        Return
+        ----------
+        matched : boolean
+            Whether the record satisfies every query
+        '''
+        for key, operation, value in select_portion:
+            if not isinstance(record, dict) or key not in record:
+                return False
+            if not self.matches_query(record[key], operation, value):
+                return False
+        return True
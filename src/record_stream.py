@@ -0,0 +1,97 @@
+'''
+Reads the records of a GET result as they arrive, rather than once the whole body is in memory.
+
+sammatime22, 2026
+'''
+import codecs
+import json
+
+
+class RecordStream:
+    '''
+    An incremental reader for a JSON array of records, delivered as a series of byte chunks. Only the
+    record currently being read is held in memory, whatever the size of the array.
+    '''
+
+
+    # The characters which may separate the records of the array.
+    SEPARATORS = " \t\r\n,"
+
+
+    # The decoder used to read one record at a time.
+    decoder = json.JSONDecoder()
+
+
+    def iter_records(self, chunks):
+        '''
+        Yields each record of a JSON array as soon as it has been read in full. A body which is not an
+        array is yielded whole, as a single record.
+
+        Parameters
+        ----------
+        chunks : iterable of bytes
+            The body of the response, in chunks
+
+        Return
+        ----------
+        records : generator
+            The records of the array, in order
+        '''
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        position = 0
+        in_array = None
+
+        for chunk in chunks:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+            position = 0
+
+            # Work out whether this is an array from the first meaningful character.
+            if in_array is None:
+                stripped = buffer.lstrip()
+                if stripped == "":
+                    continue
+                in_array = stripped[0] == "["
+                if in_array:
+                    position = buffer.index("[") + 1
+            if not in_array:
+                continue
+
+            while True:
+                while position < len(buffer) and buffer[position] in self.SEPARATORS:
+                    position += 1
+                if position == len(buffer):
+                    break
+                if buffer[position] == "]":
+                    return
+                try:
+                    record, end = self.decoder.raw_decode(buffer, position)
+                except ValueError:
+                    # The record is cut off, so wait for the next chunk.
+                    break
+                if isinstance(record, (int, float)) and not isinstance(record, bool) and\
+                        (end == len(buffer) or buffer[end] not in self.SEPARATORS + "]"):
+                    # A bare number may continue into the next chunk (a cut "1e" reads as 1), so wait
+                    # until what follows it shows that it is whole.
+                    break
+                yield record
+                position = end
+
+        buffer = buffer[position:] + text_decoder.decode(b"", True)
+        if in_array is None:
+            return
+        if not in_array:
+            yield json.loads(buffer)
+            return
+
+        # Anything left must be the final record(s), followed by the end of the array.
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in self.SEPARATORS:
+                position += 1
+            if position < len(buffer) and buffer[position] == "]":
+                return
+            if position == len(buffer):
+                raise ValueError("The array of records was cut off.")
+            record, position = self.decoder.raw_decode(buffer, position)
+            yield record
@@ -0,0 +1,94 @@
+'''
+Builds the bodies of the requests made to MatchaDB, from the portions of a query.
+
+sammatime22, 2026
+'''
+import json
+
+# A faster JSON backend is used when it is installed, though it is not required.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class RequestBuilder:
+    '''
+    A builder used by the Rest Clients to turn the From, Select, Insert, and Update portions of a query
+    into a request body, serialized once as compact UTF-8 JSON.
+    '''
+
+
+    # The separators giving the most compact JSON from the json module.
+    COMPACT_SEPARATORS = (",", ":")
+
+
+    def to_structure(self, portion):
+        '''
+        Turns a portion of a query into a Python structure. Portions given as JSON strings (as scripts
+        and older callers provide them) are parsed, while structures are used as they are.
+
+        Parameters
+        ----------
+        portion : JSON Object
+            The portion, as a structure or as a JSON string
+
+        Return
+        ----------
+        structure : list OR dict
+            The portion as a Python structure
+        '''
+        if isinstance(portion, (str, bytes)):
+            return json.loads(portion)
+        return portion
+
+
+    def serialize(self, parameter_vals):
+        '''
+        Serializes the parameter values of a request. Values the faster backend cannot serialize (such
+        as integers beyond 64 bits) are left to the json module.
+
+        Parameters
+        ----------
+        parameter_vals : dict
+            The portions of the request, keyed by name
+
+        Return
+        ----------
+        body : bytes
+            The parameter values as compact UTF-8 JSON
+        '''
+        if orjson is not None:
+            try:
+                return orjson.dumps(parameter_vals)
+            except TypeError:
+                pass
+        return json.dumps(parameter_vals, separators = self.COMPACT_SEPARATORS, ensure_ascii = False).encode("utf-8")
+
+
+    def build_body(self, from_portion, select_portion, insert_portion = None, update_portion = None):
+        '''
+        Builds the body of a request.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
+        insert_portion : JSON Object
+            The Insert Portion for the query to be made on MatchaDB, for POST requests
+        update_portion : JSON Object
+            The Update Portion for the query to be made on MatchaDB, for PUT requests
+
+        Return
+        ----------
+        body : bytes
+            The body of the request
+        '''
+        parameter_vals = {"From": self.to_structure(from_portion), "Select": self.to_structure(select_portion)}
+        if insert_portion is not None:
+            parameter_vals["Insert"] = self.to_structure(insert_portion)
+        if update_portion is not None:
+            parameter_vals["Update"] = self.to_structure(update_portion)
+        return self.serialize(parameter_vals)
@@ -3,7 +3,14 @@ This file handles the entirety of the development of the REST calls to Matcha DB
 
 sammatime22, 2021-2022
 '''
+import gzip
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from instrumentation import Instrumentation, RequestMetrics
+from record_stream import RecordStream
+from request_builder import RequestBuilder
+from result_cache import ResultCache
 
 
 class RestClient():
@@ -16,14 +23,57 @@ class RestClient():
     DEFAULT_PROTOCOL = "http://"   # Default is http
     DEFAULT_HOST = "127.0.0.1"     # Default is localhost
     DEFAULT_PORT = "11150"          # Default is port 11150
+    DEFAULT_POOL_SIZE = 10          # Default is 10 kept-alive connections
+    DEFAULT_CHUNK_SIZE = 65536      # Default is reading streamed results 64 KiB at a time
+    DEFAULT_CONNECT_TIMEOUT = 5.0   # Default is waiting up to 5 seconds to connect
+    DEFAULT_READ_TIMEOUT = 30.0     # Default is waiting up to 30 seconds for each read of a response
+
+    # The headers sent with every request body, and with those that have been compressed.
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    GZIP_JSON_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+    # The compression level for request bodies, trading a little ratio for speed.
+    COMPRESS_LEVEL = 6
 
     # Class networking variables.
     protocol = DEFAULT_PROTOCOL
     host = DEFAULT_HOST
     port = DEFAULT_PORT
+    pool_size = DEFAULT_POOL_SIZE
+    connect_timeout = DEFAULT_CONNECT_TIMEOUT
+    read_timeout = DEFAULT_READ_TIMEOUT
+
+    # The most seconds an operation may take, across all of its attempts (no limit unless provided).
+    deadline = None
+
+    # The smallest request body, in bytes, which is compressed (none are unless provided).
+    compress_threshold = None
+
+    # The long-lived session shared by every request made by the client.
+    session = None
+
+    # The cache of GET results, if caching is turned on.
+    cache = None
+
+    # The builder turning the portions of a query into a request body.
+    request_builder = RequestBuilder()
+
+    # The collector of request metrics, if instrumentation is turned on.
+    instrumentation = None
+
+    # The policy for retrying failed requests, if retries are turned on.
+    retry_policy = None
+
+    # The replicas requests are spread across, if more than one endpoint is in use.
+    endpoint_pool = None
 
+    # The URL requests are sent to, worked out once, on the first request.
+    base_url = None
 
-    def __init__(self, protocol = None, host = None, port = None):
+
+    def __init__(self, protocol = None, host = None, port = None, pool_size = None, cache_size = None, cache_ttl = None,\
+                 instrument = None, retry_policy = None, connect_timeout = None, read_timeout = None,\
+                 deadline = None, compress_threshold = None, endpoint_pool = None):
         '''
         The constructor for the RestClient singleton.
 
@@ -35,6 +85,27 @@ class RestClient():
             The hostname/IP used of the Matcha DB
         general_color_choice : string
             The port used of the Matcha DB
+        pool_size : int
+            The number of kept-alive connections the client may hold open to the Matcha DB
+        cache_size : int
+            The number of GET results to cache (no caching unless provided)
+        cache_ttl : float
+            The number of seconds a cached GET result may be reused for
+        instrument : boolean
+            Whether every request is timed and measured
+        retry_policy : RetryPolicy
+            The policy for retrying requests that fail to connect or get a transient status code
+        connect_timeout : float
+            The most seconds to wait when connecting to the Matcha DB
+        read_timeout : float
+            The most seconds to wait for each read of a response from the Matcha DB
+        deadline : float
+            The most seconds an operation may take, including any retries and the waits between them
+        compress_threshold : int
+            The smallest request body, in bytes, to gzip before sending
+        endpoint_pool : EndpointPool
+            The replicas to spread reads across (and send writes to the primary of), in place of the
+            single protocol, host, and port
         '''
         if protocol is not None:
             self.protocol = protocol
@@ -42,6 +113,56 @@ class RestClient():
             self.host = host
         if port is not None:
             self.port = port
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if cache_size is not None:
+            self.cache = ResultCache(cache_size, cache_ttl)
+        if instrument:
+            self.instrumentation = Instrumentation()
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        if connect_timeout is not None:
+            self.connect_timeout = connect_timeout
+        if read_timeout is not None:
+            self.read_timeout = read_timeout
+        if deadline is not None:
+            self.deadline = deadline
+        if compress_threshold is not None:
+            self.compress_threshold = compress_threshold
+        if endpoint_pool is not None:
+            self.endpoint_pool = endpoint_pool
+            self.protocol, self.host, self.port = endpoint_pool.primary()
+        self.timeouts = (self.connect_timeout, self.read_timeout)
+        self.session = self.create_session()
+
+
+    def create_session(self):
+        '''
+        Creates the keep-alive session used for all requests, so that connections to the Matcha DB are
+        pooled and reused rather than opened and torn down on every command.
+
+        Return
+        ----------
+        session : requests.Session
+            The session, with a connection pool of pool_size mounted for http and https
+        '''
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections = self.pool_size, pool_maxsize = self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        # Time each new connection, when instrumented.
+        if self.instrumentation is not None:
+            adapter.poolmanager.pool_classes_by_scheme = self.instrumentation.timed_pool_classes()
+        return session
+
+
+    def close(self):
+        '''
+        Closes the session, releasing every pooled connection held by the client.
+        '''
+        if self.session is not None:
+            self.session.close()
 
     
     def get_protocol_host_port(self):
@@ -60,9 +181,283 @@ class RestClient():
         return self.protocol, self.host, self.port
 
 
+    def get_base_url(self):
+        '''
+        Returns the URL requests are sent to, building it on the first request only. Together with the
+        prebuilt headers and timeouts, this leaves only the body to be made for each request.
+
+        Return
+        ----------
+        base_url : string
+            The URL of the Matcha DB instance
+        '''
+        if self.base_url is None:
+            self.base_url = self.protocol + self.host + ":" + self.port + "/"
+        return self.base_url
+
+
+    def send(self, verb, body, stream = False):
+        '''
+        Sends a request over the session, retrying it as the retry policy (and the deadline) allows.
+        The number of retries made is kept on the response, as response.retries, or on the error raised
+        once they run out. A read which fails to connect is first tried on each other endpoint, if there
+        are several, without counting as a retry.
+
+        Parameters
+        ----------
+        verb : string
+            The session method to use (get, post, put, or delete)
+        body : bytes
+            The body of the request
+        stream : boolean
+            Whether to leave the body of the response unread
+
+        Return
+        ----------
+        response : response object
+            The response to the request
+        '''
+        deadline_at = None if self.deadline is None else time.monotonic() + self.deadline
+        body, headers = self.encode_body(body)
+        attempt = 1
+        tried = []
+        while True:
+            try:
+                response = self.send_to_endpoint(verb, body, stream, self.timeout_for(deadline_at), headers, tried)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # Only a failure to connect moves on to another endpoint, and never past the deadline.
+                if self.endpoint_pool is not None and isinstance(e, requests.exceptions.ConnectionError)\
+                        and (deadline_at is None or time.monotonic() < deadline_at)\
+                        and self.endpoint_pool.can_fail_over(verb, tried):
+                    continue
+                wait = self.retry_wait(verb, attempt, None, deadline_at)
+                if wait is None:
+                    e.retries = attempt - 1
+                    raise
+            else:
+                wait = self.retry_wait(verb, attempt, response.status_code, deadline_at)
+                if wait is None:
+                    response.retries = attempt - 1
+                    return response
+                response.close()
+
+            time.sleep(wait)
+            attempt += 1
+            tried = []
+
+
+    def send_to_endpoint(self, verb, body, stream, timeout, headers, tried):
+        '''
+        Sends one attempt of a request to the endpoint chosen for it, if there are several, noting the
+        endpoint as tried should it fail to connect.
+
+        Parameters
+        ----------
+        verb : string
+            The session method to use (get, post, put, or delete)
+        body : bytes
+            The body of the request
+        stream : boolean
+            Whether to leave the body of the response unread
+        timeout : tuple of float
+            The connect and read timeouts
+        headers : dict
+            The headers to send
+        tried : list
+            The URLs this request has already failed to connect to
+
+        Return
+        ----------
+        response : response object
+            The response to the request
+        '''
+        if self.endpoint_pool is None:
+            return self.send_once(verb, body, stream, timeout, headers)
+
+        url = self.endpoint_pool.choose(verb, tried)
+        reached = True
+        try:
+            return self.send_once(verb, body, stream, timeout, headers, url)
+        except requests.exceptions.ConnectionError:
+            reached = False
+            tried.append(url)
+            raise
+        finally:
+            self.endpoint_pool.release(url, reached)
+
+
+    def encode_body(self, body):
+        '''
+        Compresses a request body if it is at least the compression threshold, as small bodies gain
+        little from it. Responses need no such step, as the session already asks for them compressed
+        and decompresses them as they are read.
+
+        Parameters
+        ----------
+        body : bytes
+            The body of the request
+
+        Return
+        ----------
+        body : bytes
+            The body to send
+        headers : dict
+            The headers to send it with
+        '''
+        if self.compress_threshold is not None and len(body) >= self.compress_threshold:
+            return gzip.compress(body, self.COMPRESS_LEVEL), self.GZIP_JSON_HEADERS
+        return body, self.JSON_HEADERS
+
+
+    def timeout_for(self, deadline_at):
+        '''
+        Works out the timeouts of the next attempt, so that it cannot outlast the deadline.
+
+        Parameters
+        ----------
+        deadline_at : float
+            The time.monotonic() by which the operation must finish, or None if there is no deadline
+
+        Return
+        ----------
+        timeout : tuple of float
+            The connect and read timeouts for the attempt
+        '''
+        if deadline_at is None:
+            return self.timeouts
+
+        remaining = deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("The deadline of " + str(self.deadline) + "s has passed.")
+        return tuple(remaining if timeout is None else min(timeout, remaining)\
+                     for timeout in (self.connect_timeout, self.read_timeout))
+
+
+    def retry_wait(self, verb, attempt, status_code, deadline_at):
+        '''
+        Decides whether a failed attempt is made again, and how long to wait first.
+
+        Parameters
+        ----------
+        verb : string
+            The session method of the request (get, post, put, or delete)
+        attempt : int
+            The number of attempts made so far
+        status_code : int
+            The status code of the response, or None if the request failed to connect or timed out
+        deadline_at : float
+            The time.monotonic() by which the operation must finish, or None if there is no deadline
+
+        Return
+        ----------
+        wait : float OR None
+            The number of seconds to wait before retrying, or None if the attempt is not retried
+        '''
+        if self.retry_policy is None or not self.retry_policy.should_retry(verb, attempt, status_code):
+            return None
+        wait = self.retry_policy.backoff(attempt)
+        if deadline_at is not None and time.monotonic() + wait >= deadline_at:
+            return None
+        return wait
+
+
+    def send_once(self, verb, body, stream = False, timeout = None, headers = None, url = None):
+        '''
+        Sends a request over the session once, measuring it if instrumentation is turned on. The metrics
+        of an instrumented request are kept on the response, as response.metrics.
+
+        Parameters
+        ----------
+        verb : string
+            The session method to use (get, post, put, or delete)
+        body : bytes
+            The body of the request
+        stream : boolean
+            Whether to leave the body of the response unread
+        timeout : tuple of float
+            The connect and read timeouts (the client's own, unless provided)
+        headers : dict
+            The headers to send (the JSON content type, unless provided)
+        url : string
+            The URL to send to (the client's own endpoint, unless provided)
+
+        Return
+        ----------
+        response : response object
+            The response to the request
+        '''
+        if timeout is None:
+            timeout = self.timeouts
+        if headers is None:
+            headers = self.JSON_HEADERS
+        if url is None:
+            url = self.get_base_url()
+        request = getattr(self.session, verb)
+        if self.instrumentation is None:
+            return request(url, data = body, headers = headers, stream = stream, timeout = timeout)
+
+        metrics = RequestMetrics(verb.upper(), len(body))
+        self.instrumentation.begin()
+        began = metrics.started = time.perf_counter()
+        try:
+            response = request(url, data = body, headers = headers, stream = stream, timeout = timeout)
+        except Exception:
+            metrics.connect = self.instrumentation.connect_time()
+            metrics.total = time.perf_counter() - began
+            self.instrumentation.record(metrics)
+            raise
+
+        metrics.connect = self.instrumentation.connect_time()
+        metrics.time_to_first_byte = response.elapsed.total_seconds()
+        metrics.status_code = response.status_code
+        response.metrics = metrics
+        if not stream:
+            metrics.bytes_received = len(response.content)
+            metrics.total = time.perf_counter() - began
+            self.instrumentation.record(metrics)
+        return response
+
+
+    def failure_statement(self, statement, error):
+        '''
+        Describes a request that failed to connect or timed out, along with the retries made before
+        giving up.
+
+        Parameters
+        ----------
+        statement : string
+            The statement describing the kind of failure
+        error : requests.exceptions.RequestException
+            The error raised by send
+
+        Return
+        ----------
+        statement : string
+            The statement describing the error
+        '''
+        retries = getattr(error, "retries", 0)
+        if retries > 0:
+            return statement + " after " + str(retries) + (" retry." if retries == 1 else " retries.")
+        return statement + "."
+
+
+    def invalidate_cache(self, from_portion):
+        '''
+        Drops any cached GET results for a table that has just been written to.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion of the write made on MatchaDB
+        '''
+        if self.cache is not None:
+            self.cache.invalidate(from_portion)
+
+
     def get_request(self, from_portion, select_portion):
         '''
-        Runs a get request against the DB.
+        Runs a get request against the DB. If caching is turned on, a recent result for the same query
+        is returned without going to the DB.
 
         Parameters
         ----------
@@ -78,19 +473,105 @@ class RestClient():
         response OR statement : response object OR string
             The response object or a statement containing the error
         '''
-        parameter_vals = "{\"From\": " + from_portion + ", \"Select\": " + select_portion + "}"
+        try:
+            body = self.request_builder.build_body(from_portion, select_portion)
+            if self.cache is not None:
+                cached_response = self.cache.get(from_portion, select_portion)
+                if cached_response is not None:
+                    return True, cached_response
 
+            # Make the request and see the response code.
+            response = self.send("get", body)
+            if self.cache is not None and response.status_code == 200:
+                self.cache.put(from_portion, select_portion, response)
+            return True, response
+        except requests.exceptions.Timeout as e:
+            return False, self.failure_statement("A timeout has occurred", e)
+        except requests.exceptions.ConnectionError as e:
+            return False, self.failure_statement("A connection error has occurred", e)
+        except Exception as e:
+            return False, "An unidentified error has occurred: " + str(e) + "."
+
+
+    def stream_get_request(self, from_portion, select_portion):
+        '''
+        Runs a get request against the DB without reading the body of the response, so that it can be
+        read incrementally with iter_chunks or iter_records. Streamed results are never cached.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From Portion for the query to be made on MatchaDB
+        select_portion : JSON Object
+            The Select Portion for the query to be made on MatchaDB
 
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : response object OR string
+            The response object, with its body unread, or a statement containing the error
+        '''
         try:
-            # Make the request and see the response code.
-            response = requests.get(self.protocol + self.host + ":" + self.port + "/", data = repr(parameter_vals))
+            body = self.request_builder.build_body(from_portion, select_portion)
+            response = self.send("get", body, stream = True)
             return True, response
-        except requests.exceptions.ConnectionError:
-            return False, "A connection error has occurred."
+        except requests.exceptions.Timeout as e:
+            return False, self.failure_statement("A timeout has occurred", e)
+        except requests.exceptions.ConnectionError as e:
+            return False, self.failure_statement("A connection error has occurred", e)
         except Exception as e:
             return False, "An unidentified error has occurred: " + str(e) + "."
 
 
+    def iter_chunks(self, response, chunk_size = None):
+        '''
+        Reads the body of a streamed response in chunks, releasing the connection once done.
+
+        Parameters
+        ----------
+        response : response object
+            A response from stream_get_request
+        chunk_size : int
+            The most bytes to read at a time
+
+        Return
+        ----------
+        chunks : generator of bytes
+            The body of the response, in chunks
+        '''
+        metrics = getattr(response, "metrics", None)
+        try:
+            for chunk in response.iter_content(chunk_size or self.DEFAULT_CHUNK_SIZE):
+                if metrics is not None:
+                    metrics.bytes_received += len(chunk)
+                yield chunk
+        finally:
+            response.close()
+            if metrics is not None:
+                metrics.total = time.perf_counter() - metrics.started
+                self.instrumentation.record(metrics)
+
+
+    def iter_records(self, response, chunk_size = None):
+        '''
+        Reads the records of a streamed response as they arrive, releasing the connection once done.
+
+        Parameters
+        ----------
+        response : response object
+            A response from stream_get_request, whose body is a JSON array of records
+        chunk_size : int
+            The most bytes to read at a time
+
+        Return
+        ----------
+        records : generator
+            The records of the response, in order
+        '''
+        return RecordStream().iter_records(self.iter_chunks(response, chunk_size))
+
+
     def post_request(self, from_portion, select_portion, insert_portion):
         '''
         Runs a post request against the DB.
@@ -111,16 +592,18 @@ class RestClient():
         response OR statement : response object OR string
             The response object or a statement containing the error
         '''
-        parameter_vals = "{\"From\": " + from_portion + ", \"Select\": " + select_portion + ", \"Insert\": " + insert_portion + "}"
-
-
         try:
-            response = requests.post(self.protocol + self.host + ":" + self.port + "/", data = repr(parameter_vals))
+            body = self.request_builder.build_body(from_portion, select_portion, insert_portion = insert_portion)
+            response = self.send("post", body)
             return True, response
-        except requests.exceptions.ConnectionError:
-            return False, "A connection error has occurred."
+        except requests.exceptions.Timeout as e:
+            return False, self.failure_statement("A timeout has occurred", e)
+        except requests.exceptions.ConnectionError as e:
+            return False, self.failure_statement("A connection error has occurred", e)
         except Exception as e:
             return False, "An unidentified error has occurred: " + str(e) + "."
+        finally:
+            self.invalidate_cache(from_portion)
 
 
     def update_request(self, from_portion, select_portion, update_portion):
@@ -143,16 +626,18 @@ class RestClient():
         response OR statement : response object OR string
             The response object or a statement containing the error
         '''
-        parameter_vals = "{\"From\": " + from_portion + ", \"Select\": " + select_portion + ", \"Update\": " + update_portion + "}"
-
-
         try:
-            response = requests.put(self.protocol + self.host + ":" + self.port + "/", data = repr(parameter_vals))
+            body = self.request_builder.build_body(from_portion, select_portion, update_portion = update_portion)
+            response = self.send("put", body)
             return True, response
-        except requests.exceptions.ConnectionError:
-            return False, "A connection error has occurred."
+        except requests.exceptions.Timeout as e:
+            return False, self.failure_statement("A timeout has occurred", e)
+        except requests.exceptions.ConnectionError as e:
+            return False, self.failure_statement("A connection error has occurred", e)
         except Exception as e:
             return False, "An unidentified error has occurred: " + str(e) + "."
+        finally:
+            self.invalidate_cache(from_portion)
 
 
     def delete_request(self, from_portion, select_portion):
@@ -173,13 +658,15 @@ class RestClient():
         response OR statement : response object OR string
             The response object or a statement containing the error
         '''
-        parameter_vals = "{\"From\": " + from_portion + ", \"Select\": " + select_portion + "}"
-
-
         try:
-            response = requests.delete(self.protocol + self.host + ":" + self.port + "/", data = repr(parameter_vals))
+            body = self.request_builder.build_body(from_portion, select_portion)
+            response = self.send("delete", body)
             return True, response
-        except requests.exceptions.ConnectionError:
-            return False, "A connection error has occurred."
+        except requests.exceptions.Timeout as e:
+            return False, self.failure_statement("A timeout has occurred", e)
+        except requests.exceptions.ConnectionError as e:
+            return False, self.failure_statement("A connection error has occurred", e)
         except Exception as e:
             return False, "An unidentified error has occurred: " + str(e) + "."
+        finally:
+            self.invalidate_cache(from_portion)
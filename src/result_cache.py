@@ -0,0 +1,181 @@
+'''
+Keeps the results of recent GET requests, so that repeated queries need not go back to MatchaDB.
+
+sammatime22, 2026
+'''
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    '''
+    A size-bounded, least-recently-used cache of GET results, keyed on the normalized From and Select
+    portions of the query. Entries expire after a time to live, and every entry for a table can be
+    dropped at once when that table is written to.
+    '''
+
+
+    # Default cache settings.
+    DEFAULT_MAX_ENTRIES = 128
+    DEFAULT_TTL = 30.0   # Default is 30 seconds
+
+
+    max_entries = DEFAULT_MAX_ENTRIES
+    ttl = DEFAULT_TTL
+
+
+    def __init__(self, max_entries = None, ttl = None):
+        '''
+        An initializer for the result cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            The most results to hold before the least recently used is evicted
+        ttl : float
+            The number of seconds a result may be served from the cache
+        '''
+        if max_entries is not None:
+            self.max_entries = max_entries
+        if ttl is not None:
+            self.ttl = ttl
+
+        # Key -> (table, expiry, result), ordered from least to most recently used.
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+
+    def normalize(self, portion):
+        '''
+        Normalizes a portion of a query, so that queries differing only in formatting share an entry.
+
+        Parameters
+        ----------
+        portion : JSON Object
+            The portion, as a JSON string or a structure that can be rendered as JSON
+
+        Return
+        ----------
+        normalized : string
+            The portion as compact JSON with sorted keys (or as given, if it is not JSON)
+        '''
+        if isinstance(portion, str):
+            try:
+                portion = json.loads(portion)
+            except ValueError:
+                return portion
+        return json.dumps(portion, sort_keys = True, separators = (",", ":"))
+
+
+    def table_of(self, from_portion):
+        '''
+        Finds the table a From portion refers to.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From portion of a query
+
+        Return
+        ----------
+        table : string
+            The name of the table
+        '''
+        normalized = self.normalize(from_portion)
+        try:
+            return json.loads(normalized)[0]
+        except (ValueError, IndexError, KeyError, TypeError):
+            return normalized
+
+
+    def make_key(self, from_portion, select_portion):
+        '''
+        Makes the key a query is cached under.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From portion of the query
+        select_portion : JSON Object
+            The Select portion of the query
+
+        Return
+        ----------
+        key : tuple
+            The key for the query
+        '''
+        return self.normalize(from_portion), self.normalize(select_portion)
+
+
+    def get(self, from_portion, select_portion):
+        '''
+        Looks up the result of a query, marking it as recently used.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From portion of the query
+        select_portion : JSON Object
+            The Select portion of the query
+
+        Return
+        ----------
+        result : any, None on a miss
+            The cached result, or None if there is none or it has expired
+        '''
+        key = self.make_key(from_portion, select_portion)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[2]
+
+
+    def put(self, from_portion, select_portion, result):
+        '''
+        Stores the result of a query, evicting the least recently used result if the cache is full.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From portion of the query
+        select_portion : JSON Object
+            The Select portion of the query
+        result : any
+            The result to store
+        '''
+        key = self.make_key(from_portion, select_portion)
+        with self.lock:
+            self.entries[key] = (self.table_of(from_portion), time.monotonic() + self.ttl, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last = False)
+
+
+    def invalidate(self, from_portion):
+        '''
+        Drops every result for the table a From portion refers to.
+
+        Parameters
+        ----------
+        from_portion : JSON Object
+            The From portion of the write made to the table
+        '''
+        table = self.table_of(from_portion)
+        with self.lock:
+            for key in [key for key, entry in self.entries.items() if entry[0] == table]:
+                del self.entries[key]
+
+
+    def clear(self):
+        '''
+        Drops every result held by the cache.
+        '''
+        with self.lock:
+            self.entries.clear()
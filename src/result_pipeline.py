@@ -0,0 +1,207 @@
+'''
+Trims the records of a GET result on the client side, as they are read, before they are displayed.
+
+sammatime22, 2026
+'''
+import heapq
+import itertools
+import json
+from query_matcher import QueryMatcher
+
+
+class ResultPipeline:
+    '''
+    A chain of generators run over the records of a GET result: filtering, projecting onto chosen
+    fields, dropping duplicates, sorting, and limiting, in that order. Records are pulled through one at
+    a time, so only those which survive are held or displayed. Sorting must see every record before the
+    first is yielded, but with a limit only the leading records are kept while it does so. Each record is
+    sorted by its whole self rather than its projection, so the sort field need not be among the fields.
+    '''
+
+
+    # The prefix of a sort field which sorts in descending order.
+    DESCENDING_PREFIX = "-"
+
+
+    # The matcher giving each filter operation the meaning MatchaDB gives it.
+    query_matcher = QueryMatcher()
+
+
+    fields = None
+    filters = None
+    sort_field = None
+    descending = False
+    distinct = False
+    limit = None
+
+
+    def __init__(self, fields = None, filters = None, sort_field = None, distinct = None, limit = None):
+        '''
+        An initializer for the result pipeline.
+
+        Parameters
+        ----------
+        fields : list
+            The fields to keep of each record (all of them unless provided)
+        filters : list
+            The queries each record must satisfy, each as [key, operation, value]
+        sort_field : string
+            The field to sort records on, prefixed with "-" to sort in descending order
+        distinct : boolean
+            Whether to drop records which repeat one already yielded
+        limit : int
+            The most records to yield
+        '''
+        if fields is not None:
+            self.fields = fields
+        if filters is not None:
+            self.filters = filters
+        if sort_field is not None:
+            if sort_field.startswith(self.DESCENDING_PREFIX):
+                sort_field = sort_field[len(self.DESCENDING_PREFIX):]
+                self.descending = True
+            self.sort_field = sort_field
+        if distinct is not None:
+            self.distinct = distinct
+        if limit is not None:
+            if limit < 0:
+                raise ValueError("The limit must not be negative.")
+            self.limit = limit
+
+
+    def matches(self, record):
+        '''
+        Checks a record against every filter, in the way MatchaDB checks a Select portion.
+
+        Parameters
+        ----------
+        record : any
+            The record to check
+
+        Return
+        ----------
+        matched : boolean
+            Whether the record satisfies every filter
+        '''
+        return self.query_matcher.matches(record, self.filters)
+
+
+    def project(self, record):
+        '''
+        Cuts a record down to the chosen fields. Records which are not objects are left as they are.
+
+        Parameters
+        ----------
+        record : any
+            The record to cut down
+
+        Return
+        ----------
+        record : any
+            The record, holding only the chosen fields it has
+        '''
+        if not isinstance(record, dict):
+            return record
+        return {field: record[field] for field in self.fields if field in record}
+
+
+    def sort_key(self, record):
+        '''
+        Works out where a record sorts. Numbers sort before other values, and records without the sort
+        field sort after both (so they come first in descending order).
+
+        Parameters
+        ----------
+        record : any
+            The record to place
+
+        Return
+        ----------
+        key : tuple
+            The key the record sorts by
+        '''
+        if not isinstance(record, dict) or self.sort_field not in record:
+            return (2, 0, "")
+        value = record[self.sort_field]
+        try:
+            return (0, float(value), "")
+        except (TypeError, ValueError):
+            return (1, 0, value if isinstance(value, str) else json.dumps(value, sort_keys = True))
+
+
+    def iter_distinct(self, records):
+        '''
+        Yields each record which does not repeat one already yielded.
+
+        Parameters
+        ----------
+        records : iterable
+            The projected records to check, each beside its whole record
+
+        Return
+        ----------
+        records : generator
+            The records, without repeats
+        '''
+        seen = set()
+        for projected, record in records:
+            identity = json.dumps(projected, sort_keys = True)
+            if identity not in seen:
+                seen.add(identity)
+                yield projected, record
+
+
+    def iter_sorted(self, records):
+        '''
+        Yields the records in order of the sort field, keeping only the leading records if limited.
+
+        Parameters
+        ----------
+        records : iterable
+            The projected records to sort, each beside its whole record (which is sorted on)
+
+        Return
+        ----------
+        records : generator
+            The records, in order
+        '''
+        key = lambda pair: self.sort_key(pair[1])
+        if self.limit is not None:
+            select = heapq.nlargest if self.descending else heapq.nsmallest
+            yield from select(self.limit, records, key = key)
+        else:
+            yield from sorted(records, key = key, reverse = self.descending)
+
+
+    def process(self, records):
+        '''
+        Runs records through each stage of the pipeline which has been asked for.
+
+        Parameters
+        ----------
+        records : iterable
+            The records of the result, as they are read
+
+        Return
+        ----------
+        records : iterator
+            The records which survive, trimmed as asked
+        '''
+        records = iter(records)
+        if self.filters:
+            records = (record for record in records if self.matches(record))
+
+        # Keep each whole record beside its projection until it has been sorted.
+        if self.fields:
+            records = ((self.project(record), record) for record in records)
+        else:
+            records = ((record, record) for record in records)
+        if self.distinct:
+            records = self.iter_distinct(records)
+        if self.sort_field is not None:
+            records = self.iter_sorted(records)
+        records = (projected for projected, record in records)
+
+        if self.limit is not None:
+            records = itertools.islice(records, self.limit)
+        return records
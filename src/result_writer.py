@@ -0,0 +1,116 @@
+'''
+Writes the result of each operation as a machine-readable record, for other tools to read.
+
+sammatime22, 2026
+'''
+import csv
+import json
+import sys
+from output_sink import BufferedSink
+
+
+class ResultWriter:
+    '''
+    A writer emitting one record per operation, as a JSON line or a CSV row (after a header row). Each
+    record holds the verb, table, status code, latency, and body of the response, with no coloring.
+    Records are written through a buffered sink.
+    '''
+
+
+    # The formats records may be written in.
+    JSONL = "jsonl"
+    CSV = "csv"
+    FORMATS = (JSONL, CSV)
+
+
+    # The fields of each record, in order.
+    FIELDS = ("verb", "table", "status", "latency_ms", "body")
+
+
+    def __init__(self, output_format, stream = None, output_path = None):
+        '''
+        An initializer for the result writer.
+
+        Parameters
+        ----------
+        output_format : string
+            The format to write records in (jsonl or csv)
+        stream : file
+            The text stream to write records to (defaults to standard output)
+        output_path : string
+            The path of a file to write records to instead, which the writer opens and closes
+        '''
+        if output_format not in self.FORMATS:
+            raise ValueError("The output format must be one of " + ", ".join(self.FORMATS) + ".")
+        self.output_format = output_format
+        self.output_file = None
+        if output_path is not None:
+            stream = self.output_file = open(output_path, "w", newline = "", encoding = "utf-8")
+        self.sink = BufferedSink(sys.stdout if stream is None else stream)
+        self.csv_writer = None
+        if output_format == self.CSV:
+            self.csv_writer = csv.writer(self.sink, lineterminator = "\n")
+            self.csv_writer.writerow(self.FIELDS)
+
+
+    def describe(self, verb, from_portion, result):
+        '''
+        Describes the result of an operation as the values of a record.
+
+        Parameters
+        ----------
+        verb : string
+            The command of the operation (GET, POST, UPDATE, or DELETE)
+        from_portion : list OR string
+            The From portion of the operation
+        result : tuple
+            The retrieval status and the response (or a statement containing the error)
+
+        Return
+        ----------
+        values : tuple
+            The values of the record, in the order of the fields
+        '''
+        table = from_portion[0] if isinstance(from_portion, list) and from_portion else from_portion
+        retrieved, response = result
+        if not retrieved:
+            return verb, table, None, None, str(response)
+
+        metrics = getattr(response, "metrics", None)
+        if metrics is not None and metrics.total is not None:
+            latency = metrics.total
+        else:
+            latency = response.elapsed.total_seconds()
+        body = response.content
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "replace")
+        return verb, table, response.status_code, round(latency * 1000, 3), body
+
+
+    def write(self, verb, from_portion, result):
+        '''
+        Writes the record for the result of an operation.
+
+        Parameters
+        ----------
+        verb : string
+            The command of the operation (GET, POST, UPDATE, or DELETE)
+        from_portion : list OR string
+            The From portion of the operation
+        result : tuple
+            The retrieval status and the response (or a statement containing the error)
+        '''
+        values = self.describe(verb, from_portion, result)
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(values)
+        else:
+            self.sink.write(json.dumps(dict(zip(self.FIELDS, values))) + "\n")
+
+
+    def close(self):
+        '''
+        Writes out any records being held, closing the file written to if the writer opened it.
+        '''
+        self.sink.flush()
+        if self.output_file is not None:
+            self.output_file.close()
@@ -0,0 +1,109 @@
+'''
+Decides when a failed request to MatchaDB is worth making again, and how long to wait before it is.
+
+sammatime22, 2026
+'''
+import random
+
+
+class RetryPolicy:
+    '''
+    A retry policy with capped exponential backoff. By default only the idempotent methods (GET, PUT,
+    and DELETE) are retried, as a POST that failed part way may already have inserted its records.
+    '''
+
+
+    # Default retry settings.
+    DEFAULT_MAX_ATTEMPTS = 3                        # Default is the first attempt and two retries
+    DEFAULT_BACKOFF_BASE = 0.1                      # Default is waiting up to 0.1s before the first retry
+    DEFAULT_BACKOFF_CAP = 2.0                       # Default is never waiting over 2s
+    DEFAULT_RETRY_STATUS_CODES = (429, 502, 503, 504)
+    DEFAULT_RETRY_VERBS = ("get", "put", "delete")
+
+
+    max_attempts = DEFAULT_MAX_ATTEMPTS
+    backoff_base = DEFAULT_BACKOFF_BASE
+    backoff_cap = DEFAULT_BACKOFF_CAP
+    jitter = True
+    retry_status_codes = DEFAULT_RETRY_STATUS_CODES
+    retry_verbs = DEFAULT_RETRY_VERBS
+
+
+    def __init__(self, max_attempts = None, backoff_base = None, backoff_cap = None, jitter = None,\
+                 retry_status_codes = None, retry_verbs = None):
+        '''
+        An initializer for the retry policy.
+
+        Parameters
+        ----------
+        max_attempts : int
+            The most times a request is made, including the first attempt
+        backoff_base : float
+            The number of seconds waited before the first retry, doubling for each retry after
+        backoff_cap : float
+            The most seconds waited before any retry
+        jitter : boolean
+            Whether each wait is drawn at random from up to its full length, so that many clients
+            retrying at once spread out rather than retrying in step
+        retry_status_codes : tuple of int
+            The status codes which are retried
+        retry_verbs : tuple of string
+            The session methods (get, post, put, or delete) which are retried
+        '''
+        if max_attempts is not None:
+            if max_attempts < 1:
+                raise ValueError("The maximum number of attempts must be at least 1.")
+            self.max_attempts = max_attempts
+        if backoff_base is not None:
+            self.backoff_base = backoff_base
+        if backoff_cap is not None:
+            self.backoff_cap = backoff_cap
+        if jitter is not None:
+            self.jitter = jitter
+        if retry_status_codes is not None:
+            self.retry_status_codes = tuple(retry_status_codes)
+        if retry_verbs is not None:
+            self.retry_verbs = tuple(verb.lower() for verb in retry_verbs)
+
+
+    def should_retry(self, verb, attempt, status_code = None):
+        '''
+        Decides whether a failed attempt should be made again.
+
+        Parameters
+        ----------
+        verb : string
+            The session method of the request (get, post, put, or delete)
+        attempt : int
+            The number of attempts made so far
+        status_code : int
+            The status code of the response, or None if the request failed to connect
+
+        Return
+        ----------
+        retry : boolean
+            Whether to make the request again
+        '''
+        if attempt >= self.max_attempts or verb not in self.retry_verbs:
+            return False
+        return status_code is None or status_code in self.retry_status_codes
+
+
+    def backoff(self, attempt):
+        '''
+        Works out how long to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt : int
+            The number of attempts made so far
+
+        Return
+        ----------
+        seconds : float
+            The number of seconds to wait
+        '''
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
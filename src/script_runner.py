@@ -0,0 +1,155 @@
+'''
+Replays a script of fully-specified operations against MatchaDB, without prompting the user.
+
+sammatime22, 2026
+'''
+import json
+from batch_executor import BatchExecutor
+from command_registry import REQUEST_COMMANDS
+
+
+class ScriptRunner:
+    '''
+    A runner used to feed a file of operations straight into the Rest Client. Each line of the file is
+    one JSON object holding a "Command" along with the portions that command would have prompted for,
+    for example:
+
+        {"Command": "GET", "From": ["Ice Cream"], "Select": [["Flavor", "is", "Mint"]]}
+        {"Command": "POST", "From": ["Ice Cream"], "Select": [], "Insert": {"Flavor": "Mint"}}
+    '''
+
+
+    # Different constants for the names of the commands a script may use.
+    GET = "GET"
+    POST = "POST"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
+
+
+    def load_operations(self, script_path):
+        '''
+        Lazily reads the operations from a script file, one per line. Blank lines are skipped.
+
+        Parameters:
+        ----------
+        script_path : string
+            The path to the script file
+
+        Return
+        ----------
+        operations : generator of (int, dict OR None, string OR None)
+            The line number, the operation (None if unreadable), and an error statement if unreadable
+        '''
+        with open(script_path) as script_file:
+            for line_number, line in enumerate(script_file, 1):
+                line = line.strip()
+                if line == "":
+                    continue
+                try:
+                    operation = json.loads(line)
+                    if not isinstance(operation, dict):
+                        raise ValueError("an operation must be a JSON object")
+                    yield line_number, operation, None
+                except ValueError as e:
+                    yield line_number, None, "Line " + str(line_number) + " could not be read: " + str(e) + "."
+
+
+    def run_operation(self, rest_client, operation):
+        '''
+        Runs a single operation against MatchaDB.
+
+        Parameters:
+        ----------
+        rest_client : RestClient
+            The rest client used to run the operation
+        operation : dict
+            The operation, holding the Command, From, Select, and Insert/Update portions as needed
+
+        Return
+        ----------
+        retrieval_status : boolean
+            The retrieval_status of the request (successful - True, unsuccessful - False)
+        response OR statement : response object OR string
+            The response object or a statement containing the error
+        '''
+        command = REQUEST_COMMANDS.lookup(str(operation.get("Command", "")))
+        if command is None:
+            return False, "The command provided was not recognized: " + str(operation.get("Command")) + "."
+
+        # A lone table name is taken as the only entry of the From portion.
+        from_portion = operation.get("From", [])
+        if isinstance(from_portion, str):
+            from_portion = [from_portion]
+        select_portion = operation.get("Select", [])
+        return command.send(rest_client, from_portion, select_portion, operation)
+
+
+    def run_script(self, whisk_display, rest_client, script_path, concurrency = None, result_writer = None):
+        '''
+        Runs every operation in a script, printing one result line per operation in script order (or,
+        given a result writer, writing one record per operation instead).
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        rest_client : RestClient
+            The rest client used to run the operations
+        script_path : string
+            The path to the script file
+        concurrency : int
+            The maximum number of operations to have in flight at once (defaults to one at a time)
+        result_writer : ResultWriter
+            The writer to record the result of each operation with, rather than printing it
+
+        Return
+        ----------
+        failures : int
+            The number of operations that did not succeed
+        '''
+        def run_entry(entry):
+            line_number, operation, error = entry
+            if operation is None:
+                return False, error
+            try:
+                return self.run_operation(rest_client, operation)
+            except Exception as e:
+                return False, "An unidentified error has occurred: " + str(e) + "."
+
+        failures = 0
+        try:
+            executor = BatchExecutor(concurrency)
+            for entry, result in executor.execute(run_entry, self.load_operations(script_path)):
+                line_number, operation, error = entry
+                retrieved, response = result
+                if operation is None:
+                    whisk_display.print_error(error)
+                    failures += 1
+                    continue
+
+                command = str(operation.get("Command", "")).upper()
+                if result_writer is not None:
+                    result_writer.write(command, operation.get("From", []), result)
+                    if not retrieved or response.status_code != REQUEST_COMMANDS.lookup(command).expected_status_code:
+                        failures += 1
+                    continue
+
+                prefix = str(line_number) + " " + command + " "
+                if retrieved:
+                    succeeded = response.status_code == REQUEST_COMMANDS.lookup(command).expected_status_code
+                    whisk_display.print_response(succeeded, prefix + str(response.status_code) + " : " +\
+                                                 str(response.content), getattr(response, "metrics", None))
+                    if not succeeded:
+                        failures += 1
+                else:
+                    whisk_display.print_error(prefix + response)
+                    failures += 1
+        except (IOError, OSError) as e:
+            whisk_display.print_error("The script could not be opened: " + str(e) + ".")
+            failures += 1
+
+        # Summarize the script's requests, if they were measured.
+        if getattr(rest_client, "instrumentation", None) is not None:
+            for line in rest_client.instrumentation.summarize():
+                whisk_display.print_general(line)
+        return failures
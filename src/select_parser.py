@@ -0,0 +1,57 @@
+'''
+Reads Select (and Update) portions written on one line, such as "Price,>=,2; Flavor,is,Mint".
+
+sammatime22, 2026
+'''
+
+
+class SelectParser:
+    '''
+    A parser for the compact, one-line form of a Select or Update portion. Each query is written as
+    key,operation,value and queries are separated by semicolons, so that several queries (all of which
+    must hold) can be sent for MatchaDB to filter on, rather than filtering what comes back.
+    '''
+
+
+    # The separator between the queries of a portion, and between the parts of a query.
+    QUERY_SEPARATOR = ";"
+    PART_SEPARATOR = ","
+
+
+    def parse_query(self, query_text):
+        '''
+        Parses a single query given as "key,operation,value". The value may itself hold commas.
+
+        Parameters:
+        ----------
+        query_text : string
+            The query
+
+        Return
+        ----------
+        query : list
+            The query, as [key, operation, value]
+        '''
+        query = [part.strip() for part in query_text.split(self.PART_SEPARATOR, 2)]
+        if len(query) != 3 or query[0] == "" or query[1] == "":
+            raise ValueError("\"" + query_text.strip() + "\" is not of the form key,operation,value")
+        return query
+
+
+    def parse(self, portion_text):
+        '''
+        Parses a portion of any number of queries, separated by semicolons. A blank portion holds no
+        queries.
+
+        Parameters:
+        ----------
+        portion_text : string
+            The portion
+
+        Return
+        ----------
+        portion : list
+            The queries, each as [key, operation, value]
+        '''
+        return [self.parse_query(query_text) for query_text in portion_text.split(self.QUERY_SEPARATOR)\
+                if query_text.strip() != ""]
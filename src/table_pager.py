@@ -0,0 +1,166 @@
+'''
+Shows the records of a GET result as an aligned table, one screen at a time.
+
+sammatime22, 2026
+'''
+import itertools
+import json
+
+
+class TablePager:
+    '''
+    A pager used to render records as a table, a page at a time. Records are pulled from their source
+    only as each page is shown, and only the rows of the current page are formatted, so a result of any
+    size can be browsed while it is still arriving.
+    '''
+
+
+    # Default paging settings.
+    DEFAULT_PAGE_SIZE = 20          # Default is 20 rows to a page
+    DEFAULT_COLUMN_WIDTH = 30       # Default is cutting values down to 30 characters
+
+
+    # The marker left on the end of a value which has been cut down.
+    ELLIPSIS = "..."
+
+
+    # The column holding records which are not objects.
+    VALUE_COLUMN = "value"
+
+
+    page_size = DEFAULT_PAGE_SIZE
+    column_width = DEFAULT_COLUMN_WIDTH
+    row_limit = None
+
+
+    def __init__(self, page_size = None, column_width = None, row_limit = None):
+        '''
+        An initializer for the table pager.
+
+        Parameters
+        ----------
+        page_size : int
+            The number of rows shown on each page
+        column_width : int
+            The most characters shown of any value
+        row_limit : int
+            The most rows shown in all (no limit unless provided)
+        '''
+        if page_size is not None:
+            if page_size < 1:
+                raise ValueError("The page size must be at least 1.")
+            self.page_size = page_size
+        if column_width is not None:
+            if column_width <= len(self.ELLIPSIS):
+                raise ValueError("The column width must be over " + str(len(self.ELLIPSIS)) + ".")
+            self.column_width = column_width
+        if row_limit is not None:
+            if row_limit < 1:
+                raise ValueError("The row limit must be at least 1.")
+            self.row_limit = row_limit
+
+
+    def format_cell(self, value):
+        '''
+        Formats a value for a cell of the table, cutting it down to the column width.
+
+        Parameters
+        ----------
+        value : any
+            The value of the record
+
+        Return
+        ----------
+        cell : string
+            The text of the cell
+        '''
+        if value is None:
+            cell = ""
+        elif isinstance(value, str):
+            cell = value
+        else:
+            cell = json.dumps(value)
+        if len(cell) > self.column_width:
+            cell = cell[:self.column_width - len(self.ELLIPSIS)] + self.ELLIPSIS
+        return cell
+
+
+    def format_page(self, records):
+        '''
+        Formats a page of records as a table, sizing the columns to fit that page alone.
+
+        Parameters
+        ----------
+        records : list
+            The records of the page
+
+        Return
+        ----------
+        header : string
+            The line naming the columns
+        rule : string
+            The line beneath the header
+        rows : list of string
+            One line per record
+        '''
+        columns = []
+        for record in records:
+            for key in (record if isinstance(record, dict) else [self.VALUE_COLUMN]):
+                if key not in columns:
+                    columns.append(key)
+
+        cells = []
+        for record in records:
+            if not isinstance(record, dict):
+                record = {self.VALUE_COLUMN: record}
+            cells.append([self.format_cell(record.get(column)) for column in columns])
+
+        headings = [self.format_cell(column) for column in columns]
+        widths = [max([len(heading)] + [len(row[index]) for row in cells]) for index, heading in enumerate(headings)]
+        header = " | ".join(heading.ljust(width) for heading, width in zip(headings, widths)).rstrip()
+        rule = "-+-".join("-" * width for width in widths)
+        rows = [" | ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in cells]
+        return header, rule, rows
+
+
+    def page(self, whisk_display, input_machine, records):
+        '''
+        Shows records as a table a page at a time, asking before each page after the first.
+
+        Parameters:
+        ----------
+        whisk_display : Display
+            The display object used by the whisk application to print content to the console
+        input_machine : InputMachine
+            The machine used to ask whether to show the next page
+        records : iterable
+            The records to show
+
+        Return
+        ----------
+        shown : int
+            The number of records shown
+        '''
+        records = iter(records)
+        shown = 0
+        upcoming = list(itertools.islice(records, 1))
+        while upcoming:
+            limit = self.page_size if self.row_limit is None else min(self.page_size, self.row_limit - shown)
+            page = upcoming + list(itertools.islice(records, limit - len(upcoming)))
+            header, rule, rows = self.format_page(page)
+            whisk_display.print_general(header)
+            whisk_display.print_general(rule)
+            for row in rows:
+                whisk_display.print_success(row)
+            shown += len(page)
+
+            # Look one record ahead, so as not to ask for a page that would be empty.
+            if self.row_limit is not None and shown >= self.row_limit:
+                break
+            upcoming = list(itertools.islice(records, 1))
+            if not upcoming:
+                break
+            answer = input_machine.gather_input("Press Enter for more, or q to stop")
+            if answer is None or answer.strip().lower() == "q":
+                break
+        return shown
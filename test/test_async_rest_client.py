@@ -0,0 +1,138 @@
+'''
+This file tests the Async Rest Client, that its requests work over real connections to a stand-in MatchaDB.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import asyncio
+import socket
+import unittest
+from unittest.mock import patch
+from async_rest_client import AsyncRestClient, AsyncResponse
+from mock_server import MockMatchaDB
+
+
+class TestAsyncRestClient(unittest.TestCase):
+    '''
+    A set of tests for the Async Rest Client class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # A sample test FROM query portion
+    test_sample_from_portion = "[\"Ice Cream\"]"
+
+    # A sample test SELECT query portion
+    test_sample_select_portion = "[[\"Flavor\", \"is\", \"Mint\"]]"
+
+
+    def setUp(self):
+        '''
+        Starts a stand-in MatchaDB, and an event loop to run the client on.
+        '''
+        self.mock = MockMatchaDB()
+        self.protocol, self.host, self.port = self.mock.start()
+        self.loop = asyncio.new_event_loop()
+        self.test_rest_client = AsyncRestClient(self.protocol, self.host, self.port)
+
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.test_rest_client.close())
+        self.loop.close()
+        self.mock.stop()
+
+
+    def test_01_all_requests(self):
+        '''
+        Tests each request type against the stand-in, which reads the same body format as from the Rest Client.
+        '''
+        client = self.test_rest_client
+        post_result = self.loop.run_until_complete(client.post_request(self.test_sample_from_portion, "[]", "{\"Flavor\": \"Mint\"}"))
+        update_result = self.loop.run_until_complete(client.update_request(self.test_sample_from_portion, "[]", "[]"))
+        get_result = self.loop.run_until_complete(client.get_request(self.test_sample_from_portion, self.test_sample_select_portion))
+        delete_result = self.loop.run_until_complete(client.delete_request(self.test_sample_from_portion, "[]"))
+
+        assert get_result[0] == True and get_result[1].status_code == 200
+        assert get_result[1].content == b"[{\"Flavor\": \"Mint\"}]"
+        assert post_result[1].status_code == 201
+        assert update_result[1].status_code == 200
+        assert delete_result[1].status_code == 204 and delete_result[1].content == b""
+
+        assert self.mock.tables["Ice Cream"] == []
+
+        # Every request was made over the one kept-alive connection
+        assert self.mock.request_count == 4
+        assert self.mock.connection_count == 1
+
+
+    def test_02_many_in_flight(self):
+        '''
+        Tests that many requests can be awaited together, bounded by the connection limit.
+        '''
+        client = AsyncRestClient(self.protocol, self.host, self.port, 8)
+
+        async def run_all():
+            requests = [client.get_request(self.test_sample_from_portion, self.test_sample_select_portion) for index in range(50)]
+            results = await asyncio.gather(*requests)
+            await client.close()
+            return results
+
+        results = self.loop.run_until_complete(run_all())
+
+        assert all(retrieved and response.status_code == 200 for retrieved, response in results)
+        assert self.mock.request_count == 50
+        assert self.mock.connection_count <= 8
+
+
+    def test_03_connection_error(self):
+        '''
+        Tests that a refused connection is reported the same way as the Rest Client.
+        '''
+        # Find a port with nothing listening on it
+        unused_socket = socket.socket()
+        unused_socket.bind(("127.0.0.1", 0))
+        unused_port = unused_socket.getsockname()[1]
+        unused_socket.close()
+
+        bad_rest_client = AsyncRestClient("http://", "127.0.0.1", str(unused_port))
+        retrieved, response = self.loop.run_until_complete(\
+            bad_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion))
+        assert retrieved == False
+        assert response == "A connection error has occurred."
+
+
+    def test_04_unknown_exception(self):
+        '''
+        Tests that an unexpected error is reported the same way as the Rest Client.
+        '''
+        retrieved, response = self.loop.run_until_complete(self.test_rest_client.get_request(self.test_sample_from_portion, object()))
+        assert retrieved == False
+        assert response.startswith("An unidentified error has occurred: ")
+
+
+    def test_05_resend_on_reused_connection(self):
+        '''
+        Tests that a request failing on a reused connection is only sent again if it is idempotent.
+        '''
+        client = self.test_rest_client
+        with patch('async_rest_client.AsyncRestClient.exchange') as mock_exchange:
+            mock_exchange.side_effect = [ConnectionError(), AsyncResponse(200, {}, b"[]")]
+            client.idle_connections = ["stale connection"]
+            retrieved, response = self.loop.run_until_complete(\
+                client.get_request(self.test_sample_from_portion, self.test_sample_select_portion))
+            assert retrieved == True and response.status_code == 200
+            assert len(mock_exchange.call_args_list) == 2
+            assert mock_exchange.call_args_list[1][1] == {"reuse": False}
+
+            mock_exchange.reset_mock()
+            mock_exchange.side_effect = [ConnectionError(), AsyncResponse(201, {}, b"")]
+            retrieved, response = self.loop.run_until_complete(\
+                client.post_request(self.test_sample_from_portion, "[]", "{\"Flavor\": \"Mint\"}"))
+            assert retrieved == False and response == "A connection error has occurred."
+            assert len(mock_exchange.call_args_list) == 1
+        client.idle_connections = []
@@ -0,0 +1,86 @@
+'''
+This file tests the Batch Executor, that it runs tasks in parallel while keeping their order.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import threading
+import time
+import unittest
+from batch_executor import BatchExecutor
+
+
+class TestBatchExecutor(unittest.TestCase):
+    '''
+    A set of tests for the Batch Executor class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    def test_01_results_in_order(self):
+        '''
+        Tests that results come back in the order of the items, even when later items finish first.
+        '''
+        def task(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 10
+
+        results = list(BatchExecutor(4).execute(task, range(5)))
+        assert results == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+
+
+    def test_02_concurrency_limit(self):
+        '''
+        Tests that no more than the configured number of tasks are ever in flight.
+        '''
+        lock = threading.Lock()
+        in_flight = [0]
+        most_in_flight = [0]
+
+        def task(item):
+            with lock:
+                in_flight[0] += 1
+                most_in_flight[0] = max(most_in_flight[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return item
+
+        results = list(BatchExecutor(3).execute(task, range(30)))
+        assert [result for item, result in results] == list(range(30))
+        assert most_in_flight[0] == 3
+
+
+    def test_03_throughput_scales(self):
+        '''
+        Tests that tasks bound by latency finish in roughly one round trip when run together.
+        '''
+        def task(item):
+            time.sleep(0.1)
+            return item
+
+        start = time.perf_counter()
+        list(BatchExecutor(10).execute(task, range(10)))
+        assert time.perf_counter() - start < 0.5
+
+
+    def test_04_single_worker(self):
+        '''
+        Tests that a concurrency of one runs the tasks in the calling thread.
+        '''
+        results = list(BatchExecutor().execute(lambda item: threading.current_thread(), range(3)))
+        assert all(result is threading.current_thread() for item, result in results)
+
+
+    def test_05_invalid_concurrency(self):
+        '''
+        Tests that a concurrency below one is rejected.
+        '''
+        with self.assertRaises(ValueError):
+            BatchExecutor(0)
@@ -0,0 +1,126 @@
+'''
+This file tests the Bench, that it drives the requested mix of load and reports on it accordingly.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import time
+import unittest
+from unittest.mock import patch
+from bench import Bench, BenchReport
+from rest_client import RestClient
+
+
+class TestBench(unittest.TestCase):
+    '''
+    A set of tests for the Bench and Bench Report classes.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # A mock Rest Client for test
+    test_rest_client = RestClient()
+
+    # A mocked Response class for tests
+    class MockResponse():
+        '''
+        Again, a mock class for Responses over REST.
+        '''
+
+        # The constructor for the mock Response object
+        def __init__(self, status_code, content):
+            self.status_code = status_code
+            self.content = content
+
+
+    def test_01_percentiles(self):
+        '''
+        Tests the nearest-rank percentiles and the summary lines of a report.
+        '''
+        report = BenchReport(2.0)
+        for latency in range(1, 101):
+            report.record("GET", latency / 1000.0, latency != 100)
+
+        assert report.percentile(sorted(report.latencies["GET"]), 50) == 0.05
+        assert report.percentile(sorted(report.latencies["GET"]), 99) == 0.099
+        assert report.summarize() == ["100 operations in 2.00s (50.0 ops/s), 1 errors",\
+            "GET: 100 ops (50.0 ops/s), 1 errors, p50 50.00ms, p90 90.00ms, p99 99.00ms, max 100.00ms"]
+
+
+    def test_02_parse_mix(self):
+        '''
+        Tests that a mix given on the CLI is parsed into weights.
+        '''
+        assert Bench.parse_mix("get:7, POST:1,UPDATE:1,DELETE:1") == {"GET": 7, "POST": 1, "UPDATE": 1, "DELETE": 1}
+
+
+    def test_03_run_follows_mix(self):
+        '''
+        Tests that a run issues the commands in the proportions of the mix, recording their outcomes.
+        '''
+        def side_effect_method_get(from_portion, select_portion):
+            return True, self.MockResponse(200, "")
+
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            with patch('rest_client.RestClient.post_request') as mock_post_request:
+                mock_get_request.side_effect = side_effect_method_get
+                mock_post_request.return_value = (False, "A connection error has occurred.")
+                report = Bench({"GET": 3, "POST": 1}, 0.2, 2).run(self.test_rest_client)
+
+                gets = len(report.latencies["GET"])
+                posts = len(report.latencies["POST"])
+                assert abs(gets - 3 * posts) <= 3
+                assert report.errors["GET"] == 0
+                assert report.errors["POST"] == posts
+
+
+    def test_04_run_at_rate(self):
+        '''
+        Tests that a run paced to a target rate issues roughly rate times duration operations.
+        '''
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            mock_get_request.return_value = (True, self.MockResponse(200, ""))
+            start = time.perf_counter()
+            report = Bench(None, 0.5, 4, 40).run(self.test_rest_client)
+
+            assert len(report.latencies["GET"]) == 20
+            assert time.perf_counter() - start < 1.0
+
+
+    def test_05_empty_mix(self):
+        '''
+        Tests that a mix without any commands is rejected.
+        '''
+        with self.assertRaises(ValueError):
+            Bench({"GET": 0})
+        with self.assertRaises(ValueError):
+            Bench({"FETCH": 1})
+        with self.assertRaises(ValueError):
+            Bench(None, 1.0, 0)
+        with self.assertRaises(ValueError):
+            Bench.parse_mix("GET")
+        with self.assertRaises(ValueError):
+            Bench.parse_mix("GET:x,POST:1")
+
+
+    def test_06_run_against_stand_in(self):
+        '''
+        Tests a short run end to end against a stand-in MatchaDB, with every command succeeding.
+        '''
+        from mock_server import MockMatchaDB
+        mock = MockMatchaDB()
+        protocol, host, port = mock.start()
+        rest_client = RestClient(protocol, host, port, 4)
+        try:
+            report = Bench({"GET": 2, "POST": 1, "UPDATE": 1, "DELETE": 1}, 0.3, 4).run(rest_client)
+            assert sorted(report.latencies) == ["DELETE", "GET", "POST", "UPDATE"]
+            assert sum(report.errors.values()) == 0
+            assert mock.request_count == sum(len(latencies) for latencies in report.latencies.values())
+        finally:
+            rest_client.close()
+            mock.stop()
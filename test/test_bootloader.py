@@ -8,7 +8,7 @@ sys.path.append('src')
 
 import unittest 
 from unittest.mock import patch, call
-from bootloader import kickstart, WELCOME
+from bootloader import kickstart, split_arguments, WELCOME
 from display import Display
 from input_machine import InputMachine
 from rest_client import RestClient
@@ -59,3 +59,178 @@ class TestBootloader(unittest.TestCase):
                     assert mock_print_general.mock_calls.count(call(WELCOME)) == 1
                     assert len(mock_get_protocol_host_port.mock_calls) == 1
                     assert len(mock_start_engine.mock_calls) == 1
+
+
+    def test_2_kickstart_script(self):
+        '''
+        This test checks that a provided script is run without starting the interactive engine.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('script_runner.ScriptRunner.run_script') as mock_run_script:
+                with patch('threading.Thread.start') as mock_start_engine:
+                    mock_run_script.return_value = 0
+                    exit_status = kickstart(["whisk.py", "--script", "ops.jsonl"])
+
+                    assert exit_status == 0
+                    assert mock_run_script.mock_calls[0][1][2] == "ops.jsonl"
+                    assert mock_run_script.mock_calls[0][1][3] is None
+                    assert len(mock_start_engine.mock_calls) == 0
+                    assert call(WELCOME) not in mock_print_general.mock_calls
+
+
+    def test_3_split_arguments(self):
+        '''
+        This test checks that named options are separated from the positional arguments.
+        '''
+        positional_arguments, options = split_arguments(["whisk.py", "--script", "ops.jsonl", "localhost", "11150",\
+                                                         "--concurrency", "8"])
+        assert positional_arguments == ["whisk.py", "localhost", "11150"]
+        assert options == {"script": "ops.jsonl", "concurrency": "8"}
+
+
+    def test_4_kickstart_script_concurrency(self):
+        '''
+        This test checks that the concurrency is handed to the script run and sizes the connection pool.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('script_runner.ScriptRunner.run_script') as mock_run_script:
+                mock_run_script.return_value = 2
+                exit_status = kickstart(["whisk.py", "--script", "ops.jsonl", "--concurrency", "8"])
+
+                assert exit_status == 1
+                assert mock_run_script.mock_calls[0][1][1].pool_size == 8
+                assert mock_run_script.mock_calls[0][1][3] == 8
+
+
+    def test_5_kickstart_bench(self):
+        '''
+        This test checks that a benchmark is run and reported without starting the interactive engine.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('bench.Bench.run') as mock_run:
+                with patch('threading.Thread.start') as mock_start_engine:
+                    mock_run.return_value.summarize.return_value = ["summary"]
+                    exit_status = kickstart(["whisk.py", "--bench", "5", "--mix", "GET:1,POST:1"])
+
+                    assert exit_status == 0
+                    assert len(mock_run.mock_calls) == 2
+                    assert mock_print_general.mock_calls[-1] == call("summary")
+                    assert len(mock_start_engine.mock_calls) == 0
+
+
+    def test_6_kickstart_mock(self):
+        '''
+        This test checks that --mock points the Rest Client at a stand-in MatchaDB.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('script_runner.ScriptRunner.run_script') as mock_run_script:
+                with patch('mock_server.MockMatchaDB.start') as mock_start:
+                    mock_start.return_value = ("http://", "127.0.0.1", "4000")
+                    mock_run_script.return_value = 0
+                    kickstart(["whisk.py", "--mock", "--script", "ops.jsonl"])
+
+                    assert mock_run_script.mock_calls[0][1][1].get_protocol_host_port() == ("http://", "127.0.0.1", "4000")
+
+
+    def test_7_kickstart_one_shot(self):
+        '''
+        This test checks that a command given first is run once, without the display or the interactive engine.
+        '''
+        with patch('display.Display.print_success') as mock_print_success:
+            with patch('one_shot.OneShot.run') as mock_run:
+                with patch('threading.Thread.start') as mock_start_engine:
+                    mock_run.return_value = 4
+                    exit_status = kickstart(["whisk.py", "get", "--host", "db.local", "--port", "9000", "--from", "users"])
+
+                    assert exit_status == 4
+                    assert mock_run.mock_calls[0][1][0].get_protocol_host_port() == ("http://", "db.local", "9000")
+                    assert mock_run.mock_calls[0][1][1] == "GET"
+                    assert mock_run.mock_calls[0][1][2]["from"] == "users"
+                    assert len(mock_print_success.mock_calls) == 0
+                    assert len(mock_start_engine.mock_calls) == 0
+
+
+    def test_8_kickstart_bulk_insert(self):
+        '''
+        This test checks that a bulk insert is run into the named table, in batches of the given size.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('bulk_loader.BulkLoader.load') as mock_load:
+                with patch('display.Display.print_error') as mock_print_error:
+                    mock_load.return_value = 0
+                    assert kickstart(["whisk.py", "--bulk-insert", "users.csv", "--from", "users", "--batch-size", "500"]) == 0
+                    assert mock_load.mock_calls[0][1][2:] == (["users"], "users.csv")
+
+                    assert kickstart(["whisk.py", "--bulk-insert", "users.csv"]) == 2
+                    assert len(mock_load.mock_calls) == 1
+
+
+    def test_9_kickstart_buffered(self):
+        '''
+        This test checks that --buffered buffers the display of a script run, but never of the interactive engine.
+        '''
+        with patch('script_runner.ScriptRunner.run_script') as mock_run_script:
+            with patch('display.Display.flush') as mock_flush:
+                mock_run_script.return_value = 0
+                kickstart(["whisk.py", "--script", "ops.jsonl", "--buffered"])
+                assert mock_run_script.mock_calls[0][1][0].sink is not None
+                assert len(mock_flush.mock_calls) == 1
+
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('threading.Thread') as mock_thread:
+                kickstart(["whisk.py", "--buffered"])
+                assert mock_thread.mock_calls[0][2]["args"][0].sink is None
+
+
+    def test_10_kickstart_format(self):
+        '''
+        This test checks that --format writes records of a script run, with the display moved to standard error.
+        '''
+        with patch('script_runner.ScriptRunner.run_script') as mock_run_script:
+            with patch('result_writer.ResultWriter.close') as mock_close:
+                mock_run_script.return_value = 0
+                kickstart(["whisk.py", "--script", "ops.jsonl", "--format", "csv"])
+                assert mock_run_script.mock_calls[0][1][4].output_format == "csv"
+                assert mock_run_script.mock_calls[0][1][0].sink.stream is sys.stderr
+                assert len(mock_close.mock_calls) == 1
+
+        with patch('sys.stderr') as mock_stderr:
+            assert kickstart(["whisk.py", "--script", "ops.jsonl", "--format", "xml"]) == 2
+
+
+    def test_11_kickstart_endpoints(self):
+        '''
+        This test checks that --endpoints spreads requests across replicas, the first of which is the primary.
+        '''
+        with patch('one_shot.OneShot.run') as mock_run:
+            mock_run.return_value = 0
+            kickstart(["whisk.py", "get", "--endpoints", "db1.local:9000, https://db2.local", "--balance",\
+                       "least-outstanding", "--from", "users"])
+
+            rest_client = mock_run.mock_calls[0][1][0]
+            assert rest_client.get_protocol_host_port() == ("http://", "db1.local", "9000")
+            assert rest_client.endpoint_pool.urls == ["http://db1.local:9000/", "https://db2.local:11150/"]
+            assert rest_client.endpoint_pool.strategy == "least-outstanding"
+
+        with patch('sys.stderr'):
+            assert kickstart(["whisk.py", "get", "--endpoints", "db1.local", "--balance", "random", "--from", "users"]) == 2
+
+
+    def test_12_kickstart_bad_options(self):
+        '''
+        This test checks that options which cannot be used are reported as a usage error, without a traceback.
+        '''
+        bad_arguments = [["--script", "ops.jsonl", "--concurrency", "abc"], ["--script", "ops.jsonl", "--concurrency", "0"],\
+                         ["--bench", "1", "--mix", "GET"], ["--bulk-insert", "users.csv", "--from", "users", "--batch-size", "0"],\
+                         ["get", "--from", "users", "--max-attempts", "0"], ["get", "--from", "users", "--deadline", "x"],\
+                         ["--page-size", "5", "--row-limit", "0"], ["--where", "bogus"], ["--limit", "-1"]]
+        with patch('sys.stderr') as mock_stderr:
+            with patch('threading.Thread') as mock_thread:
+                with patch('display.Display.print_general') as mock_print_general:
+                    for arguments in bad_arguments:
+                        assert kickstart(["whisk.py"] + arguments) == 2
+                    assert len(mock_thread.mock_calls) == 0
+                    assert mock_stderr.write.call_args_list[0] ==\
+                        call("The options could not be used: --concurrency must be a whole number, not \"abc\"\n")
+                    assert mock_stderr.write.call_args_list[1] ==\
+                        call("The options could not be used: --concurrency must be at least 1\n")
@@ -0,0 +1,133 @@
+'''
+This file tests the BulkLoader class, loading files of records into the stand-in MatchaDB in batches.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, call
+from bulk_loader import BulkLoader
+from display import Display
+from mock_server import MockMatchaDB
+from rest_client import RestClient
+
+
+class TestBulkLoader(unittest.TestCase):
+    '''
+    A set of tests for the BulkLoader class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # A mock Display object for test
+    test_whisk_display = Display()
+
+
+    def setUp(self):
+        '''
+        Starts a stand-in, and a Rest Client pointed at it.
+        '''
+        self.mock = MockMatchaDB()
+        protocol, host, port = self.mock.start()
+        self.test_rest_client = RestClient(protocol, host, port, 4)
+
+
+    def tearDown(self):
+        self.test_rest_client.close()
+        self.mock.stop()
+
+
+    def write_records(self, lines, suffix):
+        '''
+        Writes the provided lines to a temporary file of records, returning its path.
+        '''
+        data_file = tempfile.NamedTemporaryFile("w", suffix = suffix, delete = False)
+        data_file.write("\n".join(lines) + "\n")
+        data_file.close()
+        self.addCleanup(os.remove, data_file.name)
+        return data_file.name
+
+
+    def test_01_iter_batches(self):
+        '''
+        Tests that records are grouped into batches, numbered by their first record.
+        '''
+        batches = list(BulkLoader(2).iter_batches(iter(range(5))))
+        assert batches == [(1, [0, 1]), (3, [2, 3]), (5, [4])]
+        with self.assertRaises(ValueError):
+            BulkLoader(0)
+
+
+    def test_02_iter_records(self):
+        '''
+        Tests that records are read from JSONL and CSV files, skipping blank lines.
+        '''
+        jsonl_path = self.write_records(["{\"id\": \"1\"}", "", "{\"id\": \"2\"}"], ".jsonl")
+        csv_path = self.write_records(["id,flavor", "1,Mint", "2,Vanilla"], ".csv")
+        assert list(BulkLoader().iter_records(jsonl_path)) == [{"id": "1"}, {"id": "2"}]
+        assert list(BulkLoader().iter_records(csv_path)) == [{"id": "1", "flavor": "Mint"}, {"id": "2", "flavor": "Vanilla"}]
+
+
+    def test_03_load(self):
+        '''
+        Tests that every record is inserted, using one POST request per batch.
+        '''
+        data_path = self.write_records([json.dumps({"id": str(index)}) for index in range(250)], ".jsonl")
+        with patch('display.Display.print_general') as mock_print_general:
+            failures = BulkLoader(100, 4).load(self.test_whisk_display, self.test_rest_client, ["users"], data_path)
+
+            assert failures == 0
+            assert mock_print_general.mock_calls == [call("250 records inserted in 3 requests")]
+            assert sorted(int(record["id"]) for record in self.mock.tables["users"]) == list(range(250))
+            assert self.mock.request_count == 3
+
+
+    def test_04_load_reads_lazily(self):
+        '''
+        Tests that no more than a bounded window of batches is read ahead of the requests made.
+        '''
+        loader = BulkLoader(10, 2)
+        read = []
+
+        def side_effect_method_iter_records(data_path):
+            for index in range(1000):
+                read.append(index)
+                yield {"id": str(index)}
+
+        def side_effect_method_post(from_portion, select_portion, insert_portion):
+            # At most the batches in flight, the ones queued behind them, and the one being read.
+            assert len(read) - int(insert_portion[0]["id"]) <= 10 * (2 * 2 + 1)
+            return True, type("Response", (), {"status_code": 201, "content": b""})()
+
+        with patch('display.Display.print_general'):
+            with patch('rest_client.RestClient.post_request') as mock_post_request:
+                mock_post_request.side_effect = side_effect_method_post
+                loader.iter_records = side_effect_method_iter_records
+                assert loader.load(self.test_whisk_display, self.test_rest_client, ["users"], "records.jsonl") == 0
+                assert len(mock_post_request.mock_calls) == 100
+
+
+    def test_05_load_failures(self):
+        '''
+        Tests that rejected batches and unreadable lines are printed and counted.
+        '''
+        data_path = self.write_records(["{\"id\": \"1\"}", "{\"id\": \"2\"}", "[1]"], ".jsonl")
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('display.Display.print_error') as mock_print_error:
+                with patch('rest_client.RestClient.post_request') as mock_post_request:
+                    mock_post_request.return_value = (True, type("Response", (), {"status_code": 400, "content": b"no"})())
+                    failures = BulkLoader(1).load(self.test_whisk_display, self.test_rest_client, ["users"], data_path)
+
+                    assert failures == 3
+                    assert mock_print_error.mock_calls == [call("Records 1-1 400 : b'no'"), call("Records 2-2 400 : b'no'"),\
+                        call("The records could not be read: Line 3 could not be read: a record must be a JSON object.")]
+                    assert mock_print_general.mock_calls == [call("0 records inserted in 2 requests")]
@@ -0,0 +1,71 @@
+'''
+This file tests the CommandRegistry class, such that commands are found by name in any casing.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from unittest.mock import Mock
+from command_registry import CommandRegistry, RegisteredCommand, REQUEST_COMMANDS
+from engine import Engine
+
+
+class TestCommandRegistry(unittest.TestCase):
+    '''
+    A set of tests for the CommandRegistry class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    def test_01_register_lookup(self):
+        '''
+        Tests that registered commands are found in any casing, and that unknown names find nothing.
+        '''
+        registry = CommandRegistry()
+        get = RegisteredCommand("get", "get_command", ["Retrieves data."], request_method = "get_request",\
+                                expected_status_code = 200)
+        registry.register(get)
+        assert registry.lookup("GET") is get
+        assert registry.lookup("gEt") is get
+        assert registry.lookup("PUT") is None
+        assert get.portions == []
+        assert get.uses_rest_client and not get.ends_session
+
+
+    def test_02_listing(self):
+        '''
+        Tests that commands are listed in the order registered, with a replaced command keeping its place.
+        '''
+        registry = CommandRegistry()
+        for name in ("GET", "HELP", "EXIT"):
+            registry.register(RegisteredCommand(name, name.lower() + "_command", []))
+        replacement = RegisteredCommand("help", "other_help_command", ["Other help."])
+        registry.register(replacement)
+        assert registry.listing() == "GET, HELP, EXIT"
+        assert registry.lookup("HELP") is replacement
+
+
+    def test_03_request_commands(self):
+        '''
+        Tests that the request commands send their portions through the Rest Client, defaulting those left
+        out, and that the engine runs the same commands under its own handlers.
+        '''
+        assert REQUEST_COMMANDS.listing() == "GET, POST, UPDATE, DELETE"
+        rest_client = Mock()
+        REQUEST_COMMANDS.lookup("post").send(rest_client, ["T"], [], {"Insert": {"a": "1"}})
+        REQUEST_COMMANDS.lookup("UPDATE").send(rest_client, ["T"], [["a", "==", "1"]], {})
+        REQUEST_COMMANDS.lookup("DELETE").send(rest_client, ["T"], [["a", "==", "1"]], {"Insert": {}})
+        rest_client.post_request.assert_called_once_with(["T"], [], {"a": "1"})
+        rest_client.update_request.assert_called_once_with(["T"], [["a", "==", "1"]], [])
+        rest_client.delete_request.assert_called_once_with(["T"], [["a", "==", "1"]])
+
+        engine_post = Engine().commands.lookup("POST")
+        assert engine_post.handler == "post_command" and engine_post.help_lines
+        assert engine_post.request_method == "post_request" and engine_post.expected_status_code == 201
+        assert REQUEST_COMMANDS.lookup("POST").handler is None
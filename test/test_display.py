@@ -8,6 +8,7 @@ sammatime22, 2021
 import sys
 sys.path.append('src')
 
+import io
 import unittest
 from unittest.mock import patch, call
 from display import Display
@@ -89,3 +90,59 @@ class TestDisplay(unittest.TestCase):
             [call(self.RED.format("Success Color Configured...")), call(self.BLUE.format("Error Color Configured...")),\
             call(self.GREEN.format("General Color Configured...")), call(self.RED.format(self.test_message)),\
             call(self.BLUE.format(self.test_message)), call(self.GREEN.format(self.test_message))]
+
+
+    @patch('builtins.print')
+    def test_05_print_records(self, mock_print):
+        '''
+        Tests the print_records method prints one line per record, returning the count.
+        '''
+        test_whisk_display = Display()
+        count = test_whisk_display.print_records(iter([{"Flavor": "Mint"}, [1, 2]]))
+        assert count == 2
+        assert mock_print.mock_calls[-2:] == [call(self.GREEN.format("{\"Flavor\": \"Mint\"}")), call(self.GREEN.format("[1, 2]"))]
+
+
+    @patch('builtins.print')
+    def test_06_print_response(self, mock_print):
+        '''
+        Tests the print_response method highlights by outcome, appending metrics only when they are shown.
+        '''
+        class StubMetrics:
+            def describe(self):
+                return "[total 1.0ms]"
+
+        test_whisk_display = Display()
+        test_metrics_display = Display(show_metrics = True)
+        mock_print.reset_mock()
+        test_whisk_display.print_response(True, self.test_message, StubMetrics())
+        test_whisk_display.print_response(False, self.test_message)
+        test_metrics_display.print_response(True, self.test_message, StubMetrics())
+        assert mock_print.mock_calls == [call(self.GREEN.format(self.test_message)),\
+            call(self.RED.format(self.test_message)), call(self.GREEN.format(self.test_message + " [total 1.0ms]"))]
+
+
+    @patch('builtins.print')
+    def test_07_buffered(self, mock_print):
+        '''
+        Tests that buffered mode writes through the sink, leaving out colors unless writing to a terminal.
+        '''
+        class TerminalStream(io.StringIO):
+            def isatty(self):
+                return True
+
+        piped_stream = io.StringIO()
+        piped_display = Display(buffered = True, stream = piped_stream)
+        piped_display.print_error(self.test_message)
+        piped_display.print_records([{"Flavor": "Mint"}])
+        assert piped_stream.getvalue() == ""
+        piped_display.flush()
+        assert piped_stream.getvalue() == "Display Initialized...\n" + self.test_message + "\n{\"Flavor\": \"Mint\"}\n"
+
+        terminal_stream = TerminalStream()
+        terminal_display = Display(buffered = True, stream = terminal_stream)
+        terminal_display.print_general(self.test_message)
+        terminal_display.flush()
+        assert terminal_stream.getvalue() == self.GREEN.format("Display Initialized...") + "\n" +\
+            self.BLUE.format(self.test_message) + "\n"
+        assert len(mock_print.mock_calls) == 0
@@ -0,0 +1,82 @@
+'''
+This file tests the EndpointPool class, such that reads are spread across replicas and fail over.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from endpoint_pool import EndpointPool
+
+
+class TestEndpointPool(unittest.TestCase):
+    '''
+    A set of tests for the EndpointPool class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # The endpoints for test, the primary first
+    test_endpoints = [("http://", "10.0.0.1", "11150"), ("http://", "10.0.0.2", "11150"), ("https://", "10.0.0.3", "8443")]
+
+
+    def test_01_parse_endpoint(self):
+        '''
+        Tests that endpoints are read with or without their protocol and port.
+        '''
+        assert EndpointPool.parse_endpoint("https://db.local:8443/") == ("https://", "db.local", "8443")
+        assert EndpointPool.parse_endpoint(" 10.0.0.2:9000") == ("http://", "10.0.0.2", "9000")
+        assert EndpointPool.parse_endpoint("db.local") == ("http://", "db.local", "11150")
+        with self.assertRaises(ValueError):
+            EndpointPool.parse_endpoint("http://")
+        with self.assertRaises(ValueError):
+            EndpointPool([])
+        with self.assertRaises(ValueError):
+            EndpointPool(self.test_endpoints, "random")
+
+
+    def test_02_choose_round_robin(self):
+        '''
+        Tests that reads are sent to each endpoint in turn, and writes always to the primary.
+        '''
+        pool = EndpointPool(self.test_endpoints)
+        chosen = [pool.choose("get") for _ in range(4)]
+        assert chosen == ["http://10.0.0.1:11150/", "http://10.0.0.2:11150/", "https://10.0.0.3:8443/",\
+                          "http://10.0.0.1:11150/"]
+        assert [pool.choose(verb) for verb in ("post", "put", "delete")] == ["http://10.0.0.1:11150/"] * 3
+        assert pool.primary() == ("http://", "10.0.0.1", "11150")
+
+
+    def test_03_choose_least_outstanding(self):
+        '''
+        Tests that reads are sent to the endpoint with the fewest requests outstanding.
+        '''
+        pool = EndpointPool(self.test_endpoints, EndpointPool.LEAST_OUTSTANDING)
+        first, second, third = pool.choose("get"), pool.choose("get"), pool.choose("get")
+        assert len({first, second, third}) == 3
+        pool.release(second, True)
+        assert pool.choose("get") == second
+        assert pool.outstanding == {first: 1, second: 1, third: 1}
+
+
+    def test_04_fail_over(self):
+        '''
+        Tests that an endpoint which failed to connect is passed over, unless every endpoint has failed.
+        '''
+        pool = EndpointPool(self.test_endpoints[:2], cooldown = 60)
+        primary, replica = pool.urls
+        pool.release(pool.choose("get"), False)
+        assert [pool.choose("get") for _ in range(3)] == [replica] * 3
+        assert pool.can_fail_over("get", [primary])
+        assert not pool.can_fail_over("get", [primary, replica])
+        assert not pool.can_fail_over("post", [primary])
+        assert pool.choose("get", [replica]) == primary
+        assert pool.choose("get", [primary, replica]) is None
+
+        pool.release(primary, True)
+        assert set(pool.choose("get") for _ in range(2)) == {primary, replica}
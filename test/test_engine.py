@@ -6,12 +6,16 @@ sammatime22, 2022
 import sys
 sys.path.append('src')
 
+import json
 import unittest
-from unittest.mock import patch, call
+from unittest.mock import patch, call, Mock
+from command_registry import RegisteredCommand
 from engine import Engine
 from display import Display
 from input_machine import InputMachine
 from rest_client import RestClient
+from result_pipeline import ResultPipeline
+from table_pager import TablePager
 
 class TestEngine(unittest.TestCase):
     '''
@@ -52,6 +56,10 @@ class TestEngine(unittest.TestCase):
             self.status_code = status_code
             self.content = content
 
+        # Releasing the connection of the mock Response object
+        def close(self):
+            pass
+
 
 
     # Tests for Retrieve Command
@@ -61,7 +69,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "GET"
-        please_provide = "\nPlease provide one of the following:\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        please_provide = "\nPlease provide one of the following:\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "Do note that this is not case sensitive."
         your_command = "Your Command"
 
@@ -83,7 +91,7 @@ class TestEngine(unittest.TestCase):
         Tests that the retrieve command can handle exceptions.
         '''
         # Set up the commands and expected print statements
-        please_provide = "\nPlease provide one of the following:\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        please_provide = "\nPlease provide one of the following:\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "Do note that this is not case sensitive."
         your_command = "Your Command"
         unrecognized_value = "An unrecognized value was provided."
@@ -111,7 +119,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "GET"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
         # Just to further organize, these are the expected "print" statements
@@ -139,7 +147,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "POST"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -169,7 +177,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "UPDATE"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -199,7 +207,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "DELETE"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -228,7 +236,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "HELP"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -253,7 +261,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "EXIT"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -278,7 +286,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = "just an incoherent command"
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -308,7 +316,7 @@ class TestEngine(unittest.TestCase):
         '''
         # Set up the commands and expected print statements
         test_command = None
-        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, HELP, EXIT"
+        what_command = "What command would you like more info on?\nGET, POST, UPDATE, DELETE, RECALL, HELP, EXIT"
         not_case_sensitive = "This is not case sensitive."
         gather_info_on = "Gather Info On"
 
@@ -342,11 +350,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Electrical Components"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Item"
         select_operation_portion = "is"
         select_value_portion = "LED"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
 
         # Provide what we expect following a successful GET request
         retrieved = True
@@ -404,11 +412,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Electrical Components"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Name"
         select_operation_portion = "is"
         select_value_portion = "Ice Cream"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         
         # Provide what we expect following an unsuccessful GET request
         retrieved = False
@@ -466,11 +474,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Electrical Components"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Item Name"
         select_operation_portion = "is"
         select_value_portion = "LED"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
 
         # Provide what we expect following a failed GET request
         retrieved = False
@@ -539,11 +547,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Plates"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Material"
         select_operation_portion = "is"
         select_value_portion = "Metal"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         insert_portion_full = "{\"Name\": \"SilverPlatter\", \"Price\": 10.00, \"Currency\": \"$\"}"
 
         # Provide what we expect following a successful POST request
@@ -568,7 +576,7 @@ class TestEngine(unittest.TestCase):
         def side_effect_method_post(from_portionn, select_portionn, insert_portionn): 
             if (from_portionn == from_portion_full) and \
                 (select_portionn == select_portion_full) and \
-                (insert_portionn == insert_portion_full):
+                (insert_portionn == json.loads(insert_portion_full)):
                 return retrieved, mock_response
             else:
                 False, None
@@ -606,11 +614,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Magnets"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Strength (A/m)"
         select_operation_portion = ">"
         select_value_portion = "10"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         insert_portion_full = "{\"Name\": \"My Mag\"}"
 
         # Provide what we expect following an unsuccessful POST request
@@ -636,7 +644,7 @@ class TestEngine(unittest.TestCase):
         def side_effect_method_post(from_portionn, select_portionn, insert_portionn):
             if (from_portionn == from_portion_full) and \
                 (select_portionn == select_portion_full) and\
-                (insert_portionn == insert_portion_full):
+                (insert_portionn == json.loads(insert_portion_full)):
                 return retrieved, mock_response
             else:
                 return False, None
@@ -676,11 +684,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Sweaters"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = ""
         select_operation_portion = ""
         select_value_portion = ""
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         insert_portion_full = "{\"Name\": \"Too Comfy\"}"
 
         # Provide what we expect following an unsuccessful POST request
@@ -702,7 +710,7 @@ class TestEngine(unittest.TestCase):
 
         def side_effect_method_post(from_portionn, select_portionn, insert_portionn):
             if (from_portionn == from_portion_full) and (select_portionn == select_portion_full)\
-                and (insert_portionn == insert_portion_full):
+                and (insert_portionn == json.loads(insert_portion_full)):
                 return retrieved, error_message
             else:
                 return not retrieved, error_message
@@ -759,15 +767,15 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Books"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Author"
         select_operation_portion = "is"
         select_value_portion = "sammatime22"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         update_key_portion = "Recommendation"
         update_operation_portion = "to"
         update_value_portion = "true"
-        update_portion_full = "[[\"" + update_key_portion + "\", \"" + update_operation_portion + "\", \"" + update_value_portion + "\"]]"
+        update_portion_full = [[update_key_portion, update_operation_portion, update_value_portion]]
 
         # Provide what we expect following a successful UPDATE request
         retrieved = True
@@ -836,15 +844,15 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Coffee"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Sauce"
         select_operation_portion = ">"
         select_value_portion = "headphones"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         update_key_portion = "price"
         update_operation_portion = "to"
         update_value_portion = "saucey"
-        update_portion_full = "[[\"" + update_key_portion + "\", \"" + update_operation_portion + "\", \"" + update_value_portion + "\"]]"
+        update_portion_full = [[update_key_portion, update_operation_portion, update_value_portion]]
 
         # Provide what we expect following an unsuccessful UPDATE request
         retrieved = True
@@ -913,15 +921,15 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Vegetables"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Name"
         select_operation_portion = "is"
         select_value_portion = "Carrots"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
         update_key_portion = "Price"
         update_operation_portion = "is"
         update_value_portion = "$4"
-        update_portion_full = "[[\"" + update_key_portion + "\", \"" + update_operation_portion + "\", \"" + update_value_portion + "\"]]"
+        update_portion_full = [[update_key_portion, update_operation_portion, update_value_portion]]
 
         # Provide what we expect following an erroneous UPDATE request
         retrieved = False
@@ -1002,11 +1010,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Books"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Title"
         select_operation_portion = "is"
         select_value_portion = "Making Poke"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
 
         # Provide what we expect following a successful DELETE request
         retrieved = True
@@ -1062,11 +1070,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Milkshakes"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Flavor"
         select_operation_portion = "is"
         select_value_portion = "earpods"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
 
         # Provide what we expect following an unsuccessful DELETE request
         retrieved = True
@@ -1123,11 +1131,11 @@ class TestEngine(unittest.TestCase):
 
         # Provide what parameters we will mock that the user provides at the CLI
         from_portion = "Gogurt"
-        from_portion_full = "[\"" + from_portion + "\"]"
+        from_portion_full = [from_portion]
         select_key_portion = "Price"
         select_operation_portion = ">"
         select_value_portion = "40.00"
-        select_portion_full = "[[\"" + select_key_portion + "\", \"" + select_operation_portion + "\", \"" + select_value_portion + "\"]]"
+        select_portion_full = [[select_key_portion, select_operation_portion, select_value_portion]]
 
         # Provide what we expect following an erroneous DELETE request
         retrieved = False
@@ -1293,8 +1301,291 @@ class TestEngine(unittest.TestCase):
         def side_effect_method_retrieve_command(whisk_displayy, input_machinee):
             return "exit"
 
-        # just test that print_general is only called once
+        # just test that print_general is only called once, and the rest client is closed
         with patch('display.Display.print_general') as mock_print_general:
-            self.test_engine.retrieve_command = side_effect_method_retrieve_command
-            self.test_engine.run_engine(self.test_whisk_display, self.test_rest_client, self.test_input_machine)
-            assert len(mock_print_general.mock_calls) == 1
+            with patch('rest_client.RestClient.close') as mock_close:
+                self.test_engine.retrieve_command = side_effect_method_retrieve_command
+                self.test_engine.run_engine(self.test_whisk_display, self.test_rest_client, self.test_input_machine)
+                assert len(mock_print_general.mock_calls) == 1
+                assert len(mock_close.mock_calls) == 1
+
+
+    def test_33_get_command_streamed(self):
+        '''
+        Tests that with streaming on, a GET prints each record of the result as it arrives.
+        '''
+        streaming_engine = Engine(stream_results = True)
+        records = [{"Item": "LED"}, {"Item": "Resistor"}]
+        mock_response = self.MockResponse(200, None)
+
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Electrical Components", "Select (key)": "Item", "Select (operation)": "is",\
+                    "Select (value)": "LED"}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_success') as mock_print_success:
+                with patch('display.Display.print_general') as mock_print_general:
+                    with patch('rest_client.RestClient.stream_get_request') as mock_stream_get_request:
+                        with patch('rest_client.RestClient.iter_records') as mock_iter_records:
+                            with patch('rest_client.RestClient.get_request') as mock_get_request:
+                                mock_gather_input.side_effect = side_effect_method_gather
+                                mock_stream_get_request.return_value = (True, mock_response)
+                                mock_iter_records.return_value = iter(records)
+                                streaming_engine.get_command(self.test_whisk_display, self.test_rest_client, self.test_input_machine)
+
+                                assert mock_stream_get_request.mock_calls == [call(["Electrical Components"], [["Item", "is", "LED"]])]
+                                assert len(mock_get_request.mock_calls) == 0
+                                assert mock_print_success.mock_calls == [call("200 :"), call("{\"Item\": \"LED\"}"),\
+                                                                         call("{\"Item\": \"Resistor\"}")]
+                                assert mock_print_general.mock_calls == [call("2 records")]
+
+
+    def test_34_run_engine_exit_summarizes_metrics(self):
+        '''
+        Tests that when EXIT is provided with instrumentation on, that the request metrics are summarized.
+        '''
+
+        def side_effect_method_retrieve_command(whisk_displayy, input_machinee):
+            return "exit"
+
+        instrumented_rest_client = RestClient(instrument = True)
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('rest_client.RestClient.close') as mock_close:
+                self.test_engine.retrieve_command = side_effect_method_retrieve_command
+                self.test_engine.run_engine(self.test_whisk_display, instrumented_rest_client, self.test_input_machine)
+                assert mock_print_general.mock_calls[1:] == [call("0 requests, 0B sent, 0B received")]
+                assert len(mock_close.mock_calls) == 1
+
+
+    def test_35_get_command_paged(self):
+        '''
+        Tests that with paging on, a GET shows the result as a table, releasing the response once paging stops.
+        '''
+        paging_engine = Engine(pager = TablePager(2))
+        mock_response = Mock(status_code = 200)
+
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Electrical Components", "Select (key)": "Item", "Select (operation)": "is",\
+                    "Select (value)": "LED", "Press Enter for more, or q to stop": "q"}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_success') as mock_print_success:
+                with patch('display.Display.print_general') as mock_print_general:
+                    with patch('rest_client.RestClient.stream_get_request') as mock_stream_get_request:
+                        with patch('rest_client.RestClient.iter_records') as mock_iter_records:
+                            mock_gather_input.side_effect = side_effect_method_gather
+                            mock_stream_get_request.return_value = (True, mock_response)
+                            mock_iter_records.return_value = iter([{"Item": "LED"}, {"Item": "Resistor"}, {"Item": "Fuse"}])
+                            paging_engine.get_command(self.test_whisk_display, self.test_rest_client, self.test_input_machine)
+
+                            assert mock_print_success.mock_calls == [call("200 :"), call("LED"), call("Resistor")]
+                            assert mock_print_general.mock_calls == [call("Item"), call("--------"), call("2 records shown")]
+                            assert len(mock_response.close.mock_calls) == 1
+
+
+    def test_36_recall_command(self):
+        '''
+        Tests that RECALL lists the recent commands, and runs the one chosen again without prompting for its portions.
+        '''
+        recalling_input_machine = InputMachine()
+        recalling_input_machine.remember_command({"Command": "DELETE", "From": ["Ice Cream"], "Select": [["Flavor", "is", "Mint"]]})
+        recalling_input_machine.remember_command({"Command": "GET", "From": ["Ice Cream"], "Select": []})
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_general') as mock_print_general:
+                with patch('display.Display.print_success') as mock_print_success:
+                    with patch('rest_client.RestClient.delete_request') as mock_delete_request:
+                        mock_gather_input.return_value = "2"
+                        mock_delete_request.return_value = (True, self.MockResponse(204, b""))
+                        Engine().recall_command(self.test_whisk_display, self.test_rest_client, recalling_input_machine)
+
+                        assert mock_print_general.mock_calls == [call("1: GET [\"Ice Cream\"] []"),\
+                            call("2: DELETE [\"Ice Cream\"] [[\"Flavor\", \"is\", \"Mint\"]]")]
+                        assert mock_gather_input.mock_calls == [call("Command to run again (number)")]
+                        assert mock_delete_request.mock_calls == [call(["Ice Cream"], [["Flavor", "is", "Mint"]])]
+                        assert mock_print_success.mock_calls == [call("204 : b''")]
+                        assert recalling_input_machine.recent_commands()[0]["Command"] == "DELETE"
+
+
+    def test_37_recall_command_nothing_to_recall(self):
+        '''
+        Tests that RECALL reports when there is nothing to recall, or no such command is chosen.
+        '''
+        recalling_input_machine = InputMachine()
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_error') as mock_print_error:
+                with patch('display.Display.print_general'):
+                    Engine().recall_command(self.test_whisk_display, self.test_rest_client, recalling_input_machine)
+                    assert mock_print_error.mock_calls == [call("No commands have been run yet.")]
+
+                    recalling_input_machine.remember_command({"Command": "GET", "From": ["Ice Cream"], "Select": []})
+                    mock_gather_input.return_value = "5"
+                    Engine().recall_command(self.test_whisk_display, self.test_rest_client, recalling_input_machine)
+                    assert str(mock_print_error.mock_calls[-1][1][0]) == "There is no command 5."
+
+
+    def test_38_get_command_remembered(self):
+        '''
+        Tests that a command run at the prompts is remembered as a whole.
+        '''
+        remembering_input_machine = InputMachine()
+
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Electrical Components", "Select (key)": "Item", "Select (operation)": "is",\
+                    "Select (value)": "LED"}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_success'):
+                with patch('rest_client.RestClient.get_request') as mock_get_request:
+                    mock_gather_input.side_effect = side_effect_method_gather
+                    mock_get_request.return_value = (True, self.MockResponse(200, b"[]"))
+                    Engine().get_command(self.test_whisk_display, self.test_rest_client, remembering_input_machine)
+                    assert remembering_input_machine.recent_commands() ==\
+                        [{"Command": "GET", "From": ["Electrical Components"], "Select": [["Item", "is", "LED"]]}]
+
+
+    def test_39_get_command_compact_select(self):
+        '''
+        Tests that, with compact select on, several queries can be given for the Select portion on one line.
+        '''
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Ice Cream", "Select": "Price,>=,2; Flavor,is,Mint"}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_success'):
+                with patch('display.Display.print_error') as mock_print_error:
+                    with patch('rest_client.RestClient.get_request') as mock_get_request:
+                        mock_gather_input.side_effect = side_effect_method_gather
+                        mock_get_request.return_value = (True, self.MockResponse(200, b"[]"))
+                        Engine(compact_select = True).get_command(self.test_whisk_display, self.test_rest_client,\
+                                                                  InputMachine())
+                        assert mock_gather_input.mock_calls == [call("From"), call("Select")]
+                        assert mock_get_request.mock_calls ==\
+                            [call(["Ice Cream"], [["Price", ">=", "2"], ["Flavor", "is", "Mint"]])]
+
+                        mock_gather_input.side_effect = lambda input_prompt: "Flavor" if input_prompt == "Select"\
+                            else "Ice Cream"
+                        Engine(compact_select = True).get_command(self.test_whisk_display, self.test_rest_client,\
+                                                                  InputMachine())
+                        assert str(mock_print_error.mock_calls[0][1][0]) ==\
+                            "\"Flavor\" is not of the form key,operation,value"
+                        assert len(mock_get_request.mock_calls) == 1
+
+
+    def test_40_get_command_pipeline(self):
+        '''
+        Tests that with a pipeline set up, a GET streams the result, showing only the trimmed records.
+        '''
+        trimming_engine = Engine(pipeline = ResultPipeline(["Item"], [["Count", ">", "1"]], limit = 1))
+        mock_response = Mock(status_code = 200)
+
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Electrical Components", "Select (key)": "Item", "Select (operation)": "is not",\
+                    "Select (value)": "Fuse"}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_success') as mock_print_success:
+                with patch('display.Display.print_general') as mock_print_general:
+                    with patch('rest_client.RestClient.stream_get_request') as mock_stream_get_request:
+                        with patch('rest_client.RestClient.iter_records') as mock_iter_records:
+                            mock_gather_input.side_effect = side_effect_method_gather
+                            mock_stream_get_request.return_value = (True, mock_response)
+                            mock_iter_records.return_value = iter([{"Item": "LED", "Count": 1},\
+                                {"Item": "Resistor", "Count": 5}, {"Item": "Switch", "Count": 2}])
+                            trimming_engine.get_command(self.test_whisk_display, self.test_rest_client, InputMachine())
+
+                            assert mock_print_success.mock_calls == [call("200 :"), call("{\"Item\": \"Resistor\"}")]
+                            assert mock_print_general.mock_calls == [call("1 records")]
+                            assert len(mock_response.close.mock_calls) == 1
+
+
+    def test_41_run_engine_banner(self):
+        '''
+        Tests that the engine reminds the user of where the Rest Client is pointed, on every loop.
+        '''
+        retrieved_command_return_values = ["exit", "help"]
+
+        def side_effect_method_retrieve_command(whisk_displayy, input_machinee):
+            return retrieved_command_return_values.pop()
+
+        banner_engine = Engine()
+        banner_engine.retrieve_command = side_effect_method_retrieve_command
+        banner_engine.help_command = lambda whisk_displayy, input_machinee: None
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('rest_client.RestClient.close'):
+                banner_engine.run_engine(self.test_whisk_display, RestClient("https://", "db.local", "9000"),\
+                                         InputMachine())
+                assert mock_print_general.mock_calls == [call("Using https://db.local:9000/")] * 2
+
+
+    def test_42_registered_command(self):
+        '''
+        Tests that a newly registered command is listed, has help, and is dispatched to by the engine.
+        '''
+        retrieved_command_return_values = ["exit", "ping"]
+        pings = []
+
+        def side_effect_method_retrieve_command(whisk_displayy, input_machinee):
+            return retrieved_command_return_values.pop()
+
+        registering_engine = Engine()
+        registering_engine.commands.register(RegisteredCommand("PING", lambda whisk_displayy, rest_clientt,\
+            input_machinee: pings.append(rest_clientt), ["This command checks that MatchaDB is up."]))
+        assert registering_engine.commands.listing() == "GET, POST, UPDATE, DELETE, RECALL, HELP, EXIT, PING"
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_general') as mock_print_general:
+                mock_gather_input.return_value = "ping"
+                registering_engine.help_command(self.test_whisk_display, InputMachine())
+                assert mock_print_general.mock_calls[-1] == call("This command checks that MatchaDB is up.")
+
+        registering_engine.retrieve_command = side_effect_method_retrieve_command
+        with patch('display.Display.print_general'):
+            with patch('rest_client.RestClient.close') as mock_close:
+                registering_engine.run_engine(self.test_whisk_display, self.test_rest_client, InputMachine())
+                assert pings == [self.test_rest_client]
+                assert len(mock_close.mock_calls) == 1
+
+
+    def test_43_delete_command_blank_compact_select(self):
+        '''
+        Tests that, with compact select on, a blank Select is refused rather than deleting every record.
+        '''
+        def side_effect_method_gather(input_prompt):
+            return {"From": "Ice Cream", "Select": " ; "}[input_prompt]
+
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_error') as mock_print_error:
+                with patch('rest_client.RestClient.delete_request') as mock_delete_request:
+                    mock_gather_input.side_effect = side_effect_method_gather
+                    Engine(compact_select = True).delete_command(self.test_whisk_display, self.test_rest_client,\
+                                                                 InputMachine())
+                    assert str(mock_print_error.mock_calls[0][1][0]) == "At least one query must be provided for Select."
+                    assert len(mock_delete_request.mock_calls) == 0
+
+
+    def test_44_recall_command_malformed(self):
+        '''
+        Tests that RECALL reports a remembered command it cannot list, rather than stopping the engine.
+        '''
+        recalling_input_machine = InputMachine()
+        recalling_input_machine.remember_command({"From": ["Ice Cream"]})
+        with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+            with patch('display.Display.print_error') as mock_print_error:
+                with patch('display.Display.print_general'):
+                    Engine().recall_command(self.test_whisk_display, self.test_rest_client, recalling_input_machine)
+                    assert len(mock_print_error.mock_calls) == 1
+                    assert len(mock_gather_input.mock_calls) == 0
+
+
+
+    def test_45_help_command_compact_select(self):
+        '''
+        Tests that, with compact select on, the help describes the Select portion as queries on one line.
+        '''
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+                mock_gather_input.return_value = "delete"
+                Engine(compact_select = True).help_command(self.test_whisk_display, InputMachine())
+                assert mock_print_general.call_args_list[-1] ==\
+                    call("Select: Queries of format key,operation,value, separated by semicolons on one line")
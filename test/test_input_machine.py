@@ -8,6 +8,8 @@ sammatime22, 2021
 import sys
 sys.path.append('src')
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, call
 from input_machine import InputMachine
@@ -54,3 +56,50 @@ class TestInputMachine(unittest.TestCase):
             mock_input.side_effect = [Exception]  # We will set a side effect for the mock input to be an exception
             contents = self.test_input_machine.gather_input(self.what_can_i_get_you)
             assert contents == None
+
+
+    def test_03_remember_command(self):
+        '''
+        Tests that whole commands are remembered most recent first, without repeats, up to the history length.
+        '''
+        remembering_input_machine = InputMachine()
+        remembering_input_machine.command_history_length = 3
+        for table in ["A", "B", "A", "C", "D"]:
+            remembering_input_machine.remember_command({"Command": "GET", "From": [table], "Select": []})
+        assert [command["From"][0] for command in remembering_input_machine.recent_commands()] == ["D", "C", "A"]
+
+
+    def test_04_save_and_load_history(self):
+        '''
+        Tests that the line history and the command history outlive the session, with repeated lines dropped.
+        '''
+        history_path = os.path.join(tempfile.mkdtemp(), "history")
+        first_session = InputMachine(history_path = history_path)
+        first_session.readline.clear_history()
+        for line in ["get", "Ice Cream", "get", "Ice Cream", "exit"]:
+            first_session.readline.add_history(line)
+        first_session.remember_command({"Command": "DELETE", "From": ["Ice Cream"], "Select": []})
+        first_session.save_history()
+
+        first_session.readline.clear_history()
+        second_session = InputMachine(history_path = history_path)
+        readline = second_session.readline
+        assert [readline.get_history_item(index) for index in range(1, readline.get_current_history_length() + 1)] ==\
+            ["get", "Ice Cream", "exit"]
+        assert second_session.recent_commands() == [{"Command": "DELETE", "From": ["Ice Cream"], "Select": []}]
+        readline.clear_history()
+        os.remove(history_path)
+        os.remove(history_path + InputMachine.COMMANDS_SUFFIX)
+
+
+    def test_05_load_history_skips_non_commands(self):
+        '''
+        Tests that lines of the command history which do not hold a command are skipped when it is loaded.
+        '''
+        history_path = os.path.join(tempfile.mkdtemp(), "history")
+        with open(history_path + InputMachine.COMMANDS_SUFFIX, "w") as commands_file:
+            commands_file.write("5\n{\"From\": [\"T\"]}\nnot json\n[\"GET\"]\n")
+            commands_file.write("{\"Command\": \"GET\", \"From\": [\"T\"], \"Select\": []}\n")
+        loading_session = InputMachine(history_path = history_path)
+        assert loading_session.recent_commands() == [{"Command": "GET", "From": ["T"], "Select": []}]
+        os.remove(history_path + InputMachine.COMMANDS_SUFFIX)
@@ -0,0 +1,113 @@
+'''
+This file tests the Instrumentation and RequestMetrics classes, and the instrumented Rest Client.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from instrumentation import Instrumentation, RequestMetrics
+from mock_server import MockMatchaDB
+from rest_client import RestClient
+
+
+class TestInstrumentation(unittest.TestCase):
+    '''
+    A set of tests for the Instrumentation class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # A sample test FROM query portion
+    test_sample_from_portion = ["Ice Cream"]
+
+    # A sample test SELECT query portion
+    test_sample_select_portion = [["id", "is", "1"]]
+
+
+    def test_01_describe(self):
+        '''
+        Tests that a request's metrics are described in milliseconds, with missing timings shown as -.
+        '''
+        metrics = RequestMetrics("GET", 12)
+        metrics.connect = 0.002
+        metrics.total = 0.0105
+        metrics.bytes_received = 40
+        assert metrics.describe() == "[connect 2.0ms, first byte -, total 10.5ms, sent 12B, received 40B]"
+
+
+    def test_02_summarize(self):
+        '''
+        Tests that the summary totals every request, then breaks them down per command.
+        '''
+        instrumentation = Instrumentation()
+        for command, total, status_code in [("GET", 0.01, 200), ("GET", 0.03, 200), ("POST", None, None)]:
+            metrics = RequestMetrics(command, 10)
+            metrics.total = total
+            metrics.status_code = status_code
+            metrics.bytes_received = 5 if status_code is not None else 0
+            instrumentation.record(metrics)
+
+        assert instrumentation.summarize() == ["3 requests, 30B sent, 10B received",\
+            "GET: 2 requests, 0 failed, mean 20.0ms, max 30.0ms, connecting 0.0ms",\
+            "POST: 1 requests, 1 failed"]
+
+
+    def test_03_connect_time_per_thread(self):
+        '''
+        Tests that connection time is kept for the request in progress, and reset as each begins.
+        '''
+        instrumentation = Instrumentation()
+        instrumentation.begin()
+        instrumentation.add_connect_time(0.5)
+        instrumentation.add_connect_time(0.25)
+        assert instrumentation.connect_time() == 0.75
+        instrumentation.begin()
+        assert instrumentation.connect_time() == 0.0
+
+
+    def test_04_instrumented_requests(self):
+        '''
+        Tests an instrumented Rest Client against the stand-in, so that only the first request pays to connect.
+        '''
+        mock = MockMatchaDB()
+        mock.seed("Ice Cream", 3)
+        protocol, host, port = mock.start()
+        test_rest_client = RestClient(protocol, host, port, instrument = True)
+        try:
+            first = test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)[1]
+            second = test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)[1]
+
+            assert first.metrics.connect > 0
+            assert second.metrics.connect == 0
+            assert second.metrics.status_code == 200
+            assert second.metrics.bytes_received == len(second.content)
+            assert second.metrics.total >= second.metrics.time_to_first_byte
+            assert len(test_rest_client.instrumentation.metrics) == 2
+        finally:
+            test_rest_client.close()
+            mock.stop()
+
+
+    def test_05_instrumented_stream(self):
+        '''
+        Tests that a streamed GET is recorded once its body has been read in full.
+        '''
+        mock = MockMatchaDB()
+        mock.seed("Ice Cream", 50)
+        protocol, host, port = mock.start()
+        test_rest_client = RestClient(protocol, host, port, instrument = True)
+        try:
+            retrieved, response = test_rest_client.stream_get_request(self.test_sample_from_portion, [])
+            assert retrieved
+            assert len(test_rest_client.instrumentation.metrics) == 0
+            assert len(list(test_rest_client.iter_records(response))) == 50
+            assert test_rest_client.instrumentation.metrics == [response.metrics]
+            assert response.metrics.bytes_received > 0
+        finally:
+            test_rest_client.close()
+            mock.stop()
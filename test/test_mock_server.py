@@ -0,0 +1,166 @@
+'''
+This file tests the stand-in MatchaDB, and runs the Rest Client against it end to end.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import json
+import time
+import unittest
+from mock_server import MockMatchaDB
+from rest_client import RestClient
+
+
+class TestMockServer(unittest.TestCase):
+    '''
+    A set of tests for the Mock MatchaDB class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # A sample test FROM query portion
+    test_sample_from_portion = "[\"Ice Cream\"]"
+
+    # A sample test SELECT query portion
+    test_sample_select_portion = "[[\"Flavor\", \"is\", \"Mint\"]]"
+
+
+    def setUp(self):
+        '''
+        Starts a stand-in, and a Rest Client pointed at it.
+        '''
+        self.mock = MockMatchaDB()
+        protocol, host, port = self.mock.start()
+        self.test_rest_client = RestClient(protocol, host, port)
+
+
+    def tearDown(self):
+        self.test_rest_client.close()
+        self.mock.stop()
+
+
+    def test_01_handle_commands(self):
+        '''
+        Tests each command against the in-memory tables, without going over the network.
+        '''
+        insert = json.dumps({"From": ["Ice Cream"], "Select": [], "Insert": {"Flavor": "Mint", "Price": 2}}).encode()
+        assert self.mock.handle("POST", insert) == (201, b"")
+        assert self.mock.handle("POST", insert.replace(b"Mint", b"Vanilla")) == (201, b"")
+
+        select = json.dumps({"From": ["Ice Cream"], "Select": [["Price", ">=", "2"], ["Flavor", "!=", "Vanilla"]]}).encode()
+        assert json.loads(self.mock.handle("GET", select)[1].decode()) == [{"Flavor": "Mint", "Price": 2}]
+
+        update = json.dumps({"From": ["Ice Cream"], "Select": [["Flavor", "is", "Mint"]], "Update": [["Price", "to", 1]]})
+        assert self.mock.handle("PUT", update.encode()) == (200, b"")
+        assert self.mock.tables["Ice Cream"][0]["Price"] == 1
+
+        delete = json.dumps({"From": ["Ice Cream"], "Select": [["Flavor", "contains", "int"]]}).encode()
+        assert self.mock.handle("DELETE", delete) == (204, b"")
+        assert self.mock.tables["Ice Cream"] == [{"Flavor": "Vanilla", "Price": 2}]
+
+
+    def test_02_handle_bad_body(self):
+        '''
+        Tests that a body that cannot be read is answered with a 400.
+        '''
+        self.mock.seed("x", 1)
+        assert self.mock.handle("GET", b"not json")[0] == 400
+        assert self.mock.handle("GET", b"{\"Select\": []}")[0] == 400
+        assert self.mock.handle("GET", b"{\"From\": [\"x\"], \"Select\": [[\"id\", \"near\", 1]]}")[0] == 400
+
+
+    def test_03_rest_client_end_to_end(self):
+        '''
+        Tests the Rest Client against the stand-in over real sockets, for each request type.
+        '''
+        retrieved, response = self.test_rest_client.post_request(self.test_sample_from_portion, "[]", "{\"Flavor\": \"Mint\"}")
+        assert retrieved == True and response.status_code == 201
+
+        retrieved, response = self.test_rest_client.update_request(self.test_sample_from_portion,\
+            self.test_sample_select_portion, "[[\"Price\", \"to\", 1]]")
+        assert retrieved == True and response.status_code == 200
+
+        retrieved, response = self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+        assert retrieved == True and response.status_code == 200
+        assert json.loads(response.content.decode()) == [{"Flavor": "Mint", "Price": 1}]
+
+        retrieved, response = self.test_rest_client.delete_request(self.test_sample_from_portion, self.test_sample_select_portion)
+        assert retrieved == True and response.status_code == 204
+        assert self.mock.tables["Ice Cream"] == []
+
+
+    def test_04_keep_alive(self):
+        '''
+        Tests that the Rest Client's requests share one kept-alive connection.
+        '''
+        for index in range(20):
+            self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+        assert self.mock.request_count == 20
+        assert self.mock.connection_count == 1
+
+
+    def test_05_large_response(self):
+        '''
+        Tests that a large, seeded table is returned whole.
+        '''
+        self.mock.seed("Big", 2000, 500)
+        retrieved, response = self.test_rest_client.get_request("[\"Big\"]", "[]")
+        assert retrieved == True
+        assert len(response.content) > 2000 * 500
+        assert len(json.loads(response.content.decode())) == 2000
+
+
+    def test_06_latency(self):
+        '''
+        Tests that the configured latency is added to each request.
+        '''
+        self.mock.latency = 0.1
+        start = time.perf_counter()
+        self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+        assert time.perf_counter() - start >= 0.1
+
+
+    def test_07_streamed_get(self):
+        '''
+        Tests that a large result can be streamed record by record, releasing the connection after.
+        '''
+        self.mock.seed("Big", 5000, 100)
+        retrieved, response = self.test_rest_client.stream_get_request(["Big"], [])
+        assert retrieved == True and response.status_code == 200
+
+        count = 0
+        for record in self.test_rest_client.iter_records(response, 4096):
+            assert record["id"] == str(count)
+            count += 1
+        assert count == 5000
+
+        # The connection went back to the pool, so the next request reuses it
+        self.test_rest_client.get_request(["Big"], [["id", "is", "1"]])
+        assert self.mock.connection_count == 1
+
+
+    def test_08_compression(self):
+        '''
+        Tests that compressed request bodies are understood, and compressed responses read back whole.
+        '''
+        self.mock.compress_responses = True
+        compressing_rest_client = RestClient(*self.test_rest_client.get_protocol_host_port(), compress_threshold = 1024)
+        try:
+            records = [{"id": str(index), "value": "x" * 100} for index in range(1000)]
+            retrieved, response = compressing_rest_client.post_request(["Big"], [], records)
+            assert retrieved == True and response.status_code == 201
+            assert len(self.mock.tables["Big"]) == 1000
+
+            retrieved, response = compressing_rest_client.get_request(["Big"], [])
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert json.loads(response.content.decode()) == records
+
+            retrieved, response = compressing_rest_client.stream_get_request(["Big"], [])
+            assert list(compressing_rest_client.iter_records(response, 512)) == records
+        finally:
+            compressing_rest_client.close()
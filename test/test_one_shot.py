@@ -0,0 +1,159 @@
+'''
+This file tests the OneShot class, running single commands as they would be given on the command line.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import io
+import json
+import socket
+import subprocess
+import unittest
+from mock_server import MockMatchaDB
+from one_shot import OneShot
+from rest_client import RestClient
+
+
+class TestOneShot(unittest.TestCase):
+    '''
+    A set of tests for the OneShot class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # The one-shot runner under test
+    test_one_shot = OneShot()
+
+
+    def setUp(self):
+        '''
+        Starts a stand-in, and a Rest Client pointed at it.
+        '''
+        self.mock = MockMatchaDB()
+        self.mock.seed("users", 10)
+        protocol, host, port = self.mock.start()
+        self.test_rest_client = RestClient(protocol, host, port)
+        self.output = io.StringIO()
+        self.errors = io.StringIO()
+
+
+    def tearDown(self):
+        self.test_rest_client.close()
+        self.mock.stop()
+
+
+    def run_command(self, command, options):
+        '''
+        Runs a command, capturing what it writes.
+        '''
+        return self.test_one_shot.run(self.test_rest_client, command, options, self.output, self.errors)
+
+
+    def test_01_build_operation_multi_select(self):
+        '''
+        Tests that several queries may be given to --select and --update, separated by semicolons.
+        '''
+        assert self.test_one_shot.build_operation("GET", {"from": "users", "select": "id,>,5; value,contains,a,b"}) ==\
+            {"Command": "GET", "From": ["users"], "Select": [["id", ">", "5"], ["value", "contains", "a,b"]]}
+        assert self.test_one_shot.build_operation("UPDATE", {"from": "users", "select": "id,==,1",\
+                                                             "update": "a,to,1;b,to,2"})["Update"] ==\
+            [["a", "to", "1"], ["b", "to", "2"]]
+        with self.assertRaises(ValueError):
+            self.test_one_shot.build_operation("GET", {"from": "users", "select": "id==5"})
+
+
+    def test_02_build_operation(self):
+        '''
+        Tests that the options given alongside each command build its operation.
+        '''
+        assert self.test_one_shot.build_operation("get", {"from": "users", "select": "id,==,5"}) ==\
+            {"Command": "GET", "From": ["users"], "Select": [["id", "==", "5"]]}
+        assert self.test_one_shot.build_operation("POST", {"from": "users", "insert": "{\"id\": \"11\"}"}) ==\
+            {"Command": "POST", "From": ["users"], "Select": [], "Insert": {"id": "11"}}
+        assert self.test_one_shot.build_operation("UPDATE", {"from": "users", "select": "id,==,1", "update": "value,to,y"}) ==\
+            {"Command": "UPDATE", "From": ["users"], "Select": [["id", "==", "1"]], "Update": [["value", "to", "y"]]}
+        with self.assertRaises(ValueError):
+            self.test_one_shot.build_operation("GET", {"select": "id,==,5"})
+        with self.assertRaises(ValueError):
+            self.test_one_shot.build_operation("POST", {"from": "users"})
+
+
+    def test_03_get(self):
+        '''
+        Tests that a GET prints the body of the response and exits successfully.
+        '''
+        assert self.run_command("GET", {"from": "users", "select": "id,==,5"}) == OneShot.EXIT_SUCCESS
+        assert json.loads(self.output.getvalue()) == [{"id": "5", "value": ""}]
+        assert self.errors.getvalue() == ""
+
+
+    def test_04_writes(self):
+        '''
+        Tests that the write commands exit successfully, printing nothing for empty bodies.
+        '''
+        assert self.run_command("POST", {"from": "users", "insert": "{\"id\": \"10\"}"}) == OneShot.EXIT_SUCCESS
+        assert self.run_command("UPDATE", {"from": "users", "select": "id,==,10", "update": "value,to,y"}) ==\
+            OneShot.EXIT_SUCCESS
+        assert self.run_command("DELETE", {"from": "users", "select": "id,<,5"}) == OneShot.EXIT_SUCCESS
+        assert self.output.getvalue() == ""
+        assert len(self.mock.tables["users"]) == 6
+
+
+    def test_05_failures(self):
+        '''
+        Tests the exit statuses of a bad command, a rejected request, and an unreachable MatchaDB.
+        '''
+        assert self.run_command("GET", {}) == OneShot.EXIT_USAGE
+        assert self.run_command("GET", {"from": "users", "select": "id,~,5"}) == OneShot.EXIT_CLIENT_ERROR
+        assert self.errors.getvalue().splitlines()[-1] == "400"
+
+        unused_socket = socket.socket()
+        unused_socket.bind(("127.0.0.1", 0))
+        unused_port = unused_socket.getsockname()[1]
+        unused_socket.close()
+
+        bad_rest_client = RestClient("http://", "127.0.0.1", str(unused_port))
+        assert self.test_one_shot.run(bad_rest_client, "GET", {"from": "users"}, self.output, self.errors) ==\
+            OneShot.EXIT_FAILURE
+        bad_rest_client.close()
+        assert self.errors.getvalue().splitlines()[-1] == "A connection error has occurred."
+
+
+    def test_06_exit_status(self):
+        '''
+        Tests that the exit status reflects the class of the status code.
+        '''
+        assert self.test_one_shot.exit_status("DELETE", 204) == OneShot.EXIT_SUCCESS
+        assert self.test_one_shot.exit_status("DELETE", 200) == OneShot.EXIT_FAILURE
+        assert self.test_one_shot.exit_status("GET", 404) == OneShot.EXIT_CLIENT_ERROR
+        assert self.test_one_shot.exit_status("GET", 503) == OneShot.EXIT_SERVER_ERROR
+
+
+    def test_07_command_line(self):
+        '''
+        Tests a one-shot command run from the command line against the stand-in.
+        '''
+        completed = subprocess.run([sys.executable, "whisk.py", "get", "--mock", "--from", "users"],\
+                                   stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+        assert completed.returncode == OneShot.EXIT_SUCCESS
+        assert completed.stdout == b"[]\n"
+
+
+    def test_08_writes_need_a_select(self):
+        '''
+        Tests that an UPDATE or DELETE without a Select (or Update) is refused, rather than run against every record.
+        '''
+        assert self.run_command("DELETE", {"from": "users"}) == OneShot.EXIT_USAGE
+        assert self.run_command("DELETE", {"from": "users", "select": " ; "}) == OneShot.EXIT_USAGE
+        assert self.run_command("UPDATE", {"from": "users", "select": "", "update": "value,to,y"}) == OneShot.EXIT_USAGE
+        assert self.run_command("UPDATE", {"from": "users", "select": "id,==,1", "update": ";"}) == OneShot.EXIT_USAGE
+        assert self.errors.getvalue().splitlines()[0] ==\
+            "The command could not be built: --select with at least one query is required for DELETE."
+        assert len(self.mock.tables["users"]) == 10
+        assert all(record["value"] == "" for record in self.mock.tables["users"])
@@ -0,0 +1,79 @@
+'''
+This file tests the BufferedSink class, such that output is gathered into few writes yet never lost.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import io
+import time
+import unittest
+from output_sink import BufferedSink
+
+
+class TestOutputSink(unittest.TestCase):
+    '''
+    A set of tests for the BufferedSink class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    class TerminalStream(io.StringIO):
+        '''
+        A mock terminal, to check the sink can tell it apart from a file or pipe.
+        '''
+
+        def isatty(self):
+            return True
+
+
+    def test_01_size_threshold(self):
+        '''
+        Tests that text is held until the buffer reaches its size threshold.
+        '''
+        stream = io.StringIO()
+        sink = BufferedSink(stream, 10, 60)
+        sink.write("hello\n")
+        assert stream.getvalue() == ""
+        sink.write("world\n")
+        assert stream.getvalue() == "hello\nworld\n"
+
+
+    def test_02_flush_interval(self):
+        '''
+        Tests that text held for the flush interval is written with the next write.
+        '''
+        stream = io.StringIO()
+        sink = BufferedSink(stream, 1000, 0.05)
+        sink.write("a\n")
+        assert stream.getvalue() == ""
+        time.sleep(0.06)
+        sink.write("b\n")
+        assert stream.getvalue() == "a\nb\n"
+
+
+    def test_03_flush(self):
+        '''
+        Tests that flushing writes out everything held, in order.
+        '''
+        stream = io.StringIO()
+        sink = BufferedSink(stream)
+        for index in range(100):
+            sink.write(str(index) + "\n")
+        assert stream.getvalue() == ""
+        sink.flush()
+        assert stream.getvalue() == "".join(str(index) + "\n" for index in range(100))
+
+
+    def test_04_isatty(self):
+        '''
+        Tests that the sink knows whether it writes to a terminal.
+        '''
+        assert BufferedSink(self.TerminalStream()).isatty()
+        assert not BufferedSink(io.StringIO()).isatty()
+        assert not BufferedSink(object()).isatty()
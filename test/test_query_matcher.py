@@ -0,0 +1,51 @@
+'''
+This file tests the QueryMatcher class, such that records are matched against queries as MatchaDB would.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from query_matcher import QueryMatcher
+
+
+class TestQueryMatcher(unittest.TestCase):
+    '''
+    A set of tests for the QueryMatcher class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # The QueryMatcher object under test
+    test_query_matcher = QueryMatcher()
+
+
+    def test_01_matches_query(self):
+        '''
+        Tests each operation, with numbers ordered as numbers and anything else as text.
+        '''
+        assert self.test_query_matcher.matches_query(5, "is", "5")
+        assert self.test_query_matcher.matches_query("Mint", "!=", "Mango")
+        assert self.test_query_matcher.matches_query(10, ">", "9")
+        assert not self.test_query_matcher.matches_query("10", "<=", 9.5)
+        assert self.test_query_matcher.matches_query("b", ">", "a")
+        assert self.test_query_matcher.matches_query("Mint Chip", "contains", "Chip")
+        with self.assertRaises(ValueError):
+            self.test_query_matcher.matches_query(5, "~", 5)
+
+
+    def test_02_matches(self):
+        '''
+        Tests that a record must hold every key and satisfy every query, and that only objects can match.
+        '''
+        record = {"Flavor": "Mint", "Price": 3}
+        assert self.test_query_matcher.matches(record, [])
+        assert self.test_query_matcher.matches(record, [["Flavor", "is", "Mint"], ["Price", "<", "4"]])
+        assert not self.test_query_matcher.matches(record, [["Flavor", "is", "Mint"], ["Price", ">", "4"]])
+        assert not self.test_query_matcher.matches(record, [["Size", "is", "S"]])
+        assert not self.test_query_matcher.matches("Mint", [["Flavor", "is", "Mint"]])
@@ -0,0 +1,96 @@
+'''
+This file tests the Record Stream, that records are read incrementally from chunks of a body.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import json
+import unittest
+from record_stream import RecordStream
+
+
+class TestRecordStream(unittest.TestCase):
+    '''
+    A set of tests for the Record Stream class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # The record stream for test
+    test_record_stream = RecordStream()
+
+    # A sample body, with awkward content
+    test_records = [{"Flavor": "Crème [brûlée]", "Price": 2.5}, 12345, "a, \"quoted\" ]", [1, [2]], None, {}]
+
+
+    def test_01_every_split(self):
+        '''
+        Tests that the records are read correctly wherever the body is split into two chunks.
+        '''
+        body = json.dumps(self.test_records, ensure_ascii = False).encode("utf-8")
+        for split in range(len(body) + 1):
+            records = list(self.test_record_stream.iter_records([body[:split], body[split:]]))
+            assert records == self.test_records, split
+
+
+    def test_02_byte_at_a_time(self):
+        '''
+        Tests that the records are read correctly when every byte arrives on its own.
+        '''
+        body = json.dumps(self.test_records, ensure_ascii = False, indent = 2).encode("utf-8")
+        records = list(self.test_record_stream.iter_records(body[index:index + 1] for index in range(len(body))))
+        assert records == self.test_records
+
+
+    def test_03_incremental(self):
+        '''
+        Tests that each record is yielded before the rest of the body has been read.
+        '''
+        read = []
+
+        def chunks():
+            for index in range(1000):
+                read.append(index)
+                yield (b"[" if index == 0 else b",") + json.dumps({"id": index}).encode("utf-8")
+            yield b"]"
+
+        records = self.test_record_stream.iter_records(chunks())
+        for index in range(1000):
+            assert next(records) == {"id": index}
+            assert len(read) <= index + 2
+        assert list(records) == []
+
+
+    def test_04_empty_and_single(self):
+        '''
+        Tests an empty array, an empty body, and a body which is not an array.
+        '''
+        assert list(self.test_record_stream.iter_records([b" [ ", b" ] "])) == []
+        assert list(self.test_record_stream.iter_records([b""])) == []
+        assert list(self.test_record_stream.iter_records([b"{\"Error\":", b" \"x\"}"])) == [{"Error": "x"}]
+
+
+    def test_05_cut_off(self):
+        '''
+        Tests that an array which is cut off is reported as an error.
+        '''
+        with self.assertRaises(ValueError):
+            list(self.test_record_stream.iter_records([b"[{\"id\": 1}, {\"id\""]))
+
+
+    def test_06_numbers_cut_inside(self):
+        '''
+        Tests that a number cut inside its fraction or exponent is read whole, byte by byte and in small chunks.
+        '''
+        body = b"[1e5]"
+        assert list(self.test_record_stream.iter_records([body[index:index + 1] for index in range(len(body))])) ==\
+            [1e5]
+        body = b"[-1.5e3]"
+        for size in (1, 2, 3):
+            chunks = [body[index:index + size] for index in range(0, len(body), size)]
+            assert list(self.test_record_stream.iter_records(chunks)) == [-1.5e3], size
@@ -0,0 +1,78 @@
+'''
+This file tests the Request Builder, that request bodies are serialized once and correctly.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import json
+import unittest
+from unittest.mock import patch
+import request_builder
+from request_builder import RequestBuilder
+
+
+class TestRequestBuilder(unittest.TestCase):
+    '''
+    A set of tests for the Request Builder class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # The request builder for test
+    test_request_builder = RequestBuilder()
+
+
+    def test_01_build_body(self):
+        '''
+        Tests that the portions are serialized as compact UTF-8 JSON, in a fixed order.
+        '''
+        body = self.test_request_builder.build_body(["Ice Cream"], [["Flavor", "is", "Mint"]], insert_portion = {"Price": 2})
+        assert isinstance(body, bytes)
+        assert json.loads(body.decode("utf-8")) == \
+            {"From": ["Ice Cream"], "Select": [["Flavor", "is", "Mint"]], "Insert": {"Price": 2}}
+        assert b" " not in body.replace(b"Ice Cream", b"")
+
+
+    def test_02_quoting(self):
+        '''
+        Tests that values holding quotes, backslashes, and non-ASCII text survive the round trip.
+        '''
+        awkward = "Say \"cheese\" \\ 'crème brûlée'"
+        body = self.test_request_builder.build_body([awkward], [[awkward, "is", awkward]], update_portion = [[awkward, "to", 1]])
+        parameter_vals = json.loads(body.decode("utf-8"))
+        assert parameter_vals["From"] == [awkward]
+        assert parameter_vals["Select"] == [[awkward, "is", awkward]]
+        assert parameter_vals["Update"] == [[awkward, "to", 1]]
+
+
+    def test_03_string_portions(self):
+        '''
+        Tests that portions given as JSON strings are parsed, and invalid ones rejected.
+        '''
+        body = self.test_request_builder.build_body("[\"Ice Cream\"]", "[]", insert_portion = "{\"Price\": 2}")
+        assert json.loads(body.decode("utf-8")) == {"From": ["Ice Cream"], "Select": [], "Insert": {"Price": 2}}
+
+        with self.assertRaises(ValueError):
+            self.test_request_builder.build_body("[\"Ice Cream\"]", "[]", insert_portion = "{\"Price\"=2}")
+
+
+    def test_04_json_backend(self):
+        '''
+        Tests that the standard json module is used when no faster backend is installed.
+        '''
+        with patch.object(request_builder, "orjson", None):
+            assert self.test_request_builder.serialize({"From": ["A"]}) == b"{\"From\":[\"A\"]}"
+
+
+    def test_05_large_integer(self):
+        '''
+        Tests that integers beyond 64 bits are serialized, whichever JSON backend is installed.
+        '''
+        large = 2 ** 70
+        body = self.test_request_builder.build_body(["Ice Cream"], [], insert_portion = {"Price": large, "Flavor": "Crème"})
+        assert json.loads(body.decode("utf-8")) == {"From": ["Ice Cream"], "Select": [], "Insert": {"Price": large, "Flavor": "Crème"}}
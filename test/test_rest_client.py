@@ -8,9 +8,18 @@ sammatime22, 2021
 import sys
 sys.path.append('src')
 
+import gzip
+import json
+import os
+import requests
+import socket
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
+from endpoint_pool import EndpointPool
+from mock_server import MockMatchaDB
 from rest_client import RestClient
+from retry_policy import RetryPolicy
 
 
 class TestRestClient(unittest.TestCase):
@@ -29,7 +38,7 @@ class TestRestClient(unittest.TestCase):
     test_sample_select_portion = "[[\"Flavor\", \"is\", \"Death by Chocolate\"]]"
 
     # A sample test INSERT query portion
-    test_sample_insert_portion = "{\"Flavor\":\"Mint Chocolate Chip\", \"Price\"=2.00}"
+    test_sample_insert_portion = "{\"Flavor\":\"Mint Chocolate Chip\", \"Price\":2.00}"
 
     # A sample test UPDATE query portion
     test_sample_update_portion = "[[\"Price\", \"to\", 1.00]]"
@@ -43,7 +52,7 @@ class TestRestClient(unittest.TestCase):
         Tests the GET request when successful.
         '''
         # Patch the requests library
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 200
             mock_request.return_value.content = "[[\"Flavor\"=\"Death by Chocolate\", \"Price\"=2.00]]"
@@ -62,7 +71,7 @@ class TestRestClient(unittest.TestCase):
         '''
         Tests the GET request when unsuccessful.
         '''
-        with patch("requests.get") as mock_request:
+        with patch("requests.Session.get") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 404
             mock_request.return_value.content = ""
@@ -109,7 +118,7 @@ class TestRestClient(unittest.TestCase):
         Tests the POST request when successful.
         '''
         # Patch the requests library
-        with patch("requests.post") as mock_request:
+        with patch("requests.Session.post") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 201
             mock_request.return_value.content = ""
@@ -129,7 +138,7 @@ class TestRestClient(unittest.TestCase):
         '''
         Tests the POST request when unsuccessful.
         '''
-        with patch("requests.post") as mock_request:
+        with patch("requests.Session.post") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 409
             mock_request.return_value.content = ""
@@ -178,7 +187,7 @@ class TestRestClient(unittest.TestCase):
         Tests the UPDATE request when successful.
         '''
         # Patch the requests library
-        with patch("requests.put") as mock_request:
+        with patch("requests.Session.put") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 200
             mock_request.return_value.content = ""
@@ -198,7 +207,7 @@ class TestRestClient(unittest.TestCase):
         '''
         Tests the UPDATE request when unsuccessful.
         '''
-        with patch("requests.put") as mock_request:
+        with patch("requests.Session.put") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 409
             mock_request.return_value.content = ""
@@ -247,7 +256,7 @@ class TestRestClient(unittest.TestCase):
         Tests the DELETE request when successful.
         '''
         # Patch the requests library
-        with patch("requests.delete") as mock_request:
+        with patch("requests.Session.delete") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 204
             mock_request.return_value.content = ""
@@ -266,7 +275,7 @@ class TestRestClient(unittest.TestCase):
         '''
         Tests the DELETE request when unsuccessful.
         '''
-        with patch("requests.delete") as mock_request:
+        with patch("requests.Session.delete") as mock_request:
             # Get the mocking set up
             mock_request.return_value.status_code = 409
             mock_request.return_value.content = ""
@@ -307,3 +316,298 @@ class TestRestClient(unittest.TestCase):
         assert success == False
         assert response ==  "An unidentified error has occurred: unsupported operand type(s) for +: 'RestClient' and 'int'."
 
+
+
+    def test_17_session_reused_across_requests(self):
+        '''
+        Tests that every request type is made over the same pooled session.
+        '''
+        pooled_rest_client = RestClient(pool_size = 4)
+        session = pooled_rest_client.session
+
+        # Check that the pool size was applied to the mounted adapters
+        assert session.get_adapter("http://")._pool_maxsize == 4
+        assert session.get_adapter("https://")._pool_maxsize == 4
+
+        with patch("requests.Session.get") as mock_get:
+            with patch("requests.Session.post") as mock_post:
+                with patch("requests.Session.put") as mock_put:
+                    with patch("requests.Session.delete") as mock_delete:
+                        pooled_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+                        pooled_rest_client.post_request(self.test_sample_from_portion, self.test_sample_select_portion,\
+                                                        self.test_sample_insert_portion)
+                        pooled_rest_client.update_request(self.test_sample_from_portion, self.test_sample_select_portion,\
+                                                          self.test_sample_update_portion)
+                        pooled_rest_client.delete_request(self.test_sample_from_portion, self.test_sample_select_portion)
+
+                        # Test that each request type went out once, and the session was never replaced
+                        assert len(mock_get.mock_calls) == 1
+                        assert len(mock_post.mock_calls) == 1
+                        assert len(mock_put.mock_calls) == 1
+                        assert len(mock_delete.mock_calls) == 1
+                        assert pooled_rest_client.session is session
+
+
+    def test_18_close(self):
+        '''
+        Tests that closing the client closes its session.
+        '''
+        closing_rest_client = RestClient()
+        with patch("requests.Session.close") as mock_close:
+            closing_rest_client.close()
+            assert len(mock_close.mock_calls) == 1
+
+
+    def test_19_cached_get(self):
+        '''
+        Tests that with caching on, a repeated GET is served from the cache until the table is written.
+        '''
+        caching_rest_client = RestClient(cache_size = 8, cache_ttl = 60)
+        with patch("requests.Session.get") as mock_get:
+            with patch("requests.Session.post") as mock_post:
+                mock_get.return_value.status_code = 200
+                mock_post.return_value.status_code = 201
+
+                first = caching_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+                second = caching_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+                assert len(mock_get.mock_calls) == 1
+                assert first == second
+
+                # Writing to the table invalidates its cached results
+                caching_rest_client.post_request(self.test_sample_from_portion, self.test_sample_select_portion,\
+                                                 self.test_sample_insert_portion)
+                caching_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+                assert len(mock_get.mock_calls) == 2
+
+
+    def test_20_uncached_get(self):
+        '''
+        Tests that without caching, and for unsuccessful GETs, every request goes to the DB.
+        '''
+        caching_rest_client = RestClient(cache_size = 8)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 404
+            caching_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            caching_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            assert len(mock_get.mock_calls) == 4
+
+
+    def test_21_request_body(self):
+        '''
+        Tests that the request body is sent as serialized JSON bytes with a JSON content type.
+        '''
+        with patch("requests.Session.put") as mock_put:
+            self.test_rest_client.update_request(["Ice Cream"], [["Flavor", "is", "Mint \"Chip\""]], [["Price", "to", 1.5]])
+
+            arguments = mock_put.mock_calls[0][2]
+            assert json.loads(arguments["data"].decode("utf-8")) == \
+                {"From": ["Ice Cream"], "Select": [["Flavor", "is", "Mint \"Chip\""]], "Update": [["Price", "to", 1.5]]}
+            assert arguments["headers"]["Content-Type"] == "application/json"
+
+
+    def test_22_retry_connection_error(self):
+        '''
+        Tests that with a retry policy, a GET failing to connect is retried with backoff, counting the retries.
+        '''
+        retrying_rest_client = RestClient(retry_policy = RetryPolicy(3, 0.1, 1.0, False))
+        with patch("requests.Session.get") as mock_get:
+            with patch("time.sleep") as mock_sleep:
+                mock_get.side_effect = [requests.exceptions.ConnectionError(), requests.exceptions.ConnectionError(),\
+                                        mock_get.return_value]
+                mock_get.return_value.status_code = 200
+
+                success, response = retrying_rest_client.get_request(self.test_sample_from_portion,\
+                                                                     self.test_sample_select_portion)
+                assert success == True
+                assert response.retries == 2
+                assert mock_get.call_count == 3
+                assert [sleep_call[1][0] for sleep_call in mock_sleep.mock_calls] == [0.1, 0.2]
+
+
+    def test_23_retry_status_code(self):
+        '''
+        Tests that a transient status code is retried until the attempts run out.
+        '''
+        retrying_rest_client = RestClient(retry_policy = RetryPolicy(3, 0.1, 1.0, False))
+        with patch("requests.Session.delete") as mock_delete:
+            with patch("time.sleep"):
+                mock_delete.return_value.status_code = 503
+                success, response = retrying_rest_client.delete_request(self.test_sample_from_portion,\
+                                                                        self.test_sample_select_portion)
+                assert success == True
+                assert response.status_code == 503
+                assert response.retries == 2
+                assert mock_delete.call_count == 3
+
+
+    def test_24_retries_exhausted(self):
+        '''
+        Tests that the retries made are reported once they run out, and that a POST is not retried by default.
+        '''
+        retrying_rest_client = RestClient(retry_policy = RetryPolicy(2, 0.1, 1.0, False))
+        with patch("requests.Session.put") as mock_put:
+            with patch("requests.Session.post") as mock_post:
+                with patch("time.sleep"):
+                    mock_put.side_effect = requests.exceptions.ConnectionError()
+                    mock_post.side_effect = requests.exceptions.ConnectionError()
+
+                    assert retrying_rest_client.update_request(self.test_sample_from_portion,\
+                        self.test_sample_select_portion, self.test_sample_update_portion) ==\
+                        (False, "A connection error has occurred after 1 retry.")
+                    assert retrying_rest_client.post_request(self.test_sample_from_portion,\
+                        self.test_sample_select_portion, self.test_sample_insert_portion) ==\
+                        (False, "A connection error has occurred.")
+                    assert mock_put.call_count == 2
+                    assert mock_post.call_count == 1
+
+
+    def test_25_timeouts(self):
+        '''
+        Tests that every request is sent with the client's connect and read timeouts.
+        '''
+        timed_rest_client = RestClient(connect_timeout = 1.5, read_timeout = 4)
+        with patch("requests.Session.get") as mock_get:
+            self.test_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            timed_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion)
+            assert mock_get.mock_calls[0][2]["timeout"] == (RestClient.DEFAULT_CONNECT_TIMEOUT, RestClient.DEFAULT_READ_TIMEOUT)
+            assert mock_get.mock_calls[1][2]["timeout"] == (1.5, 4)
+
+
+    def test_26_read_timeout(self):
+        '''
+        Tests that a MatchaDB slower than the read timeout is reported as a timeout, rather than waited on.
+        '''
+        mock = MockMatchaDB(latency = 0.5)
+        protocol, host, port = mock.start()
+        timed_rest_client = RestClient(protocol, host, port, read_timeout = 0.05)
+        try:
+            assert timed_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion) ==\
+                (False, "A timeout has occurred.")
+        finally:
+            timed_rest_client.close()
+            mock.stop()
+
+
+    def test_27_deadline_bounds_retries(self):
+        '''
+        Tests that the deadline bounds the timeouts of each attempt, and stops retries that would outlast it.
+        '''
+        deadline_rest_client = RestClient(retry_policy = RetryPolicy(10, 0.2, 1.0, False), deadline = 0.3)
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value.status_code = 503
+            success, response = deadline_rest_client.get_request(self.test_sample_from_portion,\
+                                                                 self.test_sample_select_portion)
+            assert success == True
+            assert response.retries == 1
+            assert mock_get.call_count == 2
+            assert all(timeout <= 0.3 for timeout in mock_get.call_args_list[0][1]["timeout"])
+            assert all(timeout <= 0.1 for timeout in mock_get.call_args_list[1][1]["timeout"])
+
+
+    def test_28_deadline_passed(self):
+        '''
+        Tests that no attempt is made once the deadline has passed.
+        '''
+        deadline_rest_client = RestClient(deadline = 0)
+        with patch("requests.Session.get") as mock_get:
+            assert deadline_rest_client.get_request(self.test_sample_from_portion, self.test_sample_select_portion) ==\
+                (False, "A timeout has occurred.")
+            assert mock_get.call_count == 0
+
+
+    def test_29_compressed_body(self):
+        '''
+        Tests that only request bodies of at least the compression threshold are gzipped.
+        '''
+        compressing_rest_client = RestClient(compress_threshold = 256)
+        large_insert_portion = [{"Flavor": "Mint", "Price": 2}] * 50
+        with patch("requests.Session.post") as mock_post:
+            compressing_rest_client.post_request(self.test_sample_from_portion, [], {"Flavor": "Mint"})
+            compressing_rest_client.post_request(self.test_sample_from_portion, [], large_insert_portion)
+
+            small_arguments, large_arguments = mock_post.call_args_list[0][1], mock_post.call_args_list[1][1]
+            assert "Content-Encoding" not in small_arguments["headers"]
+            assert json.loads(small_arguments["data"].decode("utf-8"))["Insert"] == {"Flavor": "Mint"}
+            assert large_arguments["headers"]["Content-Encoding"] == "gzip"
+            assert json.loads(gzip.decompress(large_arguments["data"]).decode("utf-8"))["Insert"] == large_insert_portion
+
+
+    def test_30_endpoint_fail_over(self):
+        '''
+        Tests that reads fail over from a replica which cannot be connected to, while writes stay on the primary.
+        '''
+        unused_socket = socket.socket()
+        unused_socket.bind(("127.0.0.1", 0))
+        unused_port = str(unused_socket.getsockname()[1])
+        unused_socket.close()
+
+        mock = MockMatchaDB()
+        protocol, host, port = mock.start()
+        pool = EndpointPool([(protocol, host, port), ("http://", "127.0.0.1", unused_port)])
+        balanced_rest_client = RestClient(endpoint_pool = pool)
+        try:
+            assert balanced_rest_client.get_protocol_host_port() == (protocol, host, port)
+            assert balanced_rest_client.post_request(["Ice Cream"], [], {"Flavor": "Mint"})[1].status_code == 201
+            for _ in range(3):
+                success, response = balanced_rest_client.get_request(["Ice Cream"], [])
+                assert success == True
+                assert response.status_code == 200
+                assert response.retries == 0
+            assert pool.down_until[pool.urls[1]] > 0
+            assert pool.outstanding == {pool.urls[0]: 0, pool.urls[1]: 0}
+        finally:
+            balanced_rest_client.close()
+            mock.stop()
+
+        primary_down_rest_client = RestClient(endpoint_pool = EndpointPool([("http://", "127.0.0.1", unused_port)]))
+        assert primary_down_rest_client.post_request(["Ice Cream"], [], {"Flavor": "Mint"}) ==\
+            (False, "A connection error has occurred.")
+        primary_down_rest_client.close()
+
+
+    def test_31_endpoint_read_timeout(self):
+        '''
+        Tests that replicas which connect but never respond are reported as a timeout once the deadline passes,
+        rather than failed over between without end.
+        '''
+        hanging_mocks = [MockMatchaDB(latency = 1.0), MockMatchaDB(latency = 1.0)]
+        pool = EndpointPool([mock.start() for mock in hanging_mocks])
+        hanging_rest_client = RestClient(endpoint_pool = pool, read_timeout = 0.2, deadline = 0.5)
+        try:
+            began = time.monotonic()
+            assert hanging_rest_client.get_request(["Ice Cream"], []) == (False, "A timeout has occurred.")
+            assert time.monotonic() - began < 1.0
+            assert pool.outstanding == {pool.urls[0]: 0, pool.urls[1]: 0}
+            assert pool.down_until == {pool.urls[0]: 0.0, pool.urls[1]: 0.0}
+        finally:
+            hanging_rest_client.close()
+            for mock in hanging_mocks:
+                mock.stop()
+
+
+    def test_32_request_overhead(self):
+        '''
+        Tests that the URL is only built once, and measures the time the client itself adds to each request (with
+        the network stubbed out). The time is only held to a bound when WHISK_BENCHMARK is set, as it depends on
+        the machine running the tests.
+        '''
+        benchmarking = bool(os.environ.get("WHISK_BENCHMARK"))
+        benchmarked_rest_client = RestClient("http://", "db.local", "9000")
+        stub_response = Mock(status_code = 200, content = b"[]")
+        requests_made = 20000 if benchmarking else 100
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = stub_response
+            began = time.perf_counter()
+            for _ in range(requests_made):
+                benchmarked_rest_client.get_request(["Ice Cream"], [["Flavor", "is", "Mint"]])
+            overhead = (time.perf_counter() - began) / requests_made * 1000000
+
+            assert benchmarked_rest_client.base_url == "http://db.local:9000/"
+            assert mock_get.call_args_list[-1][0][0] == "http://db.local:9000/"
+            assert mock_get.call_args_list[-1][1]["timeout"] is benchmarked_rest_client.timeouts
+            if benchmarking:
+                measured = "Client overhead: " + "{:.1f}".format(overhead) + "us per request"
+                sys.stderr.write("\n" + measured + "\n")
+                assert overhead < 250, measured
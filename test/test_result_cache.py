@@ -0,0 +1,89 @@
+'''
+This file tests the Result Cache, that it bounds, expires, and invalidates GET results accordingly.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from unittest.mock import patch
+from result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    '''
+    A set of tests for the Result Cache class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # A sample test FROM query portion
+    test_sample_from_portion = "[\"Ice Cream\"]"
+
+    # A sample test SELECT query portion
+    test_sample_select_portion = "[[\"Flavor\", \"is\", \"Death by Chocolate\"]]"
+
+
+    def test_01_hit_and_normalization(self):
+        '''
+        Tests that a stored result is found again, including for a differently formatted query.
+        '''
+        cache = ResultCache()
+        cache.put(self.test_sample_from_portion, self.test_sample_select_portion, "result")
+
+        assert cache.get(self.test_sample_from_portion, self.test_sample_select_portion) == "result"
+        assert cache.get(["Ice Cream"], "[[\"Flavor\",\"is\",\"Death by Chocolate\"]]") == "result"
+        assert cache.get(self.test_sample_from_portion, "[]") is None
+
+
+    def test_02_lru_eviction(self):
+        '''
+        Tests that the least recently used result is evicted once the cache is full.
+        '''
+        cache = ResultCache(2)
+        cache.put(self.test_sample_from_portion, "[[\"a\", \"is\", 1]]", "a")
+        cache.put(self.test_sample_from_portion, "[[\"b\", \"is\", 1]]", "b")
+
+        # Use "a", so that "b" becomes the least recently used
+        cache.get(self.test_sample_from_portion, "[[\"a\", \"is\", 1]]")
+        cache.put(self.test_sample_from_portion, "[[\"c\", \"is\", 1]]", "c")
+
+        assert cache.get(self.test_sample_from_portion, "[[\"a\", \"is\", 1]]") == "a"
+        assert cache.get(self.test_sample_from_portion, "[[\"b\", \"is\", 1]]") is None
+        assert cache.get(self.test_sample_from_portion, "[[\"c\", \"is\", 1]]") == "c"
+
+
+    def test_03_ttl_expiry(self):
+        '''
+        Tests that a result is no longer served once its time to live has passed.
+        '''
+        cache = ResultCache(ttl = 5)
+        with patch('time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.put(self.test_sample_from_portion, self.test_sample_select_portion, "result")
+
+            mock_monotonic.return_value = 104.9
+            assert cache.get(self.test_sample_from_portion, self.test_sample_select_portion) == "result"
+
+            mock_monotonic.return_value = 105.0
+            assert cache.get(self.test_sample_from_portion, self.test_sample_select_portion) is None
+            assert len(cache.entries) == 0
+
+
+    def test_04_invalidate_table(self):
+        '''
+        Tests that invalidating a table drops only that table's results.
+        '''
+        cache = ResultCache()
+        cache.put(self.test_sample_from_portion, self.test_sample_select_portion, "ice cream")
+        cache.put(self.test_sample_from_portion, "[]", "all ice cream")
+        cache.put("[\"Cake\"]", "[]", "cake")
+
+        cache.invalidate("[ \"Ice Cream\" ]")
+        assert cache.get(self.test_sample_from_portion, self.test_sample_select_portion) is None
+        assert cache.get(self.test_sample_from_portion, "[]") is None
+        assert cache.get("[\"Cake\"]", "[]") == "cake"
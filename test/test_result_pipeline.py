@@ -0,0 +1,92 @@
+'''
+This file tests the ResultPipeline class, such that GET results are trimmed lazily on the client side.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from result_pipeline import ResultPipeline
+
+
+class TestResultPipeline(unittest.TestCase):
+    '''
+    A set of tests for the ResultPipeline class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # Records for test
+    test_records = [{"Flavor": "Mint", "Price": 3, "Size": "S"}, {"Flavor": "Vanilla", "Price": 2, "Size": "M"},\
+                    {"Flavor": "Mint", "Price": 3, "Size": "L"}, {"Flavor": "Mango", "Price": 10, "Size": "S"}]
+
+
+    def test_01_process_nothing_asked(self):
+        '''
+        Tests that records pass through untouched when no stage is asked for.
+        '''
+        assert list(ResultPipeline().process(self.test_records)) == self.test_records
+
+
+    def test_02_process_filter_and_project(self):
+        '''
+        Tests that records are filtered as MatchaDB would, then cut down to the chosen fields.
+        '''
+        pipeline = ResultPipeline(["Flavor", "Price", "Missing"], [["Price", ">=", "3"], ["Flavor", "contains", "M"]])
+        assert list(pipeline.process(self.test_records)) ==\
+            [{"Flavor": "Mint", "Price": 3}, {"Flavor": "Mint", "Price": 3}, {"Flavor": "Mango", "Price": 10}]
+        assert list(ResultPipeline(["Flavor"]).process(["Mint", 4])) == ["Mint", 4]
+        with self.assertRaises(ValueError):
+            list(ResultPipeline(filters = [["Price", "~", "3"]]).process(self.test_records))
+
+
+    def test_03_process_distinct_sort_limit(self):
+        '''
+        Tests that repeats are dropped, and that records are sorted either way and limited.
+        '''
+        pipeline = ResultPipeline(["Flavor", "Price"], distinct = True)
+        assert list(pipeline.process(self.test_records)) ==\
+            [{"Flavor": "Mint", "Price": 3}, {"Flavor": "Vanilla", "Price": 2}, {"Flavor": "Mango", "Price": 10}]
+
+        assert [record["Price"] for record in ResultPipeline(sort_field = "Price").process(self.test_records)] ==\
+            [2, 3, 3, 10]
+        assert [record["Size"] for record in ResultPipeline(sort_field = "-Price", limit = 2).process(self.test_records)] ==\
+            ["S", "S"]
+        assert [record.get("Flavor") for record in ResultPipeline(sort_field = "Flavor").process([{}] + self.test_records)] ==\
+            ["Mango", "Mint", "Mint", "Vanilla", None]
+        with self.assertRaises(ValueError):
+            ResultPipeline(limit = -1)
+
+
+    def test_04_process_sort_unprojected_field(self):
+        '''
+        Tests that records are sorted on a field which is not among the fields kept.
+        '''
+        records = [{"name": "a", "age": 1}, {"name": "b", "age": 9}, {"name": "c", "age": 5}]
+        assert list(ResultPipeline(["name"], sort_field = "-age", limit = 1).process(records)) == [{"name": "b"}]
+        assert list(ResultPipeline(["name"], sort_field = "age").process(records)) ==\
+            [{"name": "a"}, {"name": "c"}, {"name": "b"}]
+        assert list(ResultPipeline(["Flavor"], sort_field = "-Price", distinct = True).process(self.test_records)) ==\
+            [{"Flavor": "Mango"}, {"Flavor": "Mint"}, {"Flavor": "Vanilla"}]
+
+
+    def test_05_process_lazily(self):
+        '''
+        Tests that records are only read as they are asked for, and that a limit stops the reading.
+        '''
+        read = []
+
+        def records():
+            for record in self.test_records:
+                read.append(record)
+                yield record
+
+        processed = ResultPipeline(filters = [["Flavor", "is", "Mint"]], limit = 1).process(records())
+        assert read == []
+        assert list(processed) == [self.test_records[0]]
+        assert read == self.test_records[:1]
@@ -0,0 +1,93 @@
+'''
+This file tests the ResultWriter class, such that each operation is written as a machine-readable record.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import csv
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+from result_writer import ResultWriter
+
+
+class TestResultWriter(unittest.TestCase):
+    '''
+    A set of tests for the ResultWriter class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    class MockResponse:
+        '''
+        Again, a mock class for Responses over REST.
+        '''
+
+        # The constructor for the mock Response object
+        def __init__(self, status_code, content):
+            self.status_code = status_code
+            self.content = content
+            self.elapsed = datetime.timedelta(milliseconds = 12.5)
+
+
+    def test_01_jsonl(self):
+        '''
+        Tests that each result is written as a JSON line, including those which failed to connect.
+        '''
+        stream = io.StringIO()
+        writer = ResultWriter("jsonl", stream)
+        writer.write("GET", ["Ice Cream"], (True, self.MockResponse(200, b"[{\"Flavor\": \"Mint\"}]")))
+        writer.write("DELETE", "Ice Cream", (False, "A connection error has occurred."))
+        assert stream.getvalue() == ""
+        writer.close()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records == [{"verb": "GET", "table": "Ice Cream", "status": 200, "latency_ms": 12.5,\
+                            "body": "[{\"Flavor\": \"Mint\"}]"},\
+                           {"verb": "DELETE", "table": "Ice Cream", "status": None, "latency_ms": None,\
+                            "body": "A connection error has occurred."}]
+
+
+    def test_02_csv(self):
+        '''
+        Tests that results are written as CSV rows after a header row, quoting bodies as needed.
+        '''
+        stream = io.StringIO()
+        writer = ResultWriter("csv", stream)
+        writer.write("POST", ["Ice Cream"], (True, self.MockResponse(201, b"")))
+        writer.write("GET", ["Ice Cream"], (True, self.MockResponse(200, b"[1, \"a,b\"]")))
+        writer.close()
+
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        assert rows == [list(ResultWriter.FIELDS), ["POST", "Ice Cream", "201", "12.5", ""],\
+                        ["GET", "Ice Cream", "200", "12.5", "[1, \"a,b\"]"]]
+
+
+    def test_03_output_file(self):
+        '''
+        Tests that records may be written to a file, which is closed with the writer.
+        '''
+        output_path = os.path.join(tempfile.mkdtemp(), "results.jsonl")
+        writer = ResultWriter("jsonl", output_path = output_path)
+        writer.write("GET", ["Ice Cream"], (True, self.MockResponse(404, b"")))
+        writer.close()
+        with open(output_path) as output_file:
+            assert json.loads(output_file.read())["status"] == 404
+        os.remove(output_path)
+
+
+    def test_04_unknown_format(self):
+        '''
+        Tests that an unknown format is refused.
+        '''
+        with self.assertRaises(ValueError):
+            ResultWriter("xml", io.StringIO())
@@ -0,0 +1,55 @@
+'''
+This file tests the RetryPolicy class, such that failed requests are retried only when they should be.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from retry_policy import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    '''
+    A set of tests for the RetryPolicy class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    def test_01_should_retry(self):
+        '''
+        Tests that connection failures and transient status codes are retried, for idempotent methods only.
+        '''
+        policy = RetryPolicy(3)
+        assert policy.should_retry("get", 1)
+        assert policy.should_retry("delete", 2, 503)
+        assert not policy.should_retry("get", 3)
+        assert not policy.should_retry("put", 1, 500)
+        assert not policy.should_retry("get", 1, 200)
+        assert not policy.should_retry("post", 1)
+        assert RetryPolicy(retry_verbs = ("GET", "POST")).should_retry("post", 1)
+
+
+    def test_02_backoff(self):
+        '''
+        Tests that the wait doubles with each attempt up to the cap, and that jitter stays within it.
+        '''
+        policy = RetryPolicy(backoff_base = 0.5, backoff_cap = 3.0, jitter = False)
+        assert [policy.backoff(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+        jittered = RetryPolicy(backoff_base = 0.5, backoff_cap = 3.0)
+        for attempt in range(1, 6):
+            assert 0 <= jittered.backoff(attempt) <= policy.backoff(attempt)
+
+
+    def test_03_max_attempts(self):
+        '''
+        Tests that a policy must allow at least one attempt.
+        '''
+        with self.assertRaises(ValueError):
+            RetryPolicy(0)
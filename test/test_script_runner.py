@@ -0,0 +1,187 @@
+'''
+This file tests the Script Runner, that it replays the operations in a script accordingly.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, call
+from display import Display
+from rest_client import RestClient
+from result_writer import ResultWriter
+from script_runner import ScriptRunner
+
+
+class TestScriptRunner(unittest.TestCase):
+    '''
+    A set of tests for the Script Runner class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+    # The script runner for test
+    test_script_runner = ScriptRunner()
+
+    # A mock Display object for test
+    test_whisk_display = Display()
+
+    # A mock Rest Client for test
+    test_rest_client = RestClient()
+
+    # A mocked Response class for tests
+    class MockResponse():
+        '''
+        Again, a mock class for Responses over REST.
+        '''
+
+        # The constructor for the mock Response object
+        def __init__(self, status_code, content):
+            self.status_code = status_code
+            self.content = content
+
+
+    def write_script(self, lines):
+        '''
+        Writes the provided lines to a temporary script file, returning its path.
+        '''
+        script_file = tempfile.NamedTemporaryFile("w", suffix = ".jsonl", delete = False)
+        script_file.write("\n".join(lines) + "\n")
+        script_file.close()
+        self.addCleanup(os.remove, script_file.name)
+        return script_file.name
+
+
+    def test_01_load_operations(self):
+        '''
+        Tests that operations are read line by line, skipping blank lines and flagging unreadable ones.
+        '''
+        script_path = self.write_script(["{\"Command\": \"GET\"}", "", "not json", "[1, 2]"])
+        loaded = list(self.test_script_runner.load_operations(script_path))
+
+        assert loaded[0] == (1, {"Command": "GET"}, None)
+        assert loaded[1][0] == 3 and loaded[1][1] is None
+        assert loaded[2][0] == 4 and loaded[2][1] is None
+        assert len(loaded) == 3
+
+
+    def test_02_run_operation_routes_commands(self):
+        '''
+        Tests that each command is routed to the matching Rest Client request with its portions.
+        '''
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            with patch('rest_client.RestClient.post_request') as mock_post_request:
+                with patch('rest_client.RestClient.update_request') as mock_update_request:
+                    with patch('rest_client.RestClient.delete_request') as mock_delete_request:
+                        self.test_script_runner.run_operation(self.test_rest_client,\
+                            {"Command": "get", "From": "Ice Cream", "Select": [["Flavor", "is", "Mint"]]})
+                        self.test_script_runner.run_operation(self.test_rest_client,\
+                            {"Command": "POST", "From": ["Ice Cream"], "Select": [], "Insert": {"Flavor": "Mint"}})
+                        self.test_script_runner.run_operation(self.test_rest_client,\
+                            {"Command": "UPDATE", "From": ["Ice Cream"], "Select": [], "Update": [["Price", "to", 1]]})
+                        self.test_script_runner.run_operation(self.test_rest_client,\
+                            {"Command": "DELETE", "From": ["Ice Cream"], "Select": "[]"})
+
+                        assert mock_get_request.mock_calls == [call(["Ice Cream"], [["Flavor", "is", "Mint"]])]
+                        assert mock_post_request.mock_calls == [call(["Ice Cream"], [], {"Flavor": "Mint"})]
+                        assert mock_update_request.mock_calls == [call(["Ice Cream"], [], [["Price", "to", 1]])]
+                        assert mock_delete_request.mock_calls == [call(["Ice Cream"], "[]")]
+
+
+    def test_03_run_operation_unrecognized_command(self):
+        '''
+        Tests that an unrecognized command is reported without making a request.
+        '''
+        retrieved, response = self.test_script_runner.run_operation(self.test_rest_client, {"Command": "PATCH"})
+        assert retrieved == False
+        assert response == "The command provided was not recognized: PATCH."
+
+
+    def test_04_run_script(self):
+        '''
+        Tests that a script is run in order, printing a line per operation and counting the failures.
+        '''
+        script_path = self.write_script([
+            "{\"Command\": \"GET\", \"From\": [\"Ice Cream\"], \"Select\": []}",
+            "{\"Command\": \"DELETE\", \"From\": [\"Ice Cream\"], \"Select\": []}",
+            "{\"Command\": \"GET\", \"From\": [\"Ice Cream\"], \"Select\": []}",
+            "not json"])
+
+        get_results = [(False, "A connection error has occurred."), (True, self.MockResponse(200, "b'[]'"))]
+
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            with patch('rest_client.RestClient.delete_request') as mock_delete_request:
+                with patch('display.Display.print_success') as mock_print_success:
+                    with patch('display.Display.print_error') as mock_print_error:
+                        mock_get_request.side_effect = lambda from_portion, select_portion: get_results.pop()
+                        mock_delete_request.return_value = (True, self.MockResponse(409, ""))
+                        failures = self.test_script_runner.run_script(self.test_whisk_display, self.test_rest_client, script_path)
+
+                        assert failures == 3
+                        assert mock_print_success.mock_calls == [call("1 GET 200 : b'[]'")]
+                        assert mock_print_error.mock_calls[0] == call("2 DELETE 409 : ")
+                        assert mock_print_error.mock_calls[1] == call("3 GET A connection error has occurred.")
+                        assert len(mock_print_error.mock_calls) == 3
+
+
+    def test_05_run_script_missing_file(self):
+        '''
+        Tests that a script which cannot be opened is reported as a failure.
+        '''
+        with patch('display.Display.print_error') as mock_print_error:
+            failures = self.test_script_runner.run_script(self.test_whisk_display, self.test_rest_client, "no/such/script.jsonl")
+            assert failures == 1
+            assert len(mock_print_error.mock_calls) == 1
+
+
+    def test_06_run_script_concurrently(self):
+        '''
+        Tests that a script run with several workers still prints its results in script order.
+        '''
+        script_path = self.write_script(["{\"Command\": \"GET\", \"From\": [\"" + str(index) + "\"], \"Select\": []}"\
+                                         for index in range(20)])
+
+        def side_effect_method_get(from_portion, select_portion):
+            return True, self.MockResponse(200, from_portion)
+
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            with patch('display.Display.print_success') as mock_print_success:
+                mock_get_request.side_effect = side_effect_method_get
+                failures = self.test_script_runner.run_script(self.test_whisk_display, self.test_rest_client, script_path, 5)
+
+                assert failures == 0
+                assert mock_print_success.mock_calls == \
+                    [call(str(index + 1) + " GET 200 : ['" + str(index) + "']") for index in range(20)]
+
+
+    def test_07_run_script_with_result_writer(self):
+        '''
+        Tests that with a result writer, each operation is written as a record rather than printed.
+        '''
+        script_path = self.write_script(["{\"Command\": \"GET\", \"From\": [\"Ice Cream\"], \"Select\": []}",\
+                                         "{\"Command\": \"DELETE\", \"From\": [\"Ice Cream\"], \"Select\": []}"])
+        stream = io.StringIO()
+        result_writer = ResultWriter("jsonl", stream)
+        with patch('rest_client.RestClient.get_request') as mock_get_request:
+            with patch('rest_client.RestClient.delete_request') as mock_delete_request:
+                with patch('display.Display.print_success') as mock_print_success:
+                    mock_get_request.return_value = (True, self.MockResponse(200, b"[]"))
+                    mock_delete_request.return_value = (False, "A connection error has occurred.")
+                    mock_get_request.return_value[1].elapsed = datetime.timedelta(seconds = 0.01)
+
+                    failures = self.test_script_runner.run_script(self.test_whisk_display, self.test_rest_client,\
+                                                                  script_path, None, result_writer)
+                    result_writer.close()
+
+                    assert failures == 1
+                    assert len(mock_print_success.mock_calls) == 0
+                    assert [json.loads(line)["status"] for line in stream.getvalue().splitlines()] == [200, None]
@@ -0,0 +1,49 @@
+'''
+This file tests the SelectParser class, such that Select portions given on one line are read correctly.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from select_parser import SelectParser
+
+
+class TestSelectParser(unittest.TestCase):
+    '''
+    A set of tests for the SelectParser class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # The SelectParser object under test
+    test_select_parser = SelectParser()
+
+
+    def test_01_parse_query(self):
+        '''
+        Tests that a single query is split into its key, operation, and value.
+        '''
+        assert self.test_select_parser.parse_query("id,==,5") == ["id", "==", "5"]
+        assert self.test_select_parser.parse_query(" name , is , a,b ") == ["name", "is", "a,b"]
+        with self.assertRaises(ValueError):
+            self.test_select_parser.parse_query("id==5")
+        with self.assertRaises(ValueError):
+            self.test_select_parser.parse_query(",is,5")
+
+
+    def test_02_parse(self):
+        '''
+        Tests that a portion is split into its queries, with blank queries skipped.
+        '''
+        assert self.test_select_parser.parse("Price,>=,2; Flavor,is,Mint;") ==\
+            [["Price", ">=", "2"], ["Flavor", "is", "Mint"]]
+        assert self.test_select_parser.parse("") == []
+        assert self.test_select_parser.parse("  ") == []
+        with self.assertRaises(ValueError):
+            self.test_select_parser.parse("Price,>=,2; Flavor")
@@ -0,0 +1,74 @@
+'''
+This file tests how quickly Whisk starts up, so that slow imports do not creep back into its startup path.
+
+sammatime22, 2026
+'''
+import os
+import sys
+sys.path.append('src')
+
+import subprocess
+import time
+import unittest
+from bootloader import VERSION
+
+
+class TestStartup(unittest.TestCase):
+    '''
+    A set of startup time checks for Whisk.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # The most time a cold start of "whisk.py --version" may take, in seconds.
+    STARTUP_BUDGET = 0.5
+
+
+    # The number of cold starts to time, keeping the fastest so that a busy machine does not fail the test.
+    RUNS = 3
+
+
+    # The modules which should not be imported until a mode of Whisk needs them.
+    HEAVY_MODULES = ("requests", "urllib3", "readline", "rest_client", "input_machine")
+
+
+    def run_whisk(self, *arguments):
+        '''
+        Runs Whisk in a fresh interpreter, returning its output and how long it took.
+        '''
+        began = time.perf_counter()
+        output = subprocess.check_output([sys.executable, "whisk.py"] + list(arguments))
+        return output.decode("utf-8"), time.perf_counter() - began
+
+
+    def test_01_version(self):
+        '''
+        Tests that --version prints the version of Whisk and exits.
+        '''
+        output = self.run_whisk("--version")[0]
+        assert output == "Whisk " + VERSION + "\n"
+
+
+    def test_02_startup_within_budget(self):
+        '''
+        Tests that a cold start of "whisk.py --version" stays within the startup budget. The budget is only held
+        to when WHISK_BENCHMARK is set, as it depends on the machine running the tests.
+        '''
+        if not os.environ.get("WHISK_BENCHMARK"):
+            self.skipTest("set WHISK_BENCHMARK to hold startup to its budget")
+        fastest = min(self.run_whisk("--version")[1] for run in range(self.RUNS))
+        assert fastest < self.STARTUP_BUDGET, "Startup took {:.3f}s".format(fastest)
+
+
+    def test_03_heavy_modules_deferred(self):
+        '''
+        Tests that importing the bootloader does not import the heavier modules.
+        '''
+        check = "import sys; sys.path.append('src'); import bootloader; " +\
+            "print(','.join(sorted(name for name in {} if name in sys.modules)))".format(repr(self.HEAVY_MODULES))
+        output = subprocess.check_output([sys.executable, "-c", check])
+        assert output.decode("utf-8").strip() == ""
@@ -0,0 +1,101 @@
+'''
+This file tests the TablePager class, such that records are shown as a table a page at a time.
+
+sammatime22, 2026
+'''
+import sys
+sys.path.append('src')
+
+import unittest
+from unittest.mock import patch, call
+from display import Display
+from input_machine import InputMachine
+from table_pager import TablePager
+
+
+class TestTablePager(unittest.TestCase):
+    '''
+    A set of tests for the TablePager class.
+
+    Parameters
+    ----------
+    unittest.TestCase : from unittest dependency
+        Provides the Unit Test functionality for the class
+    '''
+
+
+    # A mock Display object for test
+    test_whisk_display = Display()
+
+
+    # A mock Input Machine for test
+    test_input_machine = InputMachine()
+
+
+    def test_01_format_page(self):
+        '''
+        Tests that a page is aligned to its widest values, with long values cut down.
+        '''
+        pager = TablePager(column_width = 8)
+        header, rule, rows = pager.format_page([{"id": 1, "flavor": "Mint"}, {"id": 22, "flavor": "Death by Chocolate",\
+                                                "price": None}, [1, 2]])
+        assert header == "id | flavor   | price | value"
+        assert rule == "---+----------+-------+-------"
+        assert rows == ["1  | Mint     |       |",\
+                        "22 | Death... |       |",\
+                        "   |          |       | [1, 2]"]
+
+
+    def test_02_page(self):
+        '''
+        Tests that pages are shown until the user stops, reading records only as each page is shown.
+        '''
+        read = []
+
+        def records():
+            for index in range(100):
+                read.append(index)
+                yield {"id": index}
+
+        with patch('display.Display.print_general') as mock_print_general:
+            with patch('display.Display.print_success') as mock_print_success:
+                with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+                    mock_gather_input.side_effect = ["", "q"]
+                    shown = TablePager(10).page(self.test_whisk_display, self.test_input_machine, records())
+
+                    assert shown == 20
+                    assert len(read) == 21
+                    assert len(mock_gather_input.mock_calls) == 2
+                    assert len(mock_print_success.mock_calls) == 20
+                    assert mock_print_success.mock_calls[-1] == call("19")
+
+
+    def test_03_page_end(self):
+        '''
+        Tests that no prompt is given once the records run out, or the row limit is reached.
+        '''
+        with patch('display.Display.print_general'):
+            with patch('display.Display.print_success') as mock_print_success:
+                with patch('input_machine.InputMachine.gather_input') as mock_gather_input:
+                    mock_gather_input.return_value = ""
+                    assert TablePager(5).page(self.test_whisk_display, self.test_input_machine, iter(range(10))) == 10
+                    assert len(mock_gather_input.mock_calls) == 1
+
+                    assert TablePager(5, row_limit = 7).page(self.test_whisk_display, self.test_input_machine,\
+                                                             iter(range(10))) == 7
+                    assert len(mock_gather_input.mock_calls) == 2
+                    assert TablePager(5).page(self.test_whisk_display, self.test_input_machine, iter([])) == 0
+                    assert len(mock_print_success.mock_calls) == 17
+
+
+    def test_04_settings_validated(self):
+        '''
+        Tests that a page size, column width, or row limit which could not show anything is refused.
+        '''
+        with self.assertRaises(ValueError):
+            TablePager(0)
+        with self.assertRaises(ValueError):
+            TablePager(column_width = 3)
+        with self.assertRaises(ValueError):
+            TablePager(row_limit = 0)
+        assert TablePager(row_limit = 1).row_limit == 1
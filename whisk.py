@@ -10,4 +10,4 @@ from bootloader import kickstart
 
 # Kickstart the application.
 if __name__ == "__main__":
-    kickstart(sys.argv)
+    sys.exit(kickstart(sys.argv))